@@ -1,7 +1,35 @@
 import os
 from celery import Celery
+from celery.signals import task_prerun, task_postrun
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "airline.settings")
 app = Celery("airline")
 app.config_from_object("django.conf:settings", namespace="CELERY")
-app.autodiscover_tasks()
\ No newline at end of file
+app.autodiscover_tasks()
+
+
+# request döngüsü dışında Django bağlantıları kendiliğinden kapanmaz / havuza dönmez.
+# task başında bozuk ya da süresi dolmuş bağlantı atılır, sonunda CONN_MAX_AGE'e göre
+# kapatılır veya (pool modunda) havuza geri verilir.
+# Okuma replica'sı da task başına bir kez seçilir (bkz. apps.common.db.read_scope).
+_read_scopes = {}
+
+
+@task_prerun.connect
+def _close_old_connections_before_task(task_id=None, **kwargs):
+    from django.db import close_old_connections
+    from apps.common.db import read_scope
+    close_old_connections()
+
+    scope = read_scope()
+    scope.__enter__()
+    _read_scopes[task_id] = scope
+
+
+@task_postrun.connect
+def _close_old_connections_after_task(task_id=None, **kwargs):
+    from django.db import close_old_connections
+    scope = _read_scopes.pop(task_id, None)
+    if scope is not None:
+        scope.__exit__(None, None, None)
+    close_old_connections()
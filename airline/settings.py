@@ -22,6 +22,10 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = 'django-insecure-(yuxl8%p0ulc!k!+0p&m#65e-ams+ca99b&qq%4_r@45hx$6_h'
 
+# rezervasyon kodu permütasyon anahtarı. verilen kodlar bununla üretildiği için
+# canlıya çıktıktan sonra DEĞİŞTİRİLMEMELİ, yoksa eski kodlarla çakışma olabilir.
+RESERVATION_CODE_KEY = 'airline-reservation-code-v1'
+
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
 
@@ -31,6 +35,29 @@ ALLOWED_HOSTS = ["127.0.0.1", "localhost"]
 CELERY_BROKER_URL = "redis://localhost:6379/0"
 CELERY_RESULT_BACKEND = "redis://localhost:6379/1"
 
+# seat hold (ödeme sırasında koltuk tutma). testler için SEAT_HOLD_BACKEND = "local"
+SEAT_HOLD_BACKEND = "redis"
+SEAT_HOLD_REDIS_URL = "redis://localhost:6379/2"
+SEAT_HOLD_TTL_SECONDS = 600
+SEAT_HOLD_REDIS_TIMEOUT = 0.5
+# Redis'e ulaşılamazsa hold'suz rezervasyonlar hold'ları yok sayarak devam eder (False: 503).
+SEAT_HOLD_FAIL_OPEN = True
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://localhost:6379/3",
+    }
+}
+
+# Idempotency-Key: cevap saklama süresi, işlenen isteğin kilidi ve eşzamanlı tekrarın bekleme süresi.
+IDEMPOTENCY_TTL_SECONDS = 24 * 60 * 60
+IDEMPOTENCY_LOCK_SECONDS = 30
+IDEMPOTENCY_WAIT_SECONDS = 10
+
+# GET list/retrieve byte cache'i; geçersiz kılma sürüm sayaçlarıyla, TTL sadece üst sınır.
+RESPONSE_CACHE_TTL_SECONDS = 300
+
 # dev için konsola bastık.
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 DEFAULT_FROM_EMAIL = "kadir@aydogan.com"
@@ -44,6 +71,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'apps.core',
     'apps.notifications',
     'apps.common',
@@ -55,6 +83,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apps.common.db.ReadYourWritesMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -92,6 +121,7 @@ REST_FRAMEWORK = {
 WSGI_APPLICATION = 'airline.wsgi.application'
 
 import environ, os
+from django.core.exceptions import ImproperlyConfigured
 env = environ.Env()
 environ.Env.read_env(os.path.join(BASE_DIR, ".env"))
 
@@ -106,6 +136,55 @@ DATABASES = {
     }
 }
 
+# bağlantı yönetimi (DB_POOL_MODE):
+# - persistent: worker başına kalıcı bağlantı (CONN_MAX_AGE), her istek başında health check.
+# - pool: psycopg_pool ile process içi havuz (psycopg[pool] gerekir). CONN_MAX_AGE 0 olmalı.
+# - pgbouncer: transaction pooling arkasında. Server-side cursor ve prepared statement kapalı;
+#   bir transaction bittiğinde fiziksel bağlantı başka bir client'a geçebilir.
+DB_POOL_MODES = ("persistent", "pool", "pgbouncer")
+DB_POOL_MODE = env("DB_POOL_MODE", default="persistent")
+if DB_POOL_MODE not in DB_POOL_MODES:
+    raise ImproperlyConfigured(f"DB_POOL_MODE must be one of {DB_POOL_MODES}.")
+
+# pool modunda check_connection, diğerlerinde istek başında SELECT 1.
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+if DB_POOL_MODE == "pool":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": env.int("DB_POOL_MIN_SIZE", default=2),
+            "max_size": env.int("DB_POOL_MAX_SIZE", default=10),
+            # havuz doluysa en fazla bu kadar saniye beklenir, sonra PoolTimeout.
+            "timeout": env.float("DB_POOL_TIMEOUT", default=10),
+            "max_idle": env.float("DB_POOL_MAX_IDLE", default=300),
+            "max_lifetime": env.float("DB_POOL_MAX_LIFETIME", default=1800),
+        },
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = env.int("DB_CONN_MAX_AGE", default=60)
+    # pgbouncer'da iterator() named cursor'ı sonraki transaction'da başka bir backend'e düşer.
+    DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = DB_POOL_MODE == "pgbouncer"
+
+# okuma replica'ları: DB_REPLICA_HOSTS=host1:5432,host2:5433
+# tek veritabanıyla denemek için primary'nin kendisi de verilebilir (DB_REPLICA_HOSTS=localhost).
+REPLICA_DATABASES = []
+for i, replica in enumerate(env.list("DB_REPLICA_HOSTS", default=[]), start=1):
+    host, _, port = replica.partition(":")
+    alias = f"replica_{i}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port or DATABASES["default"]["PORT"],
+        # testlerde ayrı test veritabanı kurulmaz, default'un aynası olur.
+        "TEST": {"MIRROR": "default"},
+    }
+    REPLICA_DATABASES.append(alias)
+
+DATABASE_ROUTERS = ["apps.common.db.ReplicaRouter"]
+
+# yazmadan sonra istemcinin okumaları bu kadar saniye primary'de kalır (replica gecikmesine göre).
+READ_YOUR_WRITES_SECONDS = 5
+
 RESERVATION_BOOKED_HANDLERS = [
     "apps.notifications.tasks.send_reservation_email_task",
 ]
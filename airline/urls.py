@@ -22,6 +22,10 @@ urlpatterns = [
 
     path("api/", include("apps.core.api.airplanes.urls")),
     path("api/", include("apps.core.api.flight.urls")),
+    path("api/", include("apps.core.api.schedule.urls")),
 
     path("api/", include("apps.core.api.reservation.urls")),
+    path("api/", include("apps.core.api.hold.urls")),
+    path("api/", include("apps.core.api.waitlist.urls")),
+    path("api/", include("apps.core.api.internal.urls")),
 ]
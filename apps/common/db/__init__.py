@@ -0,0 +1,3 @@
+from .routing import ReplicaRouter, ReadYourWritesMiddleware, use_primary, read_scope
+from .pool import pool_stats, check_connections
+__all__ = ["ReplicaRouter", "ReadYourWritesMiddleware", "use_primary", "read_scope", "pool_stats", "check_connections"]
@@ -0,0 +1,58 @@
+import time
+
+from django.conf import settings
+from django.db import connections
+
+# psycopg_pool.get_stats() anahtarlarından izlenenler; olmayanlar 0 döner.
+POOL_STAT_KEYS = (
+    "pool_min", "pool_max", "pool_size", "pool_available",
+    "requests_waiting", "requests_num", "requests_queued", "requests_wait_ms", "requests_errors",
+    "connections_num", "connections_ms", "connections_errors", "connections_lost",
+)
+
+
+def pool_stats(*, reset: bool = False) -> dict:
+    """
+    Alias bazında bağlantı durumu. pool modunda psycopg havuzunun sayaçları
+    (requests_wait_ms: boş bağlantı yokken kuyrukta beklenen toplam süre), diğer modlarda sadece ayarlar.
+    Sayaçlar process içidir; reset=True bir sonraki okumaya kadar sıfırlar.
+    """
+    out = {}
+    for alias in connections:
+        conn = connections[alias]
+        entry = {
+            "mode": getattr(settings, "DB_POOL_MODE", "persistent"),
+            "conn_max_age": conn.settings_dict.get("CONN_MAX_AGE"),
+            "health_checks": conn.settings_dict.get("CONN_HEALTH_CHECKS"),
+            "server_side_cursors": not conn.settings_dict.get("DISABLE_SERVER_SIDE_CURSORS"),
+            "pool": None,
+        }
+
+        pool = getattr(conn, "pool", None)
+        if pool is not None:
+            raw = pool.pop_stats() if reset else pool.get_stats()
+            stats = {key: raw.get(key, 0) for key in POOL_STAT_KEYS}
+            queued = stats["requests_queued"]
+            stats["avg_queued_wait_ms"] = round(stats["requests_wait_ms"] / queued, 3) if queued else 0.0
+            entry["pool"] = stats
+
+        out[alias] = entry
+    return out
+
+
+def check_connections() -> dict:
+    """
+    Her alias için bir bağlantı alıp SELECT 1 çalıştırır (pool modunda havuzdan alıp geri verir).
+    """
+    out = {}
+    for alias in connections:
+        conn = connections[alias]
+        start = time.perf_counter()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            ok, error = True, None
+        except Exception as exc:
+            ok, error = False, str(exc)
+        out[alias] = {"ok": ok, "ms": round((time.perf_counter() - start) * 1000, 3), "error": error}
+    return out
@@ -0,0 +1,135 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PRIMARY_COOKIE = "primary_until"
+
+# True iken bu context'teki (request / task) tüm okumalar primary'ye gider.
+_pinned: ContextVar[bool] = ContextVar("db_pinned_to_primary", default=False)
+# bu context için bir kez seçilen replica. Aynı cevabın sorguları (ETag aggregate'i, COUNT, sayfa)
+# farklı gecikmedeki replica'lara dağılmaz; tek replica'da zaman sadece ileri gider, ETag gövdeden
+# önce hesaplandığı için gövde hiçbir zaman ETag'inden eski olmaz.
+_replica: ContextVar[Optional[str]] = ContextVar("db_read_replica", default=None)
+
+
+def replica_aliases() -> list[str]:
+    return list(getattr(settings, "REPLICA_DATABASES", []))
+
+
+def read_your_writes_seconds() -> int:
+    return getattr(settings, "READ_YOUR_WRITES_SECONDS", 5)
+
+
+@contextmanager
+def use_primary():
+    token = _pinned.set(True)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+@contextmanager
+def read_scope():
+    """
+    Request / task başında replica'yı bir kez seçer; scope içindeki tüm okumalar onu kullanır.
+    """
+    replicas = replica_aliases()
+    token = _replica.set(random.choice(replicas) if replicas else None)
+    try:
+        yield
+    finally:
+        _replica.reset(token)
+
+
+class ReplicaRouter:
+    """
+    Yazmalar ve transaction içindeki her şey (select_for_update, servislerdeki kontroller) primary'ye,
+    geri kalan okumalar (selector'lar, list/retrieve) read_scope'un seçtiği replica'ya gider.
+    Scope dışında (shell, script) her okuma rastgele bir replica seçer.
+    Replica tanımlı değilse her şey default'ta kalır.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = replica_aliases()
+        if not replicas or _pinned.get():
+            return DEFAULT_DB_ALIAS
+
+        # @transaction.atomic servisler: okuma ile yazma aynı snapshot'ta olmalı.
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+
+        return _replica.get() or random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica'lar primary'nin kopyası, aynı veri.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReadYourWritesMiddleware:
+    """
+    Yazma istekleri tamamen primary'de çalışır. Başarılı bir yazmadan sonra istemciye
+    READ_YOUR_WRITES_SECONDS süreli bir cookie verilir; bu süre içinde okumaları da primary'den
+    yapılır, böylece replica gecikmesi yüzünden kendi yazdığını göremez durumu olmaz.
+    Hem sync hem async çalışır; ASGI altında async view'lar thread'e düşmez.
+    """
+    sync_capable = True
+    async_capable = True
+    write_methods = {"POST", "PUT", "PATCH", "DELETE"}
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        if not replica_aliases():
+            return self.get_response(request)
+
+        with self._scope(request):
+            response = self.get_response(request)
+        return self._remember_write(request, response)
+
+    async def __acall__(self, request):
+        if not replica_aliases():
+            return await self.get_response(request)
+
+        # ContextVar, sync_to_async ile ORM thread'ine de taşınır.
+        with self._scope(request):
+            response = await self.get_response(request)
+        return self._remember_write(request, response)
+
+    def _scope(self, request):
+        if request.method in self.write_methods or self._sticky(request):
+            return use_primary()
+        return read_scope()
+
+    def _remember_write(self, request, response):
+        if request.method in self.write_methods and response.status_code < 400:
+            window = read_your_writes_seconds()
+            response.set_cookie(PRIMARY_COOKIE, str(int(time.time()) + window), max_age=window,
+                                httponly=True, samesite="Lax")
+        return response
+
+    @staticmethod
+    def _sticky(request) -> bool:
+        try:
+            return int(request.COOKIES.get(PRIMARY_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
@@ -1,3 +1,10 @@
 from .exception_renderer import base_response_exception_handler
 from .base_renderer import BaseResponseJSONRenderer
-__all__ = ["base_response_exception_handler", "BaseResponseJSONRenderer"]
\ No newline at end of file
+from .idempotency import IdempotencyMixin
+from .projection import ValuesProjection, ProjectedListMixin
+from .response_cache import ResponseCacheMixin, bump_cache_version
+from .conditional import ConditionalGetMixin
+from .async_read import AsyncReadView
+__all__ = ["base_response_exception_handler", "BaseResponseJSONRenderer", "IdempotencyMixin",
+           "ValuesProjection", "ProjectedListMixin", "ResponseCacheMixin", "bump_cache_version", "ConditionalGetMixin",
+           "AsyncReadView"]
\ No newline at end of file
@@ -0,0 +1,124 @@
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpResponse
+from django.views import View
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .base_renderer import BaseResponseJSONRenderer
+from .exception_renderer import base_response_exception_handler
+from .projection import ValuesProjection
+
+
+class AsyncReadView(View):
+    """
+    ASGI altında thread tutmayan, native async GET list/retrieve.
+    DRF view'ları sync olduğu için bu view düz Django View'dır; query doğrulama, values() projeksiyonu,
+    envelope ve hata formatı senkron endpoint'lerle aynıdır (list: count/next/previous/results).
+
+    Selector'lar async ORM (aiterator, aget, acount) kullanır:
+        list_selector(offset=, limit=, columns=, **filters) -> list[dict]
+        count_selector(**filters) -> int
+        get_selector(**{lookup_kwarg: pk}) -> instance
+    """
+    http_method_names = ["get", "head", "options"]
+
+    query_serializer_class = None
+    read_serializer_class = None
+    list_projection: ValuesProjection = None
+
+    list_selector = None
+    count_selector = None
+    get_selector = None
+    lookup_kwarg = "id"
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    page_query_param = "page"
+    max_page_size = 50
+
+    renderer = BaseResponseJSONRenderer()
+
+    async def get(self, request, pk=None):
+        try:
+            data = await (self.list(request) if pk is None else self.retrieve(request, pk))
+        except Exception as exc:
+            return self._error(exc)
+        return self._render(data, status=200)
+
+    async def list(self, request) -> dict:
+        filters = {}
+        if self.query_serializer_class is not None:
+            qp = self.query_serializer_class(data=request.GET)
+            qp.is_valid(raise_exception=True)
+            filters = qp.validated_data
+
+        page_size = self._page_size(request)
+        page = self._page_number(request)
+
+        count = await self.count_selector(**filters)
+        pages = max(1, -(-count // page_size))
+        if page > pages:
+            raise NotFound("Invalid page.")
+
+        rows = await self.list_selector(
+            offset=(page - 1) * page_size,
+            limit=page_size,
+            columns=self.list_projection.columns,
+            **filters,
+        )
+
+        url = request.build_absolute_uri()
+        return {
+            "count": count,
+            "next": replace_query_param(url, self.page_query_param, page + 1) if page < pages else None,
+            "previous": self._previous_link(url, page),
+            "results": self.list_projection.to_representation(rows),
+        }
+
+    async def retrieve(self, request, pk) -> dict:
+        try:
+            obj = await self.get_selector(**{self.lookup_kwarg: pk})
+        except ObjectDoesNotExist:
+            raise NotFound("No object matches the given query.")
+        return self.read_serializer_class(obj).data
+
+    # --- yardımcılar ---
+
+    def _page_size(self, request) -> int:
+        raw = request.GET.get(self.page_size_query_param)
+        if not raw:
+            return self.page_size
+        try:
+            size = int(raw)
+        except ValueError:
+            raise ValidationError({self.page_size_query_param: "Must be an integer."})
+        return max(1, min(size, self.max_page_size))
+
+    def _page_number(self, request) -> int:
+        raw = request.GET.get(self.page_query_param) or 1
+        try:
+            page = int(raw)
+        except ValueError:
+            raise NotFound("Invalid page.")
+        if page < 1:
+            raise NotFound("Invalid page.")
+        return page
+
+    def _previous_link(self, url: str, page: int):
+        if page <= 1:
+            return None
+        if page == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, page - 1)
+
+    def _render(self, data, *, status: int) -> HttpResponse:
+        response = HttpResponse(self.renderer.render(data), status=status, content_type=self.renderer.media_type)
+        response["X-Base-Response"] = "1"
+        return response
+
+    def _error(self, exc) -> HttpResponse:
+        resp = base_response_exception_handler(exc, {"view": self, "request": self.request})
+        response = self._render(resp.data, status=resp.status_code)
+        for header, value in resp.headers.items():
+            response.setdefault(header, value)
+        return response
@@ -1,4 +1,30 @@
 from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson yoksa stdlib json ile aynı çıktı, sadece daha yavaş.
+    orjson = None
+
+ENVELOPE_KEYS = {"status", "message", "data"}
+
+# {"status":true,"message":null,"data":<payload>} : payload'ın etrafına hazır byte'lar eklenir,
+# her response için sarmalayıcı dict kurulmaz ve tekrar encode edilmez.
+ENVELOPE_PREFIX = b'{"status":true,"message":null,"data":'
+ENVELOPE_SUFFIX = b"}"
+EMPTY_ENVELOPE = ENVELOPE_PREFIX + b"null" + ENVELOPE_SUFFIX
+
+_fallback_encoder = JSONEncoder()
+
+
+def _default(obj):
+    # orjson'ın bilmediği tipler (Decimal, UUID, lazy str, QuerySet, timedelta...) DRF'teki gibi.
+    return _fallback_encoder.default(obj)
+
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
 
 class BaseResponseJSONRenderer(JSONRenderer):
     """
@@ -12,11 +38,17 @@ class BaseResponseJSONRenderer(JSONRenderer):
     İstisnalar:
     - Zaten {status, message, data} şeklindeyse dokunma.
     - bytes/str gibi ham tipleri sarmamaya çalış (file, csv vb. için).
+
+    orjson kuruluysa encode orjson ile yapılır (datetime native, Decimal DRF encoder'ına düşer).
     """
+    def encode(self, data) -> bytes:
+        if orjson is None:
+            return super().render(data)
+        return orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+
     def render(self, data, accepted_media_type=None, renderer_context=None):
         # Exception durumlarında bizim exception handler zaten saracak.
         resp = renderer_context.get("response") if renderer_context else None
-        request = renderer_context.get("request") if renderer_context else None
 
         # bypass header (isteğe bağlı)
         # if request and request.headers.get("X-Bypass-Base-Response") == "1":
@@ -26,21 +58,25 @@ class BaseResponseJSONRenderer(JSONRenderer):
         if resp is not None:
             resp["X-Base-Response"] = "1"
 
+        # girintili (browsable / ?indent) çıktı istenirse yavaş yol.
+        if self.get_indent(accepted_media_type or "", renderer_context or {}):
+            return self._render_indented(data, accepted_media_type, renderer_context)
+
         if data is None:
-            wrapped = {"status": True, "message": None, "data": None}
-            return super().render(wrapped, accepted_media_type, renderer_context)
+            return EMPTY_ENVELOPE
 
-        # halihazırda sarılıysa dokunma
-        if isinstance(data, dict) and {"status", "message", "data"}.issubset(set(data.keys())):
-            return super().render(data, accepted_media_type, renderer_context)
+        # halihazırda sarılıysa dokunma (exception handler çıktısı da buradan geçer)
+        if isinstance(data, dict) and data.keys() >= ENVELOPE_KEYS:
+            return self.encode(data)
 
         # bytes/str gibi tipler: dokunma
         if isinstance(data, (bytes, str)):
             return super().render(data, accepted_media_type, renderer_context)
 
-        wrapped = {
-            "status": True,
-            "message": None,
-            "data": data,
-        }
-        return super().render(wrapped, accepted_media_type, renderer_context)
\ No newline at end of file
+        return ENVELOPE_PREFIX + self.encode(data) + ENVELOPE_SUFFIX
+
+    def _render_indented(self, data, accepted_media_type, renderer_context):
+        if data is None or not (isinstance(data, (bytes, str)) or
+                                (isinstance(data, dict) and data.keys() >= ENVELOPE_KEYS)):
+            data = {"status": True, "message": None, "data": data}
+        return super().render(data, accepted_media_type, renderer_context)
@@ -0,0 +1,61 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def _etag(*parts) -> str:
+    return quote_etag(hashlib.sha1(":".join(str(p) for p in parts).encode()).hexdigest())
+
+
+class ConditionalGetMixin:
+    """
+    list/retrieve için ETag + Last-Modified; If-None-Match / If-Modified-Since eşleşirse
+    serializer hiç çalışmadan 304 döner.
+
+    - list: filtrelenmiş queryset üzerinde tek sorgu MAX(updated_at), COUNT(*).
+      Satır eklenir/güncellenirse MAX, filtreden çıkarsa COUNT değişir. Sadece ETag gönderilir:
+      filtreden çıkan (silinen) satır MAX'ı ilerletmez, Last-Modified ile 304 yanlış olurdu.
+    - retrieve: tek satırın conditional_retrieve_fields kolonları (ör. nested flight'ın updated_at'i).
+    """
+    conditional_list_field = "updated_at"
+    conditional_retrieve_fields = ("updated_at",)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        state = queryset.order_by().aggregate(last=Max(self.conditional_list_field), total=Count("pk"))
+
+        etag = _etag(request.get_full_path(), state["last"], state["total"])
+        return self._conditional(request, etag, None, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        row = (queryset
+               .filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+               .values_list(*self.conditional_retrieve_fields)
+               .first())
+
+        if row is None:
+            # 404'ü normal yol üretsin.
+            return super().retrieve(request, *args, **kwargs)
+
+        stamps = [v for v in row if v is not None]
+        etag = _etag(request.path, *row)
+        return self._conditional(request, etag, max(stamps) if stamps else None, super().retrieve, *args, **kwargs)
+
+    @staticmethod
+    def _conditional(request, etag, last_modified, handler, *args, **kwargs):
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        not_modified = get_conditional_response(request._request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            return not_modified
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            response["ETag"] = etag
+            if timestamp is not None:
+                response["Last-Modified"] = http_date(timestamp)
+        return response
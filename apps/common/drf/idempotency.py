@@ -0,0 +1,95 @@
+import hashlib
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse, JsonResponse
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAY_HEADER = "Idempotent-Replayed"
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def _error(detail: str, status: int) -> JsonResponse:
+    return JsonResponse({"status": False, "message": {"detail": detail}, "data": None}, status=status,
+                        json_dumps_params={"separators": (",", ":")})
+
+
+class IdempotencyMixin:
+    """
+    Yazma isteklerinde Idempotency-Key header'ı desteği.
+
+    - İlk cevap (5xx hariç) render edilmiş byte'larıyla cache'e yazılır, tekrar gelen istek
+      aynı byte'ları alır; servis katmanı (lock, insert, email) tekrar çalışmaz.
+    - Aynı key ile eşzamanlı gelen ikinci istek, ilk isteğin bitmesini bekler ve onun cevabını döner.
+    - Aynı key farklı bir body ile gelirse 422.
+    """
+    idempotency_cache_alias = "default"
+
+    def _idempotency_settings(self):
+        return (
+            getattr(settings, "IDEMPOTENCY_TTL_SECONDS", 24 * 60 * 60),
+            getattr(settings, "IDEMPOTENCY_LOCK_SECONDS", 30),
+            getattr(settings, "IDEMPOTENCY_WAIT_SECONDS", 10),
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if request.method not in WRITE_METHODS or not key:
+            return super().dispatch(request, *args, **kwargs)
+
+        if len(key) > 255:
+            return _error("Idempotency-Key is too long.", 400)
+
+        cache = caches[self.idempotency_cache_alias]
+        ttl, lock_ttl, wait = self._idempotency_settings()
+
+        scope = hashlib.sha256(f"{request.method}:{request.path}:{key}".encode()).hexdigest()
+        result_key = f"idem:{scope}:result"
+        lock_key = f"idem:{scope}:lock"
+        fingerprint = hashlib.sha256(request.body).hexdigest()
+
+        cached = cache.get(result_key)
+        if cached is not None:
+            return self._replay(cached, fingerprint)
+
+        token = uuid.uuid4().hex
+        if not cache.add(lock_key, token, timeout=lock_ttl):
+            # aynı key ile başka bir istek işleniyor: sonucunu bekle.
+            deadline = time.monotonic() + wait
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                cached = cache.get(result_key)
+                if cached is not None:
+                    return self._replay(cached, fingerprint)
+                if cache.get(lock_key) is None:
+                    break
+            return _error("A request with this Idempotency-Key is still in progress.", 409)
+
+        try:
+            response = super().dispatch(request, *args, **kwargs)
+            if hasattr(response, "render") and not getattr(response, "is_rendered", True):
+                response.render()
+
+            if response.status_code < 500 and not response.streaming:
+                cache.set(result_key, {
+                    "fingerprint": fingerprint,
+                    "status": response.status_code,
+                    "content": response.content,
+                    "headers": dict(response.items()),
+                }, timeout=ttl)
+            return response
+        finally:
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+
+    def _replay(self, stored: dict, fingerprint: str) -> HttpResponse:
+        if stored["fingerprint"] != fingerprint:
+            return _error("Idempotency-Key was already used with a different request body.", 422)
+
+        response = HttpResponse(stored["content"], status=stored["status"])
+        for header, value in stored["headers"].items():
+            response[header] = value
+        response[REPLAY_HEADER] = "true"
+        return response
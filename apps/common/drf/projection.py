@@ -0,0 +1,90 @@
+from functools import cached_property
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+from rest_framework.response import Response
+
+# DB sürücüsü bu alanlar için zaten doğru Python tipini döner; to_representation çağrısına gerek yok.
+IDENTITY_FIELDS = (serializers.CharField, serializers.EmailField, serializers.IntegerField, serializers.BooleanField)
+
+
+class ValuesProjection:
+    """
+    Bir read serializer'ından türetilen hızlı okuma yolu: model instance'ı kurulmaz,
+    sadece serializer'ın ihtiyaç duyduğu kolonlar values() ile okunur ve her kolon
+    serializer alanının kendi to_representation'ı ile çevrilir (çıktı birebir aynı).
+
+    - source="airplane.id" gibi FK id'leri JOIN'siz "airplane_id" kolonuna iner.
+    - PrimaryKeyRelatedField zaten FK kolonunun değerini döner.
+    - SerializerMethodField / nested serializer desteklenmez.
+    """
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+
+    @cached_property
+    def _mappers(self) -> list[tuple[str, str, object]]:
+        mappers = []
+        for name, field in self.serializer_class().fields.items():
+            if field.write_only:
+                continue
+
+            if isinstance(field, (serializers.SerializerMethodField, serializers.BaseSerializer)) \
+                    or field.source == "*":
+                raise ImproperlyConfigured(f"{self.serializer_class.__name__}.{name} cannot be projected.")
+
+            attrs = field.source_attrs
+            if isinstance(field, serializers.PrimaryKeyRelatedField) and len(attrs) == 1:
+                path, convert = f"{attrs[0]}_id", None
+            elif len(attrs) == 2 and attrs[1] in ("id", "pk"):
+                path, convert = f"{attrs[0]}_id", None
+            else:
+                path = "__".join(attrs)
+                convert = None if type(field) in IDENTITY_FIELDS else field.to_representation
+
+            mappers.append((name, path, convert))
+        return mappers
+
+    @cached_property
+    def columns(self) -> tuple[str, ...]:
+        return tuple(dict.fromkeys(path for _, path, _ in self._mappers))
+
+    def values(self, queryset):
+        # keyset pagination'ın sıralama anahtarları da satırda olmalı.
+        opts = queryset.model._meta
+        ordering = [o.lstrip("-") for o in (queryset.query.order_by or opts.ordering) if isinstance(o, str)]
+        fields = {f.name: f.attname for f in opts.concrete_fields}
+        # annotation'lar (ör. arama skoru) değer olarak gerekmez, sıralamada kalır.
+        keys = [opts.pk.attname if o == "pk" else fields[o] for o in ordering if o == "pk" or o in fields]
+        extra = [k for k in (*keys, opts.pk.attname) if k not in self.columns]
+        return queryset.values(*self.columns, *dict.fromkeys(extra))
+
+    def to_representation(self, rows) -> list[dict]:
+        mappers = self._mappers
+        out = []
+        for row in rows:
+            item = {}
+            for name, path, convert in mappers:
+                value = row[path]
+                item[name] = convert(value) if convert is not None and value is not None else value
+            out.append(item)
+        return out
+
+
+class ProjectedListMixin:
+    """
+    list action'ını ValuesProjection ile çalıştırır; pagination ve envelope aynı kalır.
+    """
+    list_projection: ValuesProjection = None
+
+    def list(self, request, *args, **kwargs):
+        if self.list_projection is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.list_projection.values(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.list_projection.to_representation(page))
+
+        return Response(self.list_projection.to_representation(queryset))
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+
+CACHE_HEADER = "X-Response-Cache"
+VERSION_KEY = "respcache:v:{}"
+BUMPED_AT_KEY = "respcache:t:{}"
+
+AIRPLANE = "airplane"
+FLIGHT = "flight"
+RESERVATION = "reservation"
+
+
+def _cache():
+    return caches[getattr(settings, "RESPONSE_CACHE_ALIAS", "default")]
+
+
+def bump_cache_version(*entities: str) -> None:
+    """
+    Yazma servisleri çağırır. Commit sonrası entity sayacı artar; o entity'ye bağlı
+    tüm cache key'leri kendiliğinden geçersiz olur (key taraması / silme yok).
+    """
+    def _bump():
+        cache = _cache()
+        for entity in entities:
+            key = VERSION_KEY.format(entity)
+            cache.add(key, 0, timeout=None)
+            try:
+                cache.incr(key)
+            except ValueError:
+                # add ile incr arasında key düştüyse (eviction) baştan başlat.
+                cache.set(key, 1, timeout=None)
+        # replica'lar bu yazmayı henüz görmemiş olabilir, bkz. _replica_may_lag.
+        cache.set_many({BUMPED_AT_KEY.format(e): time.time() for e in entities},
+                       timeout=getattr(settings, "READ_YOUR_WRITES_SECONDS", 5))
+
+    transaction.on_commit(_bump)
+
+
+class ResponseCacheMixin:
+    """
+    GET list/retrieve cevaplarını render edilmiş byte'larıyla cache'ler.
+
+    Key: action + path + normalize edilmiş (validate edilmiş) query parametreleri + ilgili entity sürümleri.
+    Sürümler view çalışmadan önce okunur; eşzamanlı bir yazma, eski veriyi sadece eski
+    sürümün key'ine yazabilir, o key'e de bir daha bakılmaz.
+
+    Lookup DRF'in authentication / permission / throttle kontrollerinden sonra yapılır. Key kullanıcıyı
+    içermez: cevabı kullanıcıya göre değişen view'larda açılmamalı.
+
+    response_cache_entities: {"list": (FLIGHT,), "retrieve": (FLIGHT,)}
+    response_cache_query_serializers: {"list": FlightsQuerySerializer}
+    """
+    response_cache_entities: dict = {}
+    response_cache_query_serializers: dict = {}
+
+    def _response_cache_ttl(self) -> int:
+        return getattr(settings, "RESPONSE_CACHE_TTL_SECONDS", 300)
+
+    @staticmethod
+    def _replica_may_lag(entities) -> bool:
+        # Yazmadan hemen sonra replica'dan okunan eski veri yeni sürümün key'ine yazılmasın.
+        if not getattr(settings, "REPLICA_DATABASES", None):
+            return False
+        return bool(_cache().get_many([BUMPED_AT_KEY.format(e) for e in entities]))
+
+    def _response_cache_key(self, request, action: str, entities) -> str:
+        params = dict(request.GET.lists())
+
+        serializer_class = self.response_cache_query_serializers.get(action)
+        if serializer_class is not None:
+            qp = serializer_class(data=request.GET)
+            if not qp.is_valid():
+                # hatalı istekler cache'lenmez, view 400 dönsün.
+                return None
+            for name in qp.fields:
+                params.pop(name, None)
+            params["_validated"] = sorted((k, str(v)) for k, v in qp.validated_data.items())
+
+        cache = _cache()
+        versions = cache.get_many([VERSION_KEY.format(e) for e in entities])
+        normalized = json.dumps({
+            "action": action,
+            "host": request.get_host(),
+            "path": request.path,
+            "params": sorted((k, v) for k, v in params.items()),
+            "versions": [versions.get(VERSION_KEY.format(e), 0) for e in entities],
+        }, sort_keys=True, default=str)
+
+        return f"respcache:{type(self).__name__}:{hashlib.sha256(normalized.encode()).hexdigest()}"
+
+    # DRF initial() (authentication, permission, throttle) list/retrieve'dan önce çalışır;
+    # cache'e bakmak da burada, yani kontrollerden sonra yapılır.
+    def list(self, request, *args, **kwargs):
+        return self._cached(request, "list", super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached(request, "retrieve", super().retrieve, *args, **kwargs)
+
+    def _cached(self, request, action: str, handler, *args, **kwargs):
+        entities = self.response_cache_entities.get(action)
+        key = self._response_cache_key(request, action, entities) if entities else None
+        if key is None:
+            return handler(request, *args, **kwargs)
+
+        stored = _cache().get(key)
+        if stored is not None:
+            response = HttpResponse(stored["content"], status=stored["status"])
+            for header, value in stored["headers"].items():
+                response[header] = value
+            response[CACHE_HEADER] = "hit"
+            # istemcide aynı sürüm varsa DB'ye hiç gitmeden 304.
+            if stored["headers"].get("ETag"):
+                return get_conditional_response(request._request, etag=stored["headers"]["ETag"], response=response)
+            return response
+
+        response = handler(request, *args, **kwargs)
+        # render finalize_response'ta renderer seçildikten sonra yapılabilir.
+        response._response_cache = (key, entities)
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        pending = getattr(response, "_response_cache", None)
+        if pending is None:
+            return response
+
+        key, entities = pending
+        if hasattr(response, "render") and not getattr(response, "is_rendered", True):
+            response.render()
+
+        if response.status_code == 200 and not response.streaming and not self._replica_may_lag(entities):
+            _cache().set(key, {
+                "status": response.status_code,
+                "content": response.content,
+                "headers": dict(response.items()),
+            }, timeout=self._response_cache_ttl())
+            response[CACHE_HEADER] = "miss"
+        return response
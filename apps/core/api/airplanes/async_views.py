@@ -0,0 +1,19 @@
+from apps.common.drf import AsyncReadView, ValuesProjection
+from apps.core.api.airplanes.serializers import AirplaneReadSerializer, AirplaneQuerySerializer, \
+    AirplaneDetailSerializer
+from apps.core.selectors.airplane_selector import alist_airplanes, acount_airplanes, aget_airplane
+
+
+class AirplaneAsyncReadView(AsyncReadView):
+    """
+    GET /api/async/airplanes/?model=A320
+    GET /api/async/airplanes/{id}/
+    """
+    query_serializer_class = AirplaneQuerySerializer
+    read_serializer_class = AirplaneDetailSerializer
+    list_projection = ValuesProjection(AirplaneReadSerializer)
+
+    list_selector = staticmethod(alist_airplanes)
+    count_selector = staticmethod(acount_airplanes)
+    get_selector = staticmethod(aget_airplane)
+    lookup_kwarg = "airplane_id"
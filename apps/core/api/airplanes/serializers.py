@@ -104,3 +104,16 @@ class AirplaneDetailSerializer(serializers.ModelSerializer):
             "status",
         )
 
+
+class AirplaneAvailabilityQuerySerializer(serializers.Serializer):
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+    min_capacity = serializers.IntegerField(required=False, min_value=1)
+    model = serializers.CharField(required=False)
+
+    def validate(self, attrs):
+        if timezone.is_naive(attrs["start"]) or timezone.is_naive(attrs["end"]):
+            raise serializers.ValidationError({"start": "Datetime values must be timezone-aware (ex: 2025-09-1T17:00:00+03:00)."})
+        if attrs["end"] <= attrs["start"]:
+            raise serializers.ValidationError({"end": "End must be after start."})
+        return attrs
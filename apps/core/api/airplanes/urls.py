@@ -1,8 +1,14 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
+from apps.core.api.airplanes.async_views import AirplaneAsyncReadView
 from apps.core.api.airplanes.views import AirplaneViewSet
 
 router = DefaultRouter()
 router.register(r"airplanes", AirplaneViewSet, basename="airplanes")
 
-urlpatterns = router.urls
\ No newline at end of file
+# ASGI altında native async okuma yolu (list/retrieve)
+urlpatterns = router.urls + [
+    path("async/airplanes/", AirplaneAsyncReadView.as_view(), name="airplanes-async-list"),
+    path("async/airplanes/<int:pk>/", AirplaneAsyncReadView.as_view(), name="airplanes-async-detail"),
+]
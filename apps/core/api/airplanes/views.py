@@ -4,23 +4,31 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import status
 
-from apps.common.drf import BaseResponseJSONRenderer, base_response_exception_handler
+from apps.common.drf import BaseResponseJSONRenderer, base_response_exception_handler, IdempotencyMixin, \
+    ProjectedListMixin, ValuesProjection, ResponseCacheMixin, ConditionalGetMixin
 from apps.core.api.airplanes.serializers import AirplaneCreateSerializer, AirplaneReadSerializer, \
-    AirplaneQuerySerializer, AirplaneUpdateSerializer, AirplaneDetailSerializer
+    AirplaneQuerySerializer, AirplaneUpdateSerializer, AirplaneDetailSerializer, AirplaneAvailabilityQuerySerializer
 from apps.core.api.flight.serializers import FlightsQuerySerializer, FlightReadSerializer
-from apps.core.api.pagination import DefaultPagination
-from apps.core.models import Airplane
-from apps.core.selectors import list_airplanes
+from apps.common.drf.response_cache import AIRPLANE
+from apps.core.api.pagination import DefaultPagination, KeysetPagination
+from apps.core.models import Airplane, Flight
+from apps.core.selectors import list_airplanes, list_available_airplanes
 from apps.core.selectors.flight_selector import list_flights
 from apps.core.services import *
 from apps.core.services.airplane_services import update_airplane, soft_delete_airplane
 
 
-class AirplaneViewSet(viewsets.ModelViewSet):
+class AirplaneViewSet(IdempotencyMixin, ResponseCacheMixin, ConditionalGetMixin, ProjectedListMixin,
+                      viewsets.ModelViewSet):
     renderer_classes = [BaseResponseJSONRenderer]
 
     permission_classes = [AllowAny]
     pagination_class = DefaultPagination
+    # GET list/retrieve: yazma servislerinin artırdığı sürümlere bağlı byte cache
+    response_cache_entities = {"list": (AIRPLANE,), "retrieve": (AIRPLANE,)}
+    response_cache_query_serializers = {"list": AirplaneQuerySerializer}
+    # list: model instance'sız values() okuma yolu
+    list_projection = ValuesProjection(AirplaneReadSerializer)
 
     filter_backends = []
 
@@ -76,15 +84,43 @@ class AirplaneViewSet(viewsets.ModelViewSet):
         qp = FlightsQuerySerializer(data=request.query_params)
         qp.is_valid(raise_exception=True)
 
-        flights_qs = list_flights(**qp.validated_data, airplane_id=airplane.id)
+        params = {**qp.validated_data, "airplane_id": airplane.id}
+        # keyset için kararlı bir sıralama gerekir; arama skoru yerine kalkış saati.
+        params.setdefault("ordering", "departure_time")
+        # FlightReadSerializer airplane.id okur; satır başına Airplane sorgusu olmasın.
+        flights_qs = list_flights(**params).select_related("airplane")
+
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(flights_qs, request, view=self)
 
         airplane_data = self.get_serializer(airplane).data
-        flights_data = FlightReadSerializer(flights_qs, many=True).data
+        flights_data = FlightReadSerializer(page, many=True).data
+
+        return paginator.get_nested_response(airplane_data, "flights", flights_data)
+
+    @action(detail=False, methods=["get"], url_path="available")
+    def available(self, request):
+        qp = AirplaneAvailabilityQuerySerializer(data=request.query_params)
+        qp.is_valid(raise_exception=True)
+
+        page = self.paginate_queryset(list_available_airplanes(**qp.validated_data))
+
+        # komşu uçuşları tek sorguda çek.
+        flight_ids = {i for a in page for i in (a.previous_flight_id, a.next_flight_id) if i}
+        flights = {f.id: f for f in Flight.objects.select_related("airplane").filter(id__in=flight_ids)}
+
+        def flight_data(flight_id):
+            return FlightReadSerializer(flights[flight_id]).data if flight_id in flights else None
 
-        return Response({
-            **airplane_data,
-            "flights": flights_data
-        })
+        data = [
+            {
+                **AirplaneReadSerializer(a).data,
+                "previous_flight": flight_data(a.previous_flight_id),
+                "next_flight": flight_data(a.next_flight_id),
+            }
+            for a in page
+        ]
+        return self.get_paginated_response(data)
 
     def handle_exception(self, exc):
         resp = base_response_exception_handler(exc, self.get_exception_handler_context())
@@ -0,0 +1,18 @@
+from apps.common.drf import AsyncReadView, ValuesProjection
+from apps.core.api.flight.serializers import FlightReadSerializer, FlightsQuerySerializer
+from apps.core.selectors.flight_selector import alist_flights, acount_flights, aget_flight
+
+
+class FlightAsyncReadView(AsyncReadView):
+    """
+    GET /api/async/flights/?search=IST&page=2
+    GET /api/async/flights/{id}/
+    """
+    query_serializer_class = FlightsQuerySerializer
+    read_serializer_class = FlightReadSerializer
+    list_projection = ValuesProjection(FlightReadSerializer)
+
+    list_selector = staticmethod(alist_flights)
+    count_selector = staticmethod(acount_flights)
+    get_selector = staticmethod(aget_flight)
+    lookup_kwarg = "flight_id"
@@ -4,7 +4,9 @@ from rest_framework.exceptions import ValidationError
 
 from apps.core.api.airplanes.serializers import AirplaneReadSerializer
 from apps.core.models import Flight, Airplane
+from apps.core.selectors.flight_selector import SEARCH_MODES
 from apps.core.services.flight_services import FlightCreateInput, FlightUpdateInput
+from apps.core.services.schedule_import_services import FORMATS, IMPORT_CHUNK_SIZE
 
 
 class FlightReadSerializer(serializers.ModelSerializer):
@@ -67,12 +69,13 @@ class FlightsQuerySerializer(serializers.Serializer):
     destination = serializers.CharField(required=False)
     departure_time = serializers.DateTimeField(required=False)
     arrival_time = serializers.DateTimeField(required=False)
-    search = serializers.CharField(required=False)
+    search = serializers.CharField(required=False, max_length=20)
+    search_mode = serializers.ChoiceField(required=False, choices=SEARCH_MODES, default="contains")
     deleted = serializers.BooleanField(required=False, default=False)
 
     ordering = serializers.ChoiceField(
         required=False,
-        choices=["departure_time", "-departure_time", "arrival_time", "-arrival_time"]
+        choices=["relevance", "departure_time", "-departure_time", "arrival_time", "-arrival_time"]
     )
 
 class FlightUpdateSerializer(serializers.Serializer):
@@ -139,4 +142,67 @@ class FlightDetailSerializer(serializers.ModelSerializer):
             "departure_time",
             "arrival_time",
             "airplane",
-        )
\ No newline at end of file
+        )
+
+class FlightImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    format = serializers.ChoiceField(required=False, choices=FORMATS)
+    chunk_size = serializers.IntegerField(required=False, default=IMPORT_CHUNK_SIZE, min_value=1, max_value=5000)
+    dry_run = serializers.BooleanField(required=False, default=False)
+
+    def validate(self, attrs):
+        if "format" not in attrs:
+            ext = attrs["file"].name.rsplit(".", 1)[-1].lower()
+            if ext not in FORMATS:
+                raise ValidationError({"format": f"Cannot infer format from file name, use one of {', '.join(FORMATS)}."})
+            attrs["format"] = ext
+        return attrs
+
+
+class ItinerarySearchQuerySerializer(serializers.Serializer):
+    origin = serializers.CharField(max_length=20)
+    destination = serializers.CharField(max_length=20)
+    date = serializers.DateField()
+    min_connection_minutes = serializers.IntegerField(required=False, default=45, min_value=0)
+    max_connection_minutes = serializers.IntegerField(required=False, default=360, min_value=1, max_value=24 * 60)
+    max_stops = serializers.IntegerField(required=False, default=2, min_value=0, max_value=2)
+    limit = serializers.IntegerField(required=False, default=20, min_value=1, max_value=100)
+
+    def validate(self, attrs):
+        if attrs["origin"].strip().upper() == attrs["destination"].strip().upper():
+            raise ValidationError({"destination": "Destination must differ from departure."})
+        if attrs["max_connection_minutes"] < attrs["min_connection_minutes"]:
+            raise ValidationError({"max_connection_minutes": "Must be greater than min_connection_minutes."})
+        return attrs
+
+
+class LegSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    flight_number = serializers.CharField()
+    departure = serializers.CharField()
+    destination = serializers.CharField()
+    departure_time = serializers.DateTimeField()
+    arrival_time = serializers.DateTimeField()
+
+
+class ItinerarySerializer(serializers.Serializer):
+    stops = serializers.SerializerMethodField()
+    departure_time = serializers.SerializerMethodField()
+    arrival_time = serializers.SerializerMethodField()
+    duration_minutes = serializers.SerializerMethodField()
+    legs = serializers.SerializerMethodField()
+
+    def get_stops(self, legs):
+        return len(legs) - 1
+
+    def get_departure_time(self, legs):
+        return serializers.DateTimeField().to_representation(legs[0].departure_time)
+
+    def get_arrival_time(self, legs):
+        return serializers.DateTimeField().to_representation(legs[-1].arrival_time)
+
+    def get_duration_minutes(self, legs):
+        return int((legs[-1].arrival_time - legs[0].departure_time).total_seconds() // 60)
+
+    def get_legs(self, legs):
+        return LegSerializer(legs, many=True).data
@@ -1,8 +1,14 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
+from apps.core.api.flight.async_views import FlightAsyncReadView
 from apps.core.api.flight.views import FlightViewSet
 
 router = DefaultRouter()
 router.register(r"flights", FlightViewSet, basename="flights")
 
-urlpatterns = router.urls
\ No newline at end of file
+# ASGI altında native async okuma yolu (list/retrieve)
+urlpatterns = router.urls + [
+    path("async/flights/", FlightAsyncReadView.as_view(), name="flights-async-list"),
+    path("async/flights/<int:pk>/", FlightAsyncReadView.as_view(), name="flights-async-detail"),
+]
@@ -1,22 +1,33 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 
-from apps.common.drf import BaseResponseJSONRenderer, base_response_exception_handler
+from apps.common.drf import BaseResponseJSONRenderer, base_response_exception_handler, IdempotencyMixin, \
+    ProjectedListMixin, ValuesProjection, ResponseCacheMixin, ConditionalGetMixin
 from apps.core.api.flight.serializers import FlightCreateSerializer, FlightReadSerializer, FlightsQuerySerializer, \
-    FlightUpdateSerializer
-from apps.core.api.pagination import DefaultPagination
+    FlightUpdateSerializer, FlightImportSerializer, ItinerarySearchQuerySerializer, ItinerarySerializer
+from apps.common.drf.response_cache import FLIGHT
+from apps.core.api.pagination import DefaultPagination, KeysetPagination
 from apps.core.api.reservation.serializers import ReservationsQuerySerializer, ReservationReadSerializer
 from apps.core.models import Flight
 from apps.core.selectors.flight_selector import list_flights
+from apps.core.selectors.itinerary_selector import search_itineraries
 from apps.core.selectors.reservation_selector import list_reservations
 from apps.core.services.flight_services import create_flight, update_flight, soft_delete_flight
+from apps.core.services.schedule_import_services import import_schedule
 
 
-class FlightViewSet(viewsets.ModelViewSet):
+class FlightViewSet(IdempotencyMixin, ResponseCacheMixin, ConditionalGetMixin, ProjectedListMixin,
+                    viewsets.ModelViewSet):
     renderer_classes = [BaseResponseJSONRenderer]
     permission_classes = [permissions.AllowAny]
     pagination_class = DefaultPagination
+    # GET list/retrieve: yazma servislerinin artırdığı sürümlere bağlı byte cache
+    response_cache_entities = {"list": (FLIGHT,), "retrieve": (FLIGHT,)}
+    response_cache_query_serializers = {"list": FlightsQuerySerializer}
+    # list: model instance'sız values() okuma yolu
+    list_projection = ValuesProjection(FlightReadSerializer)
 
     def get_queryset(self):
         base = Flight.objects.select_related("airplane").filter(deleted=False).order_by("id")
@@ -63,14 +74,33 @@ class FlightViewSet(viewsets.ModelViewSet):
         params = {**qp.validated_data, "flight_id": flight.id}
         qs = list_reservations(**params)
 
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(qs, request, view=self)
+
         flight_data = self.get_serializer(flight).data
 
-        ser = ReservationReadSerializer(qs, many=True)
+        ser = ReservationReadSerializer(page, many=True)
+
+        return paginator.get_nested_response(flight_data, "reservations", ser.data)
+
+    @action(detail=False, methods=["get"], url_path="itineraries")
+    def itineraries(self, request):
+        qp = ItinerarySearchQuerySerializer(data=request.query_params)
+        qp.is_valid(raise_exception=True)
+
+        itineraries = search_itineraries(**qp.validated_data)
+
+        return Response(ItinerarySerializer(itineraries, many=True).data)
+
+    @action(detail=False, methods=["post"], url_path="import", parser_classes=[MultiPartParser])
+    def import_flights(self, request):
+        serializer = FlightImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        v = serializer.validated_data
+
+        report = import_schedule(v["file"].file, v["format"], chunk_size=v["chunk_size"], dry_run=v["dry_run"])
 
-        return Response({
-            **flight_data,
-            "reservations": ser.data,
-        })
+        return Response(report.to_dict(), status=status.HTTP_200_OK)
 
     def handle_exception(self, exc):
         print("Exception in API:", repr(exc))
@@ -0,0 +1,22 @@
+from rest_framework import serializers
+
+from apps.core.models import Flight
+from apps.core.services.hold_services import HoldSeatsInput
+
+MAX_HOLD_SEATS = 100
+
+
+class SeatHoldCreateSerializer(serializers.Serializer):
+    flight = serializers.PrimaryKeyRelatedField(queryset=Flight.objects.only("id"))
+    seats  = serializers.IntegerField(required=False, default=1, min_value=1, max_value=MAX_HOLD_SEATS)
+
+    def to_input(self) -> HoldSeatsInput:
+        v = self.validated_data
+        return HoldSeatsInput(flight_id=v["flight"].id, seats=v.get("seats", 1))
+
+
+class SeatHoldReadSerializer(serializers.Serializer):
+    hold_id    = serializers.CharField()
+    flight_id  = serializers.IntegerField()
+    seats      = serializers.IntegerField()
+    expires_at = serializers.DateTimeField(allow_null=True)
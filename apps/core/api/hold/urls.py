@@ -0,0 +1,7 @@
+from rest_framework.routers import DefaultRouter
+
+from apps.core.api.hold.views import SeatHoldViewSet
+
+router = DefaultRouter()
+router.register(r"holds", SeatHoldViewSet, basename="holds")
+urlpatterns = router.urls
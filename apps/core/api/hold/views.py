@@ -0,0 +1,37 @@
+from rest_framework import viewsets, status
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from apps.common.drf import BaseResponseJSONRenderer, base_response_exception_handler
+from apps.core.api.hold.serializers import SeatHoldCreateSerializer, SeatHoldReadSerializer
+from apps.core.services.hold_services import hold_seats, get_hold, release_hold
+
+
+class SeatHoldViewSet(viewsets.ViewSet):
+    renderer_classes = [BaseResponseJSONRenderer]
+    permission_classes = [AllowAny]
+
+    lookup_field = "hold_id"
+
+    def create(self, request):
+        serializer = SeatHoldCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        hold = hold_seats(serializer.to_input())
+
+        return Response(SeatHoldReadSerializer(hold).data, status=status.HTTP_201_CREATED)
+
+    def retrieve(self, request, hold_id=None):
+        hold = get_hold(hold_id)
+        if hold is None:
+            raise NotFound("Seat hold does not exist or expired.")
+        return Response(SeatHoldReadSerializer(hold).data)
+
+    def destroy(self, request, hold_id=None):
+        release_hold(hold_id)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def handle_exception(self, exc):
+        resp = base_response_exception_handler(exc, self.get_exception_handler_context())
+        return resp or super().handle_exception(exc)
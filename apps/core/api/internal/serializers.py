@@ -0,0 +1,12 @@
+from rest_framework import serializers
+
+from apps.core.services.contention_metrics import PHASE_OPEN_CHECK, PHASE_HOLDS, PHASE_INVENTORY
+
+
+class LockStatsQuerySerializer(serializers.Serializer):
+    k = serializers.IntegerField(required=False, default=10, min_value=1, max_value=100)
+    phase = serializers.ChoiceField(
+        required=False,
+        default=PHASE_INVENTORY,
+        choices=[PHASE_OPEN_CHECK, PHASE_HOLDS, PHASE_INVENTORY],
+    )
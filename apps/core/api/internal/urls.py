@@ -0,0 +1,8 @@
+from rest_framework.routers import DefaultRouter
+
+from apps.core.api.internal.views import LockStatsViewSet, DbPoolViewSet
+
+router = DefaultRouter()
+router.register(r"internal/lock-stats", LockStatsViewSet, basename="lock-stats")
+router.register(r"internal/db-pool", DbPoolViewSet, basename="db-pool")
+urlpatterns = router.urls
@@ -0,0 +1,67 @@
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from apps.common.db import pool_stats, check_connections
+from apps.common.drf import BaseResponseJSONRenderer, base_response_exception_handler
+from apps.core.api.internal.serializers import LockStatsQuerySerializer
+from apps.core.services.contention_metrics import metrics
+
+
+class LockStatsViewSet(viewsets.ViewSet):
+    """
+    Booking yolundaki faz bazlı bekleme süreleri (process içi).
+    GET /api/internal/lock-stats?k=10&phase=inventory_update
+    GET /api/internal/lock-stats/{flight_id}
+    """
+    renderer_classes = [BaseResponseJSONRenderer]
+    permission_classes = [IsAdminUser]
+    # sayısal olmayan id router'da eşleşmez, 404 olur.
+    lookup_value_regex = r"\d+"
+
+    def list(self, request):
+        qp = LockStatsQuerySerializer(data=request.query_params)
+        qp.is_valid(raise_exception=True)
+        return Response({"hottest": metrics.hottest(**qp.validated_data)})
+
+    def retrieve(self, request, pk=None):
+        return Response({"flight_id": int(pk), "phases": metrics.flight(int(pk))})
+
+    @action(detail=False, methods=["post"], url_path="reset")
+    def reset(self, request):
+        metrics.reset()
+        return Response(None)
+
+    def handle_exception(self, exc):
+        resp = base_response_exception_handler(exc, self.get_exception_handler_context())
+        return resp or super().handle_exception(exc)
+
+
+class DbPoolViewSet(viewsets.ViewSet):
+    """
+    Veritabanı bağlantı havuzu sayaçları ve health check (process içi).
+    GET  /api/internal/db-pool
+    GET  /api/internal/db-pool/health
+    POST /api/internal/db-pool/reset
+    """
+    renderer_classes = [BaseResponseJSONRenderer]
+    permission_classes = [IsAdminUser]
+
+    def list(self, request):
+        return Response(pool_stats())
+
+    @action(detail=False, methods=["get"], url_path="health")
+    def health(self, request):
+        checks = check_connections()
+        healthy = all(c["ok"] for c in checks.values())
+        return Response(checks, status=status.HTTP_200_OK if healthy else status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    @action(detail=False, methods=["post"], url_path="reset")
+    def reset(self, request):
+        pool_stats(reset=True)
+        return Response(None)
+
+    def handle_exception(self, exc):
+        resp = base_response_exception_handler(exc, self.get_exception_handler_context())
+        return resp or super().handle_exception(exc)
@@ -1,8 +1,173 @@
-from rest_framework.pagination import PageNumberPagination
+from datetime import date, datetime
+
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError, NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+CURSOR_SALT = "core.api.pagination.cursor"
+
+
+class KeysetPagination(BasePagination):
+    """
+    Selector'ın sıralamasını (order_by) anahtar olarak kullanan cursor pagination.
+    OFFSET ve COUNT(*) yok: sayfa, son satırın anahtarından sonrası olarak okunur.
+    Sıralama benzersiz değilse sona id eklenir. Cursor imzalıdır, istemci için opaktır.
+
+    ?cursor=<token>&page_size=20&include_count=true
+    """
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 50
+    cursor_query_param = "cursor"
+    count_query_param = "include_count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self._page_size(request)
+        self.keys = self._keys(queryset)
+
+        values, reverse = self._decode(request.query_params.get(self.cursor_query_param))
+
+        self.count = None
+        if request.query_params.get(self.count_query_param, "").lower() in ("1", "true"):
+            self.count = queryset.count()
+
+        qs = queryset
+        if values is not None:
+            qs = qs.filter(self._after(values, reverse))
+
+        ordering = [("-" if desc != reverse else "") + field.attname for field, desc in self.keys]
+        # bir fazlası: sonraki sayfa var mı?
+        rows = list(qs.order_by(*ordering)[:self.page_size + 1])
+
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.has_next = has_more if not reverse else values is not None
+        self.has_previous = values is not None if not reverse else has_more
+        self.first = rows[0] if rows else None
+        self.last = rows[-1] if rows else None
+        return rows
+
+    def get_links(self) -> dict:
+        links = {
+            "next": self._link(self.last, reverse=False) if self.has_next and self.last is not None else None,
+            "previous": self._link(self.first, reverse=True) if self.has_previous and self.first is not None else None,
+        }
+        if self.count is not None:
+            links = {"count": self.count, **links}
+        return links
+
+    def get_paginated_response(self, data):
+        return Response({**self.get_links(), "results": data})
+
+    def get_nested_response(self, parent: dict, key: str, data) -> Response:
+        # /parents/{id}/children: parent bir kez en üstte, çocuklar sayfa sayfa.
+        return Response({**parent, key: data, **self.get_links()})
+
+    # --- yardımcılar ---
+
+    def _page_size(self, request) -> int:
+        raw = request.query_params.get(self.page_size_query_param)
+        if not raw:
+            return self.page_size
+        try:
+            size = int(raw)
+        except ValueError:
+            raise ValidationError({self.page_size_query_param: "Must be an integer."})
+        return max(1, min(size, self.max_page_size))
+
+    @staticmethod
+    def _keys(queryset):
+        opts = queryset.model._meta
+        ordering = list(queryset.query.order_by or opts.ordering or ["id"])
+
+        keys = []
+        for item in ordering:
+            if not isinstance(item, str):
+                raise ValidationError({"cursor": "Cursor pagination is not supported for this ordering."})
+            desc = item.startswith("-")
+            name = item.lstrip("-")
+            try:
+                field = opts.pk if name == "pk" else opts.get_field(name)
+            except FieldDoesNotExist:
+                # annotation (ör. arama skoru) üzerinde keyset kurulamaz.
+                raise ValidationError({"cursor": "Cursor pagination is not supported for this ordering."})
+            keys.append((field, desc))
+
+        if not any(field.primary_key for field, _ in keys):
+            keys.append((opts.pk, keys[-1][1] if keys else False))
+        return keys
+
+    def _after(self, values, reverse: bool) -> Q:
+        # (k1, k2, ...) > (v1, v2, ...) yön karışık olabileceği için OR zinciri olarak yazılır;
+        # ilk anahtar için ayrıca >= eklenir ki planner index'te aralık taraması yapabilsin.
+        condition = Q()
+        equal = Q()
+        for (field, desc), value in zip(self.keys, values):
+            op = "lt" if desc != reverse else "gt"
+            condition |= equal & Q(**{f"{field.attname}__{op}": value})
+            equal &= Q(**{field.attname: value})
+
+        field, desc = self.keys[0]
+        bound = Q(**{f"{field.attname}__{'lte' if desc != reverse else 'gte'}": values[0]})
+        return bound & condition
+
+    def _encode(self, row, reverse: bool) -> str:
+        values = []
+        for field, _ in self.keys:
+            # values() projeksiyonu ile gelen satırlar dict.
+            value = row[field.attname] if isinstance(row, dict) else field.value_from_object(row)
+            values.append(value.isoformat() if isinstance(value, (datetime, date)) else value)
+        return signing.dumps({"v": values, "r": reverse}, salt=CURSOR_SALT, compress=True)
+
+    def _decode(self, token):
+        if not token:
+            return None, False
+        try:
+            payload = signing.loads(token, salt=CURSOR_SALT)
+            raw = payload["v"]
+            if len(raw) != len(self.keys):
+                raise ValueError
+            values = [field.to_python(v) for (field, _), v in zip(self.keys, raw)]
+        except (signing.BadSignature, KeyError, TypeError, ValueError, DjangoValidationError):
+            raise NotFound("Invalid cursor.")
+        return values, bool(payload.get("r"))
+
+    def _link(self, row, *, reverse: bool) -> str:
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self._encode(row, reverse))
 
 
 class DefaultPagination(PageNumberPagination):
+    """
+    Varsayılan sayfa numaralı pagination. ?pagination=cursor (ya da bir ?cursor= token'ı)
+    verilirse aynı endpoint KeysetPagination ile cevap verir.
+    """
     page_size = 10
     page_size_query_param = "page_size"
     page_query_param = "page"
-    max_page_size = 50
\ No newline at end of file
+    max_page_size = 50
+    mode_query_param = "pagination"
+
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if request.query_params.get(self.mode_query_param) == "cursor" or self.keyset_class.cursor_query_param in request.query_params:
+            self.keyset = self.keyset_class()
+            self.keyset.page_size = self.page_size
+            self.keyset.max_page_size = self.max_page_size
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
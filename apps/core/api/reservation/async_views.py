@@ -0,0 +1,19 @@
+from apps.common.drf import AsyncReadView, ValuesProjection
+from apps.core.api.reservation.serializers import ReservationReadSerializer, ReservationsQuerySerializer, \
+    ReservationDetailSerializer
+from apps.core.selectors.reservation_selector import alist_reservations, acount_reservations, aget_reservation
+
+
+class ReservationAsyncReadView(AsyncReadView):
+    """
+    GET /api/async/reservations/?flight_id=42
+    GET /api/async/reservations/{id}/
+    """
+    query_serializer_class = ReservationsQuerySerializer
+    read_serializer_class = ReservationDetailSerializer
+    list_projection = ValuesProjection(ReservationReadSerializer)
+
+    list_selector = staticmethod(alist_reservations)
+    count_selector = staticmethod(acount_reservations)
+    get_selector = staticmethod(aget_reservation)
+    lookup_kwarg = "reservation_id"
@@ -2,7 +2,11 @@ from rest_framework import serializers
 
 from apps.core.api.flight.serializers import FlightReadSerializer
 from apps.core.models import Reservation, Flight
-from apps.core.services.reservation_services import MakeReservationInput, UpdateReservationInput
+from apps.core.services.export_services import EXPORT_FORMATS
+from apps.core.services.reservation_services import MakeReservationInput, UpdateReservationInput, \
+    MakeGroupReservationInput, PassengerInput
+
+MAX_GROUP_SIZE = 100
 
 
 class ReservationReadSerializer(serializers.ModelSerializer):
@@ -25,6 +29,7 @@ class ReservationCreateSerializer(serializers.Serializer):
     passenger_email = serializers.EmailField(max_length=254)
     flight          = serializers.PrimaryKeyRelatedField(queryset=Flight.objects.only("id"))
     status          = serializers.BooleanField(required=False, default=True)
+    hold_id         = serializers.CharField(required=False, max_length=64, write_only=True)
 
     def validate_passenger_name(self, v):
         v = v.strip()
@@ -42,6 +47,37 @@ class ReservationCreateSerializer(serializers.Serializer):
             passenger_email=v["passenger_email"],
             flight_id=v["flight"].id,
             status=v.get("status", True),
+            hold_id=v.get("hold_id"),
+        )
+
+class PassengerSerializer(serializers.Serializer):
+    passenger_name  = serializers.CharField(max_length=40)
+    # Reservation.passenger_email kolonu 40 karakter.
+    passenger_email = serializers.EmailField(max_length=40)
+
+    def validate_passenger_name(self, v):
+        v = v.strip()
+        if not v:
+            raise serializers.ValidationError("Name cannot be blank.")
+        return v
+
+    def validate_passenger_email(self, v):
+        return v.strip().lower()
+
+class ReservationGroupCreateSerializer(serializers.Serializer):
+    flight     = serializers.PrimaryKeyRelatedField(queryset=Flight.objects.only("id"))
+    passengers = PassengerSerializer(many=True, min_length=1, max_length=MAX_GROUP_SIZE)
+    hold_id    = serializers.CharField(required=False, max_length=64)
+
+    def to_input(self) -> MakeGroupReservationInput:
+        v = self.validated_data
+        return MakeGroupReservationInput(
+            flight_id=v["flight"].id,
+            passengers=tuple(
+                PassengerInput(passenger_name=p["passenger_name"], passenger_email=p["passenger_email"])
+                for p in v["passengers"]
+            ),
+            hold_id=v.get("hold_id"),
         )
 
 class ReservationUpdateSerializer(serializers.Serializer):
@@ -77,9 +113,23 @@ class ReservationsQuerySerializer(serializers.Serializer):
     reservation_code = serializers.CharField(required=False, allow_blank=True)
     ordering = serializers.ChoiceField(
         required = False,
-        choices = ["id", "-id"]
+        choices = ["id", "-id", "created_at", "-created_at"]
     )
 
+class ReservationExportQuerySerializer(serializers.Serializer):
+    # "format" DRF'in renderer seçimine ayrılmış bir query parametresi.
+    export_format = serializers.ChoiceField(required=False, choices=EXPORT_FORMATS, default="csv")
+    flight_id = serializers.IntegerField(required=False)
+    status = serializers.BooleanField(required=False, default=True)
+    departure_time_min = serializers.DateTimeField(required=False)
+    departure_time_max = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs):
+        lo, hi = attrs.get("departure_time_min"), attrs.get("departure_time_max")
+        if lo and hi and hi <= lo:
+            raise serializers.ValidationError({"departure_time_max": "Must be after departure_time_min."})
+        return attrs
+
 class ReservationDetailSerializer(serializers.ModelSerializer):
     flight = FlightReadSerializer(read_only=True)
 
@@ -1,7 +1,13 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
+from apps.core.api.reservation.async_views import ReservationAsyncReadView
 from apps.core.api.reservation.views import ReservationViewSet
 
 router = DefaultRouter()
 router.register(r"reservations", ReservationViewSet, basename="reservation")
-urlpatterns = router.urls
\ No newline at end of file
+# ASGI altında native async okuma yolu (list/retrieve)
+urlpatterns = router.urls + [
+    path("async/reservations/", ReservationAsyncReadView.as_view(), name="reservations-async-list"),
+    path("async/reservations/<int:pk>/", ReservationAsyncReadView.as_view(), name="reservations-async-detail"),
+]
@@ -1,20 +1,35 @@
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
-from apps.common.drf import BaseResponseJSONRenderer, base_response_exception_handler
+from apps.common.drf import BaseResponseJSONRenderer, base_response_exception_handler, IdempotencyMixin, \
+    ProjectedListMixin, ValuesProjection, ResponseCacheMixin, ConditionalGetMixin
+from apps.common.drf.response_cache import FLIGHT, RESERVATION
 from apps.core.api.pagination import DefaultPagination
 from apps.core.api.reservation.serializers import ReservationReadSerializer, ReservationCreateSerializer, \
-    ReservationsQuerySerializer, ReservationUpdateSerializer, ReservationDetailSerializer
+    ReservationsQuerySerializer, ReservationUpdateSerializer, ReservationDetailSerializer, \
+    ReservationGroupCreateSerializer, ReservationExportQuerySerializer
 from apps.core.models import Reservation
 from apps.core.selectors.reservation_selector import list_reservations
-from apps.core.services.reservation_services import make_reservation, update_reservation, soft_delete_reservation
+from apps.core.services.reservation_services import make_reservation, update_reservation, soft_delete_reservation, \
+    make_group_reservation
+from apps.core.services.export_services import export_reservations, CONTENT_TYPES
 
 
-class ReservationViewSet(viewsets.ModelViewSet):
+class ReservationViewSet(IdempotencyMixin, ResponseCacheMixin, ConditionalGetMixin, ProjectedListMixin,
+                         viewsets.ModelViewSet):
     renderer_classes = [BaseResponseJSONRenderer]
     permission_classes = [AllowAny]
     pagination_class = DefaultPagination
+    # GET list/retrieve: yazma servislerinin artırdığı sürümlere bağlı byte cache
+    response_cache_entities = {"list": (RESERVATION,), "retrieve": (RESERVATION, FLIGHT)}
+    response_cache_query_serializers = {"list": ReservationsQuerySerializer}
+    # detay nested flight içerir; uçuş değişince ETag de değişmeli.
+    conditional_retrieve_fields = ("updated_at", "flight__updated_at")
+    # list: model instance'sız values() okuma yolu
+    list_projection = ValuesProjection(ReservationReadSerializer)
 
     filter_backends = []
 
@@ -27,6 +42,8 @@ class ReservationViewSet(viewsets.ModelViewSet):
             return ReservationUpdateSerializer
         elif self.action == "retrieve":
             return ReservationDetailSerializer
+        elif self.action == "bulk":
+            return ReservationGroupCreateSerializer
         return None
 
     def get_queryset(self):
@@ -55,6 +72,27 @@ class ReservationViewSet(viewsets.ModelViewSet):
         soft_delete_reservation(instance)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        serializer = ReservationGroupCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        reservations = make_group_reservation(serializer.to_input())
+
+        return Response(ReservationReadSerializer(reservations, many=True).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request):
+        qp = ReservationExportQuerySerializer(data=request.query_params)
+        qp.is_valid(raise_exception=True)
+        params = dict(qp.validated_data)
+        fmt = params.pop("export_format")
+
+        # envelope yok: satırlar üretildikçe yazılır, bellek kullanımı satır sayısından bağımsız.
+        response = StreamingHttpResponse(export_reservations(fmt, **params), content_type=CONTENT_TYPES[fmt])
+        response["Content-Disposition"] = f'attachment; filename="reservations.{fmt}"'
+        return response
+
     def handle_exception(self, exc):
         resp = base_response_exception_handler(exc, self.get_exception_handler_context())
         return resp or super().handle_exception(exc)
@@ -0,0 +1,125 @@
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from rest_framework import serializers
+
+from apps.core.models import Airplane, FlightSchedule
+from apps.core.models.flight_schedule import SCHEDULE_NUMBER_MAX_LENGTH
+from apps.core.services.schedule_services import FlightScheduleInput, FlightScheduleUpdateInput
+
+
+def _validate_zone(v: str) -> str:
+    try:
+        ZoneInfo(v)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise serializers.ValidationError("Unknown timezone.")
+    return v
+
+
+class FlightScheduleReadSerializer(serializers.ModelSerializer):
+
+    airplane_id = serializers.IntegerField(source="airplane.id", read_only=True)
+
+    class Meta:
+        model = FlightSchedule
+        fields = (
+            "id",
+            "flight_number",
+            "airplane_id",
+            "departure", "destination",
+            "departure_local_time", "duration", "timezone",
+            "weekdays",
+            "valid_from", "valid_until",
+        )
+
+
+class FlightScheduleCreateSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+
+    flight_number        = serializers.CharField(max_length=SCHEDULE_NUMBER_MAX_LENGTH)
+    departure            = serializers.CharField(max_length=20)
+    destination          = serializers.CharField(max_length=20)
+    departure_local_time = serializers.TimeField()
+    duration             = serializers.DurationField()
+    timezone             = serializers.CharField(max_length=64, required=False)
+    weekdays             = serializers.ListField(child=serializers.IntegerField(min_value=0, max_value=6),
+                                                 min_length=1, max_length=7)
+    valid_from           = serializers.DateField()
+    valid_until          = serializers.DateField()
+    airplane             = serializers.PrimaryKeyRelatedField(queryset=Airplane.objects.only("id"))
+
+    def validate_timezone(self, v):
+        return _validate_zone(v)
+
+    def validate(self, attrs):
+        if attrs["valid_until"] < attrs["valid_from"]:
+            raise serializers.ValidationError({"valid_until": "Must be on or after valid_from."})
+
+        if attrs["departure"].strip().upper() == attrs["destination"].strip().upper():
+            raise serializers.ValidationError({"destination": "Destination must differ from departure."})
+
+        if attrs["duration"].total_seconds() <= 0:
+            raise serializers.ValidationError({"duration": "Duration must be positive."})
+
+        return attrs
+
+    def to_input(self) -> FlightScheduleInput:
+        v = self.validated_data
+        return FlightScheduleInput(
+            flight_number=v["flight_number"],
+            departure=v["departure"],
+            destination=v["destination"],
+            departure_local_time=v["departure_local_time"],
+            duration=v["duration"],
+            weekdays=tuple(v["weekdays"]),
+            valid_from=v["valid_from"],
+            valid_until=v["valid_until"],
+            airplane_id=v["airplane"].id,
+            timezone=v.get("timezone"),
+        )
+
+
+class FlightScheduleUpdateSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+
+    departure            = serializers.CharField(max_length=20, required=False)
+    destination          = serializers.CharField(max_length=20, required=False)
+    departure_local_time = serializers.TimeField(required=False)
+    duration             = serializers.DurationField(required=False)
+    timezone             = serializers.CharField(max_length=64, required=False)
+    weekdays             = serializers.ListField(child=serializers.IntegerField(min_value=0, max_value=6),
+                                                 min_length=1, max_length=7, required=False)
+    valid_from           = serializers.DateField(required=False)
+    valid_until          = serializers.DateField(required=False)
+    airplane             = serializers.PrimaryKeyRelatedField(queryset=Airplane.objects.only("id"), required=False)
+
+    def validate_timezone(self, v):
+        return _validate_zone(v)
+
+    def to_input(self) -> FlightScheduleUpdateInput:
+        v = self.validated_data
+        return FlightScheduleUpdateInput(
+            departure=v.get("departure"),
+            destination=v.get("destination"),
+            departure_local_time=v.get("departure_local_time"),
+            duration=v.get("duration"),
+            weekdays=tuple(v["weekdays"]) if "weekdays" in v else None,
+            valid_from=v.get("valid_from"),
+            valid_until=v.get("valid_until"),
+            airplane_id=v["airplane"].id if "airplane" in v else None,
+            timezone=v.get("timezone"),
+        )
+
+
+class FlightSchedulesQuerySerializer(serializers.Serializer):
+    airplane_id = serializers.IntegerField(required=False, min_value=1)
+    departure = serializers.CharField(required=False)
+    destination = serializers.CharField(required=False)
+    active_on = serializers.DateField(required=False)
+
+
+class ScheduleSyncResultSerializer(serializers.Serializer):
+    created = serializers.IntegerField()
+    updated = serializers.IntegerField()
+    removed = serializers.IntegerField()
+    kept = serializers.ListField(child=serializers.DateField())
+    pinned = serializers.ListField(child=serializers.DateField())
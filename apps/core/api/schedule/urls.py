@@ -0,0 +1,7 @@
+from rest_framework.routers import DefaultRouter
+
+from apps.core.api.schedule.views import FlightScheduleViewSet
+
+router = DefaultRouter()
+router.register(r"schedules", FlightScheduleViewSet, basename="schedules")
+urlpatterns = router.urls
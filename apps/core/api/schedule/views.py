@@ -0,0 +1,71 @@
+from rest_framework import viewsets, permissions, status
+from rest_framework.response import Response
+
+from apps.common.drf import BaseResponseJSONRenderer, base_response_exception_handler, IdempotencyMixin
+from apps.core.api.pagination import DefaultPagination
+from apps.core.api.schedule.serializers import FlightScheduleReadSerializer, FlightScheduleCreateSerializer, \
+    FlightScheduleUpdateSerializer, FlightSchedulesQuerySerializer, ScheduleSyncResultSerializer
+from apps.core.models import FlightSchedule
+from apps.core.selectors.schedule_selector import list_flight_schedules
+from apps.core.services.schedule_services import create_schedule, update_schedule, soft_delete_schedule
+
+
+class FlightScheduleViewSet(IdempotencyMixin, viewsets.ModelViewSet):
+    renderer_classes = [BaseResponseJSONRenderer]
+    permission_classes = [permissions.AllowAny]
+    pagination_class = DefaultPagination
+
+    def get_queryset(self):
+        base = FlightSchedule.objects.select_related("airplane").filter(deleted=False).order_by("id")
+
+        if self.action == "list":
+            qp = FlightSchedulesQuerySerializer(data=self.request.query_params)
+            qp.is_valid(raise_exception=True)
+            return list_flight_schedules(**qp.validated_data).select_related("airplane")
+
+        return base
+
+    def get_serializer_class(self):
+        if self.action == "create":
+            return FlightScheduleCreateSerializer
+        elif self.action == "update" or self.action == "partial_update":
+            return FlightScheduleUpdateSerializer
+
+        return FlightScheduleReadSerializer
+
+    def create(self, request, *args, **kwargs):
+        serializer = FlightScheduleCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        schedule, result = create_schedule(serializer.to_input())
+
+        return Response({
+            **FlightScheduleReadSerializer(schedule).data,
+            "instances": ScheduleSyncResultSerializer(result).data,
+        }, status=status.HTTP_201_CREATED)
+
+    def update(self, request, *args, **kwargs):
+        schedule = self.get_object()
+
+        serializer = FlightScheduleUpdateSerializer(data=request.data, partial=kwargs.get("partial", False))
+        serializer.is_valid(raise_exception=True)
+
+        schedule, result = update_schedule(schedule, serializer.to_input())
+
+        return Response({
+            **FlightScheduleReadSerializer(schedule).data,
+            "instances": ScheduleSyncResultSerializer(result).data,
+        })
+
+    def destroy(self, request, *args, **kwargs):
+        schedule = self.get_object()
+        result = soft_delete_schedule(schedule)
+
+        if result.kept:
+            # rezervasyonlu uçuşlar bırakıldı, çağıran bilsin.
+            return Response({"instances": ScheduleSyncResultSerializer(result).data})
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def handle_exception(self, exc):
+        resp = base_response_exception_handler(exc, self.get_exception_handler_context())
+        return resp or super().handle_exception(exc)
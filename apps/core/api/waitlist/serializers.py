@@ -0,0 +1,61 @@
+from rest_framework import serializers
+
+from apps.core.models import Flight, WaitlistEntry
+from apps.core.selectors.waitlist_selector import waitlist_position
+from apps.core.services.waitlist_services import JoinWaitlistInput
+
+
+class WaitlistReadSerializer(serializers.ModelSerializer):
+    reservation_code = serializers.CharField(source="reservation.reservation_code", read_only=True, default=None)
+    position = serializers.SerializerMethodField()
+
+    class Meta:
+        model = WaitlistEntry
+        fields = (
+            "id",
+            "flight",
+            "passenger_name",
+            "passenger_email",
+            "promoted",
+            "reservation_code",
+            "position",
+            "created_at",
+            "promoted_at",
+        )
+
+    def get_position(self, obj):
+        if not self.context.get("with_position"):
+            return None
+        return waitlist_position(obj)
+
+
+class WaitlistCreateSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+
+    passenger_name  = serializers.CharField(max_length=40)
+    # WaitlistEntry ve promote edilince oluşan Reservation kolonu 40 karakter.
+    passenger_email = serializers.EmailField(max_length=40)
+    flight          = serializers.PrimaryKeyRelatedField(queryset=Flight.objects.only("id"))
+
+    def validate_passenger_name(self, v):
+        v = v.strip()
+        if not v:
+            raise serializers.ValidationError("Name cannot be blank.")
+        return v
+
+    def validate_passenger_email(self, v):
+        return v.strip().lower()
+
+    def to_input(self) -> JoinWaitlistInput:
+        v = self.validated_data
+        return JoinWaitlistInput(
+            passenger_name=v["passenger_name"],
+            passenger_email=v["passenger_email"],
+            flight_id=v["flight"].id,
+        )
+
+
+class WaitlistQuerySerializer(serializers.Serializer):
+    flight_id = serializers.IntegerField(required=False)
+    passenger_email = serializers.CharField(required=False, allow_blank=True)
+    promoted = serializers.BooleanField(required=False, default=False)
@@ -0,0 +1,7 @@
+from rest_framework.routers import DefaultRouter
+
+from apps.core.api.waitlist.views import WaitlistViewSet
+
+router = DefaultRouter()
+router.register(r"waitlist", WaitlistViewSet, basename="waitlist")
+urlpatterns = router.urls
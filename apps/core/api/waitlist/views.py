@@ -0,0 +1,58 @@
+from rest_framework import viewsets, status, mixins
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from apps.common.drf import BaseResponseJSONRenderer, base_response_exception_handler, IdempotencyMixin
+from apps.core.api.pagination import DefaultPagination
+from apps.core.api.waitlist.serializers import WaitlistReadSerializer, WaitlistCreateSerializer, \
+    WaitlistQuerySerializer
+from apps.core.models import WaitlistEntry
+from apps.core.selectors.waitlist_selector import list_waitlist_entries
+from apps.core.services.waitlist_services import join_waitlist, leave_waitlist
+
+
+class WaitlistViewSet(IdempotencyMixin,
+                      mixins.CreateModelMixin,
+                      mixins.ListModelMixin,
+                      mixins.RetrieveModelMixin,
+                      mixins.DestroyModelMixin,
+                      viewsets.GenericViewSet):
+    renderer_classes = [BaseResponseJSONRenderer]
+    permission_classes = [AllowAny]
+    pagination_class = DefaultPagination
+
+    filter_backends = []
+
+    def get_queryset(self):
+        base = WaitlistEntry.objects.select_related("reservation").filter(deleted=False).order_by("id")
+
+        if self.action == "list":
+            qp = WaitlistQuerySerializer(data=self.request.query_params)
+            qp.is_valid(raise_exception=True)
+            return list_waitlist_entries(**qp.validated_data).select_related("reservation")
+
+        return base
+
+    def get_serializer_class(self):
+        if self.action == "create":
+            return WaitlistCreateSerializer
+        return WaitlistReadSerializer
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        # sıra numarası kayıt başına bir COUNT demek, sadece detayda hesapla.
+        context["with_position"] = self.action == "retrieve"
+        return context
+
+    def perform_create(self, serializer: WaitlistCreateSerializer):
+        entry = join_waitlist(serializer.to_input())
+        serializer.instance = entry
+
+    def destroy(self, request, *args, **kwargs):
+        entry = self.get_object()
+        leave_waitlist(entry)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def handle_exception(self, exc):
+        resp = base_response_exception_handler(exc, self.get_exception_handler_context())
+        return resp or super().handle_exception(exc)
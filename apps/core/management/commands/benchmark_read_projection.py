@@ -0,0 +1,66 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.drf import ValuesProjection
+from apps.core.api.airplanes.serializers import AirplaneReadSerializer
+from apps.core.api.flight.serializers import FlightReadSerializer
+from apps.core.api.reservation.serializers import ReservationReadSerializer
+from apps.core.selectors import list_airplanes
+from apps.core.selectors.flight_selector import list_flights
+from apps.core.selectors.reservation_selector import list_reservations
+
+CASES = {
+    "airplanes": (AirplaneReadSerializer, list_airplanes),
+    "flights": (FlightReadSerializer, list_flights),
+    "reservations": (ReservationReadSerializer, list_reservations),
+}
+
+
+class Command(BaseCommand):
+    help = ("List endpoint'lerinin values() projeksiyonunu ModelSerializer çıktısı ile karşılaştırır: "
+            "çıktılar birebir aynı olmalı, süreler yan yana yazılır.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--only", choices=sorted(CASES), action="append")
+
+    def handle(self, *args, rows, repeat, only=None, **options):
+        mismatches = []
+        for name in only or sorted(CASES):
+            serializer_class, selector = CASES[name]
+            projection = ValuesProjection(serializer_class)
+            qs = selector()
+
+            def serialize():
+                return [dict(item) for item in serializer_class(qs[:rows], many=True).data]
+
+            def project():
+                return projection.to_representation(projection.values(qs)[:rows])
+
+            expected, slow = self._timed(serialize, repeat)
+            actual, fast = self._timed(project, repeat)
+
+            if expected != actual:
+                mismatches.append(name)
+                self.stdout.write(self.style.ERROR(f"{name}: output differs from {serializer_class.__name__}"))
+                continue
+
+            ratio = slow / fast if fast else float("inf")
+            self.stdout.write(f"{name:<13} rows={len(actual):<6} serializer={slow * 1000:8.1f}ms "
+                              f"projection={fast * 1000:8.1f}ms  x{ratio:.1f}")
+
+        if mismatches:
+            raise CommandError(f"Projection output differs for: {', '.join(mismatches)}")
+
+    @staticmethod
+    def _timed(fn, repeat: int):
+        best = None
+        result = None
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return result, best
@@ -0,0 +1,52 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.core.query_plans import analyze, explain_cases, seed_plan_data
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ("Selector sorgularının EXPLAIN planlarını elle kontrol etmek için; sıcak tablolarda Seq Scan varsa "
+            "hata verir. --seed ile geçici veri üretilir ve iş bitince geri alınır. "
+            "Aynı kontrol apps.core.tests.test_query_plans içinde test olarak da çalışır.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=0,
+                            help="Üretilecek uçuş sayısı (uçuş başına 5 rezervasyon, 3 bekleme kaydı). 0: mevcut veri kullanılır.")
+        parser.add_argument("--verbose-plans", action="store_true", help="Başarısız sorguların planını yazdır.")
+
+    def handle(self, *args, seed=0, verbose_plans=False, **options):
+        failures = []
+        try:
+            with transaction.atomic():
+                if seed:
+                    seed_plan_data(seed)
+                analyze()
+
+                results = explain_cases()
+                if results is None:
+                    raise CommandError("No data to explain, run with --seed N.")
+
+                for name, plan, scans in results:
+                    if scans:
+                        failures.append(name)
+                        self.stdout.write(self.style.ERROR(f"FAIL {name}: Seq Scan on {', '.join(sorted(set(scans)))}"))
+                        if verbose_plans:
+                            self.stdout.write(json.dumps(plan, indent=2))
+                    else:
+                        self.stdout.write(f"ok   {name}")
+
+                # seed verisi kalıcı olmasın.
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        if failures:
+            raise CommandError(f"{len(failures)} queries fall back to sequential scans: {', '.join(failures)}")
+
+        self.stdout.write(self.style.SUCCESS("All query plans use indexes."))
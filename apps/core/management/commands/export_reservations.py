@@ -0,0 +1,41 @@
+import sys
+from datetime import datetime, time, timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.core.services.export_services import export_reservations, EXPORT_FORMATS, EXPORT_CHUNK_SIZE
+
+
+def _day_start(value: str):
+    return timezone.make_aware(datetime.combine(datetime.strptime(value, "%Y-%m-%d").date(), time.min))
+
+
+class Command(BaseCommand):
+    help = "Rezervasyonları (yolcu manifestosu) CSV/NDJSON olarak stream ederek dışa aktarır."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+        parser.add_argument("--flight", type=int, dest="flight_id", help="Sadece bu uçuşun manifestosu.")
+        parser.add_argument("--from", dest="date_from", help="Kalkış tarihi (dahil), YYYY-MM-DD.")
+        parser.add_argument("--to", dest="date_to", help="Kalkış tarihi (dahil), YYYY-MM-DD.")
+        parser.add_argument("--include-cancelled", action="store_true", help="status=False olanları da yaz.")
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+        parser.add_argument("--output", "-o", help="Verilmezse stdout.")
+
+    def handle(self, *args, format, flight_id=None, date_from=None, date_to=None, include_cancelled=False,
+               chunk_size, output=None, **options):
+        filters = {
+            "flight_id": flight_id,
+            "status": None if include_cancelled else True,
+            "departure_time_min": _day_start(date_from) if date_from else None,
+            "departure_time_max": _day_start(date_to) + timedelta(days=1) if date_to else None,
+        }
+
+        stream = open(output, "w", newline="", encoding="utf-8") if output else sys.stdout
+        try:
+            for chunk in export_reservations(format, chunk_size=chunk_size, **filters):
+                stream.write(chunk)
+        finally:
+            if output:
+                stream.close()
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.models import Flight
+from apps.core.services.inventory_services import enable_hot_mode, disable_hot_mode, booked_seats
+
+
+class Command(BaseCommand):
+    help = "Uçuş için hot-flight modunu (shard'lı kapasite sayaçları) açar/kapatır."
+
+    def add_arguments(self, parser):
+        parser.add_argument("flight_id", type=int)
+        group = parser.add_mutually_exclusive_group(required=True)
+        group.add_argument("--shards", type=int, help="Kalan kapasiteyi bu kadar shard'a böl.")
+        group.add_argument("--off", action="store_true", help="Shard'ları ana sayaca topla ve modu kapat.")
+
+    def handle(self, *args, flight_id, shards=None, off=False, **options):
+        try:
+            flight = Flight.objects.select_related("airplane").get(pk=flight_id, deleted=False)
+        except Flight.DoesNotExist:
+            raise CommandError(f"Flight {flight_id} does not exist.")
+
+        if off:
+            inventory = disable_hot_mode(flight)
+        else:
+            inventory = enable_hot_mode(flight, shards)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"flight {flight_id}: shards={inventory.shard_count}, "
+            f"booked={booked_seats(inventory)}/{inventory.capacity}"
+        ))
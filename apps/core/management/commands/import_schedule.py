@@ -0,0 +1,39 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.services.schedule_import_services import import_schedule, FORMATS, IMPORT_CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = "CSV/JSONL sezon programını stream ederek toplu uçuş olarak yükler."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=FORMATS, help="Verilmezse dosya uzantısından anlaşılır.")
+        parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+        parser.add_argument("--dry-run", action="store_true", help="Sadece doğrula, yazma.")
+        parser.add_argument("--report", help="Reddedilen satırları bu dosyaya JSON olarak yaz.")
+
+    def handle(self, *args, path, format=None, chunk_size, dry_run, report=None, **options):
+        fmt = format or os.path.splitext(path)[1].lstrip(".").lower()
+        if fmt not in FORMATS:
+            raise CommandError(f"Unknown format {fmt!r}, use --format.")
+
+        with open(path, "rb") as stream:
+            result = import_schedule(stream, fmt, chunk_size=chunk_size, dry_run=dry_run)
+
+        for item in result.rejected[:50]:
+            self.stdout.write(f"line {item['line']} ({item['flight_number']}): {item['reason']}")
+        if len(result.rejected) > 50:
+            self.stdout.write(f"... {len(result.rejected) - 50} more")
+
+        if report:
+            with open(report, "w") as fh:
+                json.dump(result.to_dict(), fh, indent=2)
+
+        verb = "would be created" if dry_run else "created"
+        self.stdout.write(self.style.SUCCESS(
+            f"{result.total} rows, {result.created} flights {verb}, {len(result.rejected)} rejected."
+        ))
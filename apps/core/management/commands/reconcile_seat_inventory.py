@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from apps.core.models import Flight
+from apps.core.services.inventory_services import reconcile_inventory
+
+
+class Command(BaseCommand):
+    help = "FlightInventory sayaçlarını Reservation tablosundan yeniden hesaplar."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--flight", type=int, action="append", dest="flight_ids",
+                            help="Sadece verilen uçuş(lar). Birden fazla kez verilebilir.")
+        parser.add_argument("--include-deleted", action="store_true",
+                            help="Silinmiş uçuşları da dahil et.")
+
+    def handle(self, *args, flight_ids=None, include_deleted=False, **options):
+        qs = Flight.objects.select_related("airplane").order_by("id")
+
+        if flight_ids:
+            qs = qs.filter(id__in=flight_ids)
+
+        if not include_deleted:
+            qs = qs.filter(deleted=False)
+
+        fixed = 0
+        total = 0
+        for flight in qs.iterator(chunk_size=500):
+            inventory, before = reconcile_inventory(flight)
+            total += 1
+            if before != inventory.seats_booked:
+                fixed += 1
+                self.stdout.write(f"flight {flight.id}: {before} -> {inventory.seats_booked}/{inventory.capacity}")
+
+        self.stdout.write(self.style.SUCCESS(f"{total} flights checked, {fixed} corrected."))
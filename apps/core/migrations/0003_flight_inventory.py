@@ -0,0 +1,41 @@
+# Generated by Django 5.2.5 on 2026-10-18 17:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_inventory(apps, schema_editor):
+    Flight = apps.get_model("core", "Flight")
+    FlightInventory = apps.get_model("core", "FlightInventory")
+
+    flights = (Flight.objects
+               .select_related("airplane")
+               .annotate(booked=Count("reservation", filter=Q(reservation__status=True, reservation__deleted=False))))
+
+    FlightInventory.objects.bulk_create(
+        [FlightInventory(flight_id=f.id, capacity=f.airplane.capacity, seats_booked=f.booked) for f in flights.iterator(chunk_size=2000)],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_airplane_deleted_flight_deleted_reservation_deleted_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FlightInventory',
+            fields=[
+                ('flight', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='inventory', serialize=False, to='core.flight')),
+                ('capacity', models.PositiveIntegerField()),
+                ('seats_booked', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.CheckConstraint(condition=models.Q(('seats_booked__gte', 0)), name='inventory_seats_booked_gte_0')],
+            },
+        ),
+        migrations.RunPython(populate_inventory, migrations.RunPython.noop),
+    ]
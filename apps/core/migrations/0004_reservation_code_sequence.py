@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 18:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_flight_inventory'),
+    ]
+
+    operations = [
+        # INCREMENT BY = reservation_code.BLOCK_SIZE, MAXVALUE = 2^40 - 1 (8 karakterlik kod alanı)
+        migrations.RunSQL(
+            sql="CREATE SEQUENCE IF NOT EXISTS core_reservation_code_seq START WITH 1 INCREMENT BY 1000 MAXVALUE 1099511627775 NO CYCLE;",
+            reverse_sql="DROP SEQUENCE IF EXISTS core_reservation_code_seq;",
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.5 on 2026-10-18 18:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_reservation_code_sequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='flightinventory',
+            name='shard_count',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='FlightInventoryShard',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('shard_no', models.PositiveSmallIntegerField()),
+                ('capacity', models.PositiveIntegerField(default=0)),
+                ('seats_booked', models.PositiveIntegerField(default=0)),
+                ('flight', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inventory_shards', to='core.flight')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('flight', 'shard_no'), name='inventory_shard_flight_shard_no_uniq')],
+            },
+        ),
+    ]
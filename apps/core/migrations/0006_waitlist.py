@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-18 19:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_hot_flight_shards'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WaitlistEntry',
+            fields=[
+                ('id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('passenger_name', models.CharField(max_length=40)),
+                ('passenger_email', models.CharField(db_index=True, max_length=40)),
+                ('promoted', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('promoted_at', models.DateTimeField(blank=True, null=True)),
+                ('deleted', models.BooleanField(default=False)),
+                ('flight', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='core.flight')),
+                ('reservation', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='waitlist_entry', to='core.reservation')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('deleted', False), ('promoted', False)), fields=['flight', 'id'], name='waitlist_waiting_fifo_idx')],
+            },
+        ),
+    ]
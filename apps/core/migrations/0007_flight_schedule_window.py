@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-18 19:30
+
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_waitlist'),
+    ]
+
+    operations = [
+        # (airplane =, schedule_window &&) GiST index'i için bigint eşitliği gerekir.
+        BtreeGistExtension(),
+        migrations.AddField(
+            model_name='flight',
+            name='schedule_window',
+            field=django.contrib.postgres.fields.ranges.DateTimeRangeField(blank=True, editable=False, null=True),
+        ),
+        # SCHEDULE_BUFFER = 1h, iki tarafa yarım buffer.
+        migrations.RunSQL(
+            sql="UPDATE core_flight SET schedule_window = tstzrange(departure_time - interval '30 minutes', arrival_time + interval '30 minutes', '[)');",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='flight',
+            name='schedule_window',
+            field=django.contrib.postgres.fields.ranges.DateTimeRangeField(blank=True, editable=False),
+        ),
+        migrations.AddConstraint(
+            model_name='flight',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(condition=models.Q(('deleted', False)), expressions=[('airplane', '='), ('schedule_window', '&&')], name='flight_airplane_schedule_no_overlap', violation_error_message='This airplane has another flight within ±1h window.'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.5 on 2026-10-18 20:10
+
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields
+import django.db.models.constraints
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_flight_schedule_window'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FlightSchedule',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('flight_number', models.CharField(max_length=13, unique=True)),
+                ('departure', models.CharField(max_length=20)),
+                ('destination', models.CharField(max_length=20)),
+                ('departure_local_time', models.TimeField()),
+                ('duration', models.DurationField()),
+                ('timezone', models.CharField(default='UTC', max_length=64)),
+                ('weekdays', django.contrib.postgres.fields.ArrayField(base_field=models.PositiveSmallIntegerField(), size=7)),
+                ('valid_from', models.DateField()),
+                ('valid_until', models.DateField()),
+                ('deleted', models.BooleanField(default=False)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.RemoveConstraint(
+            model_name='flight',
+            name='flight_airplane_schedule_no_overlap',
+        ),
+        migrations.AddField(
+            model_name='flight',
+            name='schedule_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='flightschedule',
+            name='airplane',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='core.airplane'),
+        ),
+        migrations.AddField(
+            model_name='flight',
+            name='schedule',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='flights', to='core.flightschedule'),
+        ),
+        migrations.AddConstraint(
+            model_name='flight',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(condition=models.Q(('deleted', False)), deferrable=django.db.models.constraints.Deferrable['IMMEDIATE'], expressions=[('airplane', '='), ('schedule_window', '&&')], name='flight_airplane_schedule_no_overlap', violation_error_message='This airplane has another flight within ±1h window.'),
+        ),
+        migrations.AddConstraint(
+            model_name='flight',
+            constraint=models.UniqueConstraint(fields=('schedule', 'schedule_date'), name='flight_schedule_date_uniq'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-18 18:13
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension, AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # büyük tabloda yazmaları kilitlememek için index'ler CONCURRENTLY kurulur.
+    atomic = False
+
+    dependencies = [
+        ('core', '0008_flight_schedule'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='flight',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('flight_number'), name='gin_trgm_ops'), name='flight_flight_number_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='flight',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('departure'), name='gin_trgm_ops'), name='flight_departure_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='flight',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('destination'), name='gin_trgm_ops'), name='flight_destination_trgm'),
+        ),
+    ]
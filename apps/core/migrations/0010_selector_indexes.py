@@ -0,0 +1,39 @@
+# Generated by Django 5.2.5 on 2026-10-18 18:14
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('core', '0009_flight_search_trgm'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='flight',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['airplane', 'departure_time', 'arrival_time'], name='flight_airplane_times_active'),
+        ),
+        AddIndexConcurrently(
+            model_name='flight',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['airplane', 'arrival_time'], name='flight_airplane_arr_active'),
+        ),
+        AddIndexConcurrently(
+            model_name='flight',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['departure_time', 'id'], name='flight_departure_active'),
+        ),
+        AddIndexConcurrently(
+            model_name='flight',
+            index=models.Index(condition=models.Q(('deleted', False)), fields=['departure', 'destination', 'departure_time'], name='flight_route_active'),
+        ),
+        AddIndexConcurrently(
+            model_name='reservation',
+            index=models.Index(condition=models.Q(('deleted', False), ('status', True)), fields=['flight', 'id'], name='reservation_flight_active'),
+        ),
+        AddIndexConcurrently(
+            model_name='reservation',
+            index=models.Index(condition=models.Q(('deleted', False), ('status', True)), fields=['created_at', 'id'], name='reservation_created_active'),
+        ),
+    ]
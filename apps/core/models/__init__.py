@@ -1,5 +1,8 @@
 from .airplane import Airplane
 from .flight import Flight
+from .flight_schedule import FlightSchedule
+from .flight_inventory import FlightInventory, FlightInventoryShard
 from .reservation import Reservation
+from .waitlist import WaitlistEntry
 
-__all__ = ["Airplane", "Flight", "Reservation"]
\ No newline at end of file
+__all__ = ["Airplane", "Flight", "FlightInventory", "FlightInventoryShard", "FlightSchedule", "Reservation", "WaitlistEntry"]
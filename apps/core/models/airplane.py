@@ -9,6 +9,8 @@ class Airplane(models.Model):
     production_year = models.PositiveIntegerField(null = False, blank = False, unique = False)
     status = models.BooleanField(default=True)
     deleted = models.BooleanField(default=False, null = False, blank = False)
+    # ETag / If-Modified-Since için; queryset.update() / bulk_update'te elle set edilmeli.
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         indexes = [
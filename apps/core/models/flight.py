@@ -1,8 +1,30 @@
+from datetime import timedelta
+
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.db.models import Deferrable
+from django.contrib.postgres.fields import DateTimeRangeField, RangeOperators
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
 from django.core.exceptions import ValidationError
 
 from .airplane import Airplane
 
+# aynı uçakla iki uçuş arasında olması gereken minimum süre.
+SCHEDULE_BUFFER = timedelta(hours=1)
+SCHEDULE_CONFLICT_CONSTRAINT = "flight_airplane_schedule_no_overlap"
+# arama yapılan kolonlar; trigram index'leri UPPER(kolon) üzerinde, icontains/istartswith aynı ifadeyi üretir.
+SEARCH_FIELDS = ("flight_number", "departure", "destination")
+
+
+def build_schedule_window(departure_time, arrival_time) -> DateTimeTZRange:
+    # iki tarafa yarım buffer: [dep - B/2, arr + B/2) pencereleri çakışmıyorsa
+    # uçuşlar arasında en az B kadar süre vardır (check_conflict ile aynı kural).
+    half = SCHEDULE_BUFFER / 2
+    return DateTimeTZRange(departure_time - half, arrival_time + half, "[)")
+
+
 class Flight(models.Model):
     id = models.BigAutoField(primary_key=True)
     flight_number = models.CharField(unique=True, null=False, blank=False, db_index=True, max_length=20)
@@ -12,10 +34,63 @@ class Flight(models.Model):
     arrival_time = models.DateTimeField(null = False, blank = False, unique = False)
     airplane = models.ForeignKey(Airplane, null = False, blank = False, on_delete=models.PROTECT)
     deleted = models.BooleanField(null = False, blank = False, default = False)
+    # save() ile güncel tutulur; çakışma kontrolünü GiST exclusion constraint yapar.
+    schedule_window = DateTimeRangeField(null = False, blank = True, editable = False)
+    # tekrarlayan programdan üretildiyse
+    schedule = models.ForeignKey("core.FlightSchedule", null = True, blank = True, on_delete=models.PROTECT, related_name="flights")
+    schedule_date = models.DateField(null = True, blank = True)
+    # ETag / If-Modified-Since için; queryset.update() / bulk_update'te elle set edilmeli.
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['departure_time']
-        indexes = [models.Index(fields=['flight_number']), ]
+        indexes = [
+            models.Index(fields=['flight_number']),
+            # çakışma kontrolü / uçağın uçuşları (departure_time sıralı) / bir sonraki uçuş
+            models.Index(fields=['airplane', 'departure_time', 'arrival_time'], condition=models.Q(deleted=False),
+                         name="flight_airplane_times_active"),
+            # has_active_flights_now ve bir önceki uçuş (arrival_time desc)
+            models.Index(fields=['airplane', 'arrival_time'], condition=models.Q(deleted=False),
+                         name="flight_airplane_arr_active"),
+            # varsayılan liste sıralaması ve rota index'inin yüklenmesi (departure_time >= now)
+            models.Index(fields=['departure_time', 'id'], condition=models.Q(deleted=False),
+                         name="flight_departure_active"),
+            models.Index(fields=['departure', 'destination', 'departure_time'], condition=models.Q(deleted=False),
+                         name="flight_route_active"),
+            *[
+                GinIndex(OpClass(Upper(f), name="gin_trgm_ops"), name=f"flight_{f}_trgm")
+                for f in SEARCH_FIELDS
+            ],
+        ]
+        constraints = [
+            ExclusionConstraint(
+                name=SCHEDULE_CONFLICT_CONSTRAINT,
+                expressions=[
+                    ("airplane", RangeOperators.EQUAL),
+                    ("schedule_window", RangeOperators.OVERLAPS),
+                ],
+                condition=models.Q(deleted=False),
+                # program yeniden üretilirken kardeş uçuşlar tek transaction'da kayar; kontrol commit'te de yapılabilsin.
+                deferrable=Deferrable.IMMEDIATE,
+                violation_error_message="This airplane has another flight within ±1h window.",
+            ),
+            models.UniqueConstraint(fields=["schedule", "schedule_date"], name="flight_schedule_date_uniq"),
+        ]
+
+    def refresh_schedule_window(self) -> None:
+        self.schedule_window = build_schedule_window(self.departure_time, self.arrival_time)
+
+    def save(self, *args, **kwargs):
+        self.refresh_schedule_window()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            extra = ["updated_at"]
+            if {"departure_time", "arrival_time"} & set(update_fields):
+                extra.append("schedule_window")
+            kwargs["update_fields"] = [*update_fields, *extra]
+
+        super().save(*args, **kwargs)
 
     def clean(self):
         if self.arrival_time <= self.departure_time:
@@ -0,0 +1,49 @@
+from django.db import models
+
+from .flight import Flight
+
+
+class FlightInventory(models.Model):
+    """
+    Uçuş başına denormalize koltuk sayacı.
+    Rezervasyonlar COUNT(*) yerine tek bir koşullu UPDATE ile bu satırı artırır/azaltır.
+    """
+    flight = models.OneToOneField(Flight, primary_key=True, on_delete=models.CASCADE, related_name="inventory")
+    capacity = models.PositiveIntegerField(null = False, blank = False)
+    seats_booked = models.PositiveIntegerField(null = False, blank = False, default = 0)
+    # 0: normal mod. >0: hot-flight modu, kalan kapasite bu kadar shard'a bölünmüştür.
+    shard_count = models.PositiveSmallIntegerField(null = False, blank = False, default = 0)
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(condition=models.Q(seats_booked__gte=0), name="inventory_seats_booked_gte_0"),
+        ]
+
+    @property
+    def seats_remaining(self) -> int:
+        # hot modda shard'lardaki koltuklar dahil değildir, bkz. inventory_services.booked_seats
+        return max(self.capacity - self.seats_booked, 0)
+
+    def __str__(self):
+        return f"{self.flight_id}: {self.seats_booked}/{self.capacity}"
+
+
+class FlightInventoryShard(models.Model):
+    """
+    Hot-flight modunda uçuşun kalan kapasitesinden bir pay.
+    Rezervasyonlar rastgele bir shard'ın satırını kilitler, böylece aynı uçuşa gelen istekler paralel ilerler.
+    Toplam dolu koltuk = FlightInventory.seats_booked + sum(shard.seats_booked).
+    """
+    id = models.BigAutoField(primary_key=True)
+    flight = models.ForeignKey(Flight, on_delete=models.CASCADE, related_name="inventory_shards")
+    shard_no = models.PositiveSmallIntegerField(null = False, blank = False)
+    capacity = models.PositiveIntegerField(null = False, blank = False, default = 0)
+    seats_booked = models.PositiveIntegerField(null = False, blank = False, default = 0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["flight", "shard_no"], name="inventory_shard_flight_shard_no_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.flight_id}#{self.shard_no}: {self.seats_booked}/{self.capacity}"
@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.core.exceptions import ValidationError
+from django.db import models
+
+from .airplane import Airplane
+
+# Flight.flight_number'a "-YYMMDD" eklenir, toplam 20 karakteri geçmemeli.
+SCHEDULE_NUMBER_MAX_LENGTH = 13
+
+
+class FlightSchedule(models.Model):
+    """
+    Tekrarlayan uçuş tanımı: örn. TK123 IST→ESB, Pzt/Çar/Cum 08:00, 6 ay boyunca.
+    Her gün için ayrı bir Flight üretilir (flight_number = "<numara>-YYMMDD").
+    weekdays: 0 = Pazartesi ... 6 = Pazar.
+    """
+    id = models.BigAutoField(primary_key=True)
+    flight_number = models.CharField(unique=True, null=False, blank=False, max_length=SCHEDULE_NUMBER_MAX_LENGTH)
+    departure = models.CharField(max_length = 20, null = False, blank = False)
+    destination = models.CharField(max_length = 20, null = False, blank = False)
+    departure_local_time = models.TimeField(null = False, blank = False)
+    duration = models.DurationField(null = False, blank = False)
+    timezone = models.CharField(max_length = 64, null = False, blank = False, default = settings.TIME_ZONE)
+    weekdays = ArrayField(models.PositiveSmallIntegerField(), size=7)
+    valid_from = models.DateField(null = False, blank = False)
+    valid_until = models.DateField(null = False, blank = False)
+    airplane = models.ForeignKey(Airplane, null = False, blank = False, on_delete=models.PROTECT)
+    deleted = models.BooleanField(null = False, blank = False, default = False)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        return f"{self.flight_number} {self.departure}->{self.destination}"
+
+    def clean(self):
+        if self.valid_until < self.valid_from:
+            raise ValidationError({"valid_until": "Must be on or after valid_from."})
+
+        if not self.weekdays or any(d < 0 or d > 6 for d in self.weekdays):
+            raise ValidationError({"weekdays": "Weekdays must be between 0 (Monday) and 6 (Sunday)."})
+
+        if self.duration.total_seconds() <= 0:
+            raise ValidationError({"duration": "Duration must be positive."})
+
+        if self.destination.strip().upper() == self.departure.strip().upper():
+            raise ValidationError({"destination": "Destination must differ from departure."})
@@ -1,12 +1,13 @@
 from django.db import models
-import uuid
 from django.core.exceptions import ValidationError
 
 from .flight import Flight
+from .reservation_code import next_reservation_code
 
 def generate_reservation_code() -> str:
-    # sonradan, db seq'ten çekeriz.
-    return uuid.uuid4().hex[:8].upper()
+    # db sequence'ten process başına blok alınır, Feistel + check karakteri ile kodlanır.
+    # çakışma olmadığı için retry / unique sorgusu gerekmez.
+    return next_reservation_code()
 
 
 class Reservation(models.Model):
@@ -18,3 +19,14 @@ class Reservation(models.Model):
     status = models.BooleanField(default=True)
     created_at = models.DateTimeField(editable=False, auto_now_add=True)
     deleted = models.BooleanField(default=False, null=False, blank=False)
+    # ETag / If-Modified-Since için; queryset.update() / bulk_update'te elle set edilmeli.
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # aktif rezervasyon sayımı, Exists(...) alt sorguları ve uçuşun rezervasyon listesi (id sıralı)
+            models.Index(fields=["flight", "id"], condition=models.Q(status=True, deleted=False),
+                         name="reservation_flight_active"),
+            models.Index(fields=["created_at", "id"], condition=models.Q(status=True, deleted=False),
+                         name="reservation_created_active"),
+        ]
@@ -0,0 +1,112 @@
+import hashlib
+import os
+import threading
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connection
+
+# Crockford base32: I, L, O, U yok; okunurken karışmasın.
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+BASE = len(ALPHABET)
+
+CODE_BITS = 40               # 8 karakter * 5 bit
+CODE_LENGTH = CODE_BITS // 5
+HALF_BITS = CODE_BITS // 2
+HALF_MASK = (1 << HALF_BITS) - 1
+ROUNDS = 4
+
+SEQUENCE_NAME = "core_reservation_code_seq"
+# migration'daki INCREMENT BY ile aynı olmalı: her nextval() bir bloğun başlangıcını verir.
+BLOCK_SIZE = 1000
+
+
+@lru_cache(maxsize=ROUNDS)
+def _round_key(i: int) -> bytes:
+    key = getattr(settings, "RESERVATION_CODE_KEY", settings.SECRET_KEY)
+    return hashlib.blake2b(f"{key}:{i}".encode(), digest_size=16).digest()
+
+
+def _round(value: int, key: bytes) -> int:
+    digest = hashlib.blake2b(value.to_bytes(4, "big"), key=key, digest_size=4).digest()
+    return int.from_bytes(digest, "big") & HALF_MASK
+
+
+def permute(n: int) -> int:
+    """
+    40 bitlik Feistel ağı: birebir (bijective) olduğu için farklı sıra numaraları
+    her zaman farklı kod verir, ama ardışık numaralar tahmin edilemez kodlara dağılır.
+    """
+    left, right = n >> HALF_BITS, n & HALF_MASK
+    for i in range(ROUNDS):
+        left, right = right, left ^ _round(right, _round_key(i))
+    return (left << HALF_BITS) | right
+
+
+def check_char(payload: str) -> str:
+    # Luhn mod N: tek karakter hatalarını ve komşu yer değiştirmelerini yakalar.
+    factor = 2
+    total = 0
+    for ch in reversed(payload):
+        addend = factor * ALPHABET.index(ch)
+        factor = 1 if factor == 2 else 2
+        total += addend // BASE + addend % BASE
+    return ALPHABET[(BASE - total % BASE) % BASE]
+
+
+def encode(n: int) -> str:
+    value = permute(n)
+    chars = []
+    for _ in range(CODE_LENGTH):
+        value, rem = divmod(value, BASE)
+        chars.append(ALPHABET[rem])
+    payload = "".join(reversed(chars))
+    return payload + check_char(payload)
+
+
+def is_valid_code(code: str) -> bool:
+    code = (code or "").strip().upper()
+    if len(code) != CODE_LENGTH + 1 or any(ch not in ALPHABET for ch in code):
+        return False
+    return check_char(code[:-1]) == code[-1]
+
+
+class BlockAllocator:
+    """
+    Process başına sequence bloğu. nextval() BLOCK_SIZE adım attığı için her çağrı
+    [start, start + BLOCK_SIZE) aralığını bu process'e ayırır; blok bitene kadar DB'ye gidilmez.
+    fork sonrası (celery/gunicorn worker) pid değişince blok sıfırlanır, iki process aynı bloğu kullanmaz.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = None
+        self._next = 0
+        self._end = 0
+
+    def _fetch_block(self) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT nextval(%s)", [SEQUENCE_NAME])
+            start = cursor.fetchone()[0]
+        self._next = start
+        self._end = start + BLOCK_SIZE
+
+    def next_id(self) -> int:
+        with self._lock:
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._next = self._end = 0
+
+            if self._next >= self._end:
+                self._fetch_block()
+
+            value = self._next
+            self._next += 1
+            return value
+
+
+allocator = BlockAllocator()
+
+
+def next_reservation_code() -> str:
+    return encode(allocator.next_id())
@@ -0,0 +1,25 @@
+from django.db import models
+
+from .flight import Flight
+from .reservation import Reservation
+
+
+class WaitlistEntry(models.Model):
+    """
+    Dolu uçuş için FIFO bekleme listesi kaydı. Sıra id'ye göredir.
+    Koltuk boşalınca promote edilir ve oluşan rezervasyona bağlanır.
+    """
+    id = models.BigAutoField(primary_key=True, editable=False)
+    flight = models.ForeignKey(Flight, null = False, blank = False, on_delete=models.PROTECT)
+    passenger_name = models.CharField(null=False, blank=False, max_length=40)
+    passenger_email = models.CharField(null=False, blank=False, db_index=True, max_length=40)
+    promoted = models.BooleanField(default=False)
+    reservation = models.OneToOneField(Reservation, null=True, blank=True, on_delete=models.PROTECT, related_name="waitlist_entry")
+    created_at = models.DateTimeField(editable=False, auto_now_add=True)
+    promoted_at = models.DateTimeField(null=True, blank=True)
+    deleted = models.BooleanField(default=False, null=False, blank=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["flight", "id"], condition=models.Q(promoted=False, deleted=False), name="waitlist_waiting_fifo_idx"),
+        ]
@@ -0,0 +1,128 @@
+"""
+Selector sorgularının EXPLAIN planları: check_query_plans komutu ve apps.core.tests.test_query_plans ortak kullanır.
+"""
+import json
+from datetime import timedelta
+
+from django.db import connection
+from django.utils import timezone
+
+from apps.core.models import Airplane, Flight, Reservation, WaitlistEntry
+from apps.core.selectors.airplane_selector import list_available_airplanes
+from apps.core.selectors.flight_selector import list_flights
+from apps.core.selectors.reservation_selector import list_reservations
+from apps.core.selectors.waitlist_selector import list_waitlist_entries
+
+# bu tablolarda Seq Scan görülürse plan regresyonu sayılır (airplane gibi küçük tablolar hariç).
+HOT_TABLES = {Flight._meta.db_table, Reservation._meta.db_table, WaitlistEntry._meta.db_table}
+
+
+def plan_cases(airplane_id: int, flight: Flight, email: str):
+    now = timezone.now()
+    window_start = flight.departure_time + timedelta(days=3650)
+    return [
+        ("reservations.count_active",
+         Reservation.objects.filter(flight_id=flight.id, status=True, deleted=False)),
+        ("reservations.list_by_flight", list_reservations(flight_id=flight.id)),
+        ("reservations.list_by_email", list_reservations(passenger_email=email)),
+        ("reservations.list_recent", list_reservations(ordering="-created_at")[:20]),
+        ("flights.conflict",
+         Flight.objects.filter(airplane_id=airplane_id, deleted=False,
+                               schedule_window__overlap=flight.schedule_window)),
+        ("flights.list_by_airplane", list_flights(airplane_id=airplane_id)[:20]),
+        ("flights.active_now", list_flights(airplane_id=airplane_id, arrival_time_min=now)),
+        ("flights.upcoming", list_flights(departure_time_min=now)[:20]),
+        ("flights.route", list_flights(departure=flight.departure, destination=flight.destination)[:20]),
+        # tam uçuş numarası: seed'de tüm numaralar "PL000..." ile başlar, kısa bir önek her satırı eşler
+        # ve planner haklı olarak Seq Scan seçer.
+        ("flights.search", list_flights(search=flight.flight_number)[:20]),
+        ("flights.search_prefix", list_flights(search=flight.flight_number, search_mode="prefix")[:20]),
+        ("airplanes.available",
+         list_available_airplanes(start=window_start, end=window_start + timedelta(hours=2))),
+        ("waitlist.queue", list_waitlist_entries(flight_id=flight.id)[:20]),
+    ]
+
+
+def seq_scans(plan: dict) -> list[str]:
+    found = []
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") in HOT_TABLES:
+            found.append(node["Relation Name"])
+        stack.extend(node.get("Plans", []))
+    return found
+
+
+def analyze() -> None:
+    # planner istatistikleri seed'den sonra güncel olmalı.
+    with connection.cursor() as cursor:
+        for model in (Airplane, Flight, Reservation, WaitlistEntry):
+            cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+
+def explain_cases():
+    """
+    Her selector sorgusu için (ad, plan, Seq Scan görülen sıcak tablolar). Veri yoksa None.
+    """
+    flight = Flight.objects.filter(deleted=False).order_by("id").first()
+    reservation = Reservation.objects.order_by("id").first()
+    if flight is None or reservation is None:
+        return None
+
+    results = []
+    for name, qs in plan_cases(flight.airplane_id, flight, reservation.passenger_email):
+        plan = json.loads(qs.explain(format="json"))[0]["Plan"]
+        results.append((name, plan, seq_scans(plan)))
+    return results
+
+
+def seed_plan_data(count: int) -> None:
+    airplanes = Airplane.objects.bulk_create([
+        Airplane(tail_number=f"PLAN-{i:05d}", model=f"M{i % 7}", capacity=180, production_year=2015)
+        for i in range(max(count // 200, 10))
+    ])
+
+    start = timezone.now() - timedelta(days=365)
+    airports = ["IST", "ESB", "ADB", "AYT", "TZX", "DLM", "GZT", "VAN"]
+
+    flights = []
+    for i in range(count):
+        airplane = airplanes[i % len(airplanes)]
+        # uçak başına 6 saat arayla: buffer kuralı ile çakışmaz.
+        dep = start + timedelta(hours=6 * (i // len(airplanes)))
+        flight = Flight(
+            airplane=airplane,
+            flight_number=f"PL{i:07d}",
+            departure=airports[i % len(airports)],
+            destination=airports[(i + 1 + (i // len(airports)) % (len(airports) - 1)) % len(airports)],
+            departure_time=dep,
+            arrival_time=dep + timedelta(hours=2),
+            deleted=i % 20 == 0,
+        )
+        flight.refresh_schedule_window()
+        flights.append(flight)
+    Flight.objects.bulk_create(flights, batch_size=2000)
+
+    Reservation.objects.bulk_create([
+        Reservation(
+            flight=flight,
+            passenger_name=f"Passenger {flight.id}-{n}",
+            passenger_email=f"p{flight.id}-{n}@example.com",
+            status=n != 0,
+        )
+        for flight in flights
+        for n in range(5)
+    ], batch_size=5000)
+
+    # boş (ama ANALYZE edilmiş) tabloda her plan Seq Scan olur; kuyruk sorgusu gerçekçi veriyle ölçülür.
+    WaitlistEntry.objects.bulk_create([
+        WaitlistEntry(
+            flight=flight,
+            passenger_name=f"Waiting {flight.id}-{n}",
+            passenger_email=f"w{flight.id}-{n}@example.com",
+            promoted=n == 0,
+        )
+        for flight in flights
+        for n in range(3)
+    ], batch_size=5000)
@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import Optional, Sequence
 
-from django.db.models import QuerySet, Q
+from django.db.models import QuerySet, Q, Exists, OuterRef, Subquery
 
-from apps.core.models import Airplane
+from apps.core.models import Airplane, Flight
+from apps.core.models.flight import build_schedule_window
 
 def list_airplanes(
         *,
@@ -41,3 +42,55 @@ def list_airplanes(
     return qs
 
 
+async def aget_airplane(*, airplane_id: int, deleted: Optional[bool] = False) -> Airplane:
+    return await Airplane.objects.aget(id=airplane_id, deleted=deleted)
+
+
+async def alist_airplanes(*, offset: int = 0, limit: int = 10, columns: Sequence[str] = (),
+                          ordering: Optional[str] = None, **filters) -> list:
+    """
+    list_airplanes'ın async karşılığı: tek sayfayı aiterator ile okur.
+    columns verilirse values() dict'leri, verilmezse Airplane instance'ları döner.
+    """
+    qs = list_airplanes(**filters)
+    if ordering in ("id", "-id"):
+        qs = qs.order_by(ordering)
+    if columns:
+        qs = qs.values(*columns)
+    return [row async for row in qs[offset:offset + limit].aiterator()]
+
+
+async def acount_airplanes(*, ordering: Optional[str] = None, **filters) -> int:
+    return await list_airplanes(**filters).acount()
+
+
+def list_available_airplanes(
+        *,
+        start,
+        end,
+        min_capacity: Optional[int] = None,
+        model: Optional[str] = None,
+) -> QuerySet[Airplane]:
+    """
+    [start, end) aralığında, ±1h buffer kuralına göre yeni bir uçuş alabilecek aktif uçaklar.
+    Tek sorgu: çakışma NOT EXISTS ile (GiST index), komşu uçuşlar subquery ile annotate edilir.
+    """
+    window = build_schedule_window(start, end)
+    active_flights = Flight.objects.filter(airplane_id=OuterRef("pk"), deleted=False)
+
+    busy = active_flights.filter(schedule_window__overlap=window)
+
+    previous_flight = (active_flights
+                       .filter(arrival_time__lte=start)
+                       .order_by("-arrival_time")
+                       .values("id")[:1])
+
+    next_flight = (active_flights
+                   .filter(departure_time__gte=end)
+                   .order_by("departure_time")
+                   .values("id")[:1])
+
+    return (list_airplanes(min_capacity=min_capacity, model=model, status=True, deleted=False)
+            .filter(~Exists(busy))
+            .annotate(previous_flight_id=Subquery(previous_flight), next_flight_id=Subquery(next_flight))
+            .order_by("id"))
@@ -1,8 +1,13 @@
-from typing import Optional
+from typing import Optional, Sequence
 
+from django.contrib.postgres.search import TrigramSimilarity
 from django.db.models import Q, QuerySet
+from django.db.models.functions import Greatest, Upper
 
 from apps.core.models import Flight
+from apps.core.models.flight import SEARCH_FIELDS
+
+SEARCH_MODES = ("contains", "prefix")
 
 def get_flight(
         *,
@@ -12,6 +17,14 @@ def get_flight(
     return Flight.objects.select_related("airplane").get(id=flight_id, deleted=deleted)
 
 
+async def aget_flight(
+        *,
+        flight_id: int,
+        deleted: Optional[bool] = False) -> Flight:
+
+    return await Flight.objects.select_related("airplane").aget(id=flight_id, deleted=deleted)
+
+
 def list_flights(
         *,
         airplane_id: Optional[int] = None,
@@ -24,7 +37,9 @@ def list_flights(
         arrival_time_min=None,
         arrival_time_max=None,
         search: Optional[str] = None,
+        search_mode: str = "contains",
         deleted: Optional[bool] = False,
+        ordering: Optional[str] = None,
 ) -> QuerySet[Flight]:
 
     qs = Flight.objects.all()
@@ -59,14 +74,37 @@ def list_flights(
         qs = qs.filter(deleted=False)
 
     if search:
+        # UPPER(kolon) LIKE ... gin_trgm_ops index'lerini kullanır (BitmapOr), tablo taranmaz.
         s = search.strip()
-        qs = qs.filter(
-            Q(flight_number__icontains=s) |
-            Q(departure__icontains=s) |
-            Q(destination__icontains=s)
-        )
+        lookup = "istartswith" if search_mode == "prefix" else "icontains"
+
+        q = Q()
+        for f in SEARCH_FIELDS:
+            q |= Q(**{f"{f}__{lookup}": s})
+        qs = qs.filter(q)
+
+        # sıralama sadece eşleşen satırlar üzerinde hesaplanır.
+        qs = qs.annotate(rank=Greatest(*[TrigramSimilarity(Upper(f), s.upper()) for f in SEARCH_FIELDS]))
+
+        if ordering is None or ordering == "relevance":
+            return qs.order_by("-rank", "departure_time", "id")
+
+    if ordering and ordering != "relevance":
+        return qs.order_by(ordering, "id")
+
+    return qs.order_by("departure_time")
+
+
+async def alist_flights(*, offset: int = 0, limit: int = 10, columns: Sequence[str] = (), **filters) -> list:
+    """
+    list_flights'ın async karşılığı: tek sayfayı aiterator ile okur.
+    columns verilirse values() dict'leri, verilmezse Flight instance'ları döner.
+    """
+    qs = list_flights(**filters)
+    if columns:
+        qs = qs.values(*columns)
+    return [row async for row in qs[offset:offset + limit].aiterator()]
 
-    qs = qs.order_by(
-        "departure_time")
 
-    return qs
+async def acount_flights(**filters) -> int:
+    return await list_flights(**filters).order_by().acount()
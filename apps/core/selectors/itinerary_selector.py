@@ -0,0 +1,218 @@
+import bisect
+import threading
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Iterable, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from apps.core.models import Flight
+
+VERSION_KEY = "routes:version"
+CHANGE_KEY = "routes:change:{}"
+CHANGE_TTL = 24 * 60 * 60
+# bundan fazla değişiklik geride kalan process delta yerine tamamen yeniden kurar.
+MAX_DELTA = 500
+
+LEG_FIELDS = ("id", "flight_number", "departure", "destination", "departure_time", "arrival_time")
+
+
+@dataclass(frozen=True)
+class Leg:
+    id: int
+    flight_number: str
+    departure: str
+    destination: str
+    departure_time: timezone.datetime
+    arrival_time: timezone.datetime
+
+
+class RouteIndex:
+    """
+    Gelecekteki uçuşlardan kurulan rota grafı: kalkış havalimanı -> kalkış saatine göre sıralı bacaklar.
+    Process içi tutulur; flight servisleri her değişikliği cache'teki sürüm sayacına ve
+    değişiklik listesine yazar, diğer process'ler aramadan önce sadece o uçuşları yeniden okur.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._legs: dict[int, Leg] = {}
+        self._by_origin: dict[str, list[tuple]] = {}
+        self._version: Optional[int] = None
+
+    # --- bakım ---
+
+    def _insert(self, leg: Leg) -> None:
+        self._legs[leg.id] = leg
+        bisect.insort(self._by_origin.setdefault(leg.departure.upper(), []), (leg.departure_time, leg.id))
+
+    def _remove(self, flight_id: int) -> None:
+        leg = self._legs.pop(flight_id, None)
+        if leg is None:
+            return
+        bucket = self._by_origin.get(leg.departure.upper(), [])
+        i = bisect.bisect_left(bucket, (leg.departure_time, leg.id))
+        if i < len(bucket) and bucket[i] == (leg.departure_time, leg.id):
+            del bucket[i]
+
+    @staticmethod
+    def _load(flight_ids: Optional[Iterable[int]] = None) -> list[Leg]:
+        qs = Flight.objects.filter(deleted=False, departure_time__gte=timezone.now())
+        if flight_ids is not None:
+            qs = qs.filter(id__in=list(flight_ids))
+        return [Leg(*row) for row in qs.values_list(*LEG_FIELDS).iterator(chunk_size=2000)]
+
+    def rebuild(self) -> None:
+        version = current_version()
+        legs = self._load()
+        with self._lock:
+            self._legs.clear()
+            self._by_origin.clear()
+            for leg in legs:
+                self._insert(leg)
+            self._version = version
+
+    def apply(self, flight_ids: Iterable[int]) -> None:
+        flight_ids = set(flight_ids)
+        legs = self._load(flight_ids)
+        with self._lock:
+            for flight_id in flight_ids:
+                self._remove(flight_id)
+            for leg in legs:
+                self._insert(leg)
+            self._prune(timezone.now())
+
+    def _prune(self, now) -> None:
+        # kalkmış uçuşlar: bucket'lar kalkış saatine göre sıralı, baştan kesilir.
+        for bucket in self._by_origin.values():
+            i = bisect.bisect_left(bucket, (now, 0))
+            for _, flight_id in bucket[:i]:
+                self._legs.pop(flight_id, None)
+            del bucket[:i]
+
+    def sync(self) -> None:
+        version = current_version()
+        with self._lock:
+            local = self._version
+
+        if local is None or version < local or version - local > MAX_DELTA:
+            self.rebuild()
+            return
+
+        if version == local:
+            with self._lock:
+                self._prune(timezone.now())
+            return
+
+        keys = [CHANGE_KEY.format(v) for v in range(local + 1, version + 1)]
+        changes = cache.get_many(keys)
+        if len(changes) != len(keys):
+            # değişiklik kaydı düşmüş (TTL/eviction): güvenli yol tam yeniden kurmak.
+            self.rebuild()
+            return
+
+        self.apply(flight_id for ids in changes.values() for flight_id in ids)
+        with self._lock:
+            self._version = max(self._version or 0, version)
+
+    # --- arama ---
+
+    def departures(self, origin: str, earliest, latest) -> list[Leg]:
+        bucket = self._by_origin.get(origin.upper(), [])
+        lo = bisect.bisect_left(bucket, (earliest, 0))
+        hi = bisect.bisect_right(bucket, (latest, float("inf")))
+        return [self._legs[flight_id] for _, flight_id in bucket[lo:hi]]
+
+    def search(self, *, origin: str, destination: str, day_start, day_end,
+               min_connection: timedelta, max_connection: timedelta, max_stops: int = 2) -> list[list[Leg]]:
+        destination = destination.upper()
+        results: list[list[Leg]] = []
+
+        def walk(path: list[Leg], visited: set[str]):
+            last = path[-1]
+            if last.destination.upper() == destination:
+                results.append(list(path))
+                return
+            if len(path) > max_stops:
+                return
+            for leg in self.departures(last.destination,
+                                       last.arrival_time + min_connection,
+                                       last.arrival_time + max_connection):
+                if leg.destination.upper() in visited:
+                    continue
+                path.append(leg)
+                visited.add(leg.destination.upper())
+                walk(path, visited)
+                visited.discard(leg.destination.upper())
+                path.pop()
+
+        with self._lock:
+            for first in self.departures(origin, day_start, day_end):
+                walk([first], {origin.upper(), first.destination.upper()})
+
+        return results
+
+
+route_index = RouteIndex()
+
+
+def current_version() -> int:
+    return cache.get(VERSION_KEY, 0)
+
+
+def record_route_changes(flight_ids: Iterable[int]) -> None:
+    """
+    Flight servisleri çağırır. Commit sonrası sürüm artırılır ve değişen id'ler yazılır;
+    bu process'in index'i hemen, diğerleri bir sonraki aramada güncellenir.
+    """
+    flight_ids = list(flight_ids)
+    if not flight_ids:
+        return
+
+    def _publish():
+        cache.add(VERSION_KEY, 0, timeout=None)
+        version = cache.incr(VERSION_KEY)
+        cache.set(CHANGE_KEY.format(version), flight_ids, timeout=CHANGE_TTL)
+        if route_index._version is not None:
+            route_index.sync()
+
+    transaction.on_commit(_publish)
+
+
+def search_itineraries(
+        *,
+        origin: str,
+        destination: str,
+        date,
+        min_connection_minutes: int = 45,
+        max_connection_minutes: int = 360,
+        max_stops: int = 2,
+        limit: int = 20,
+) -> list[list[Leg]]:
+
+    route_index.sync()
+
+    tz = timezone.get_current_timezone()
+    day_start = timezone.make_aware(timezone.datetime.combine(date, timezone.datetime.min.time()), tz)
+    day_end = day_start + timedelta(days=1)
+    # index bir sonraki prune'a kadar kalkmış uçuş tutabilir; ilk bacak şimdiden sonra olmalı
+    # (aktarmalar bir önceki bacağın inişinden sonra olduğu için onlar da geçmişte kalmaz).
+    day_start = max(day_start, timezone.now())
+    if day_start >= day_end:
+        return []
+
+    itineraries = route_index.search(
+        origin=origin,
+        destination=destination,
+        day_start=day_start,
+        day_end=day_end,
+        min_connection=timedelta(minutes=min_connection_minutes),
+        max_connection=timedelta(minutes=max_connection_minutes),
+        max_stops=max_stops,
+    )
+
+    # sıralama: toplam süre, aktarma sayısı, kalkış saati.
+    itineraries.sort(key=lambda legs: (legs[-1].arrival_time - legs[0].departure_time, len(legs), legs[0].departure_time))
+    return itineraries[:limit]
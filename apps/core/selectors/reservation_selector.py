@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Sequence
 
 from django.db.models import QuerySet
 
@@ -13,6 +13,8 @@ def list_reservations(
     passenger_name: Optional[str] = None,
     status: Optional[bool] = True,
     deleted: Optional[bool] = False,
+    departure_time_min=None,
+    departure_time_max=None,
     ordering: Optional[str] = None,
 ) -> QuerySet[Reservation]:
 
@@ -36,6 +38,32 @@ def list_reservations(
     if deleted is not None:
         qs = qs.filter(deleted=deleted)
 
+    if departure_time_min:
+        qs = qs.filter(flight__departure_time__gte=departure_time_min)
+
+    if departure_time_max:
+        qs = qs.filter(flight__departure_time__lt=departure_time_max)
+
     allowed = {"id", "-id", "created_at", "-created_at"}
 
-    return qs.order_by(ordering if ordering in allowed else "id")
\ No newline at end of file
+    return qs.order_by(ordering if ordering in allowed else "id")
+
+
+async def aget_reservation(*, reservation_id: int) -> Reservation:
+    # detay nested flight (ve flight.airplane_id) içerir; async context'te lazy FK yüklenemez.
+    return await Reservation.objects.select_related("flight__airplane").aget(id=reservation_id)
+
+
+async def alist_reservations(*, offset: int = 0, limit: int = 10, columns: Sequence[str] = (), **filters) -> list:
+    """
+    list_reservations'ın async karşılığı: tek sayfayı aiterator ile okur.
+    columns verilirse values() dict'leri, verilmezse Reservation instance'ları döner.
+    """
+    qs = list_reservations(**filters)
+    if columns:
+        qs = qs.values(*columns)
+    return [row async for row in qs[offset:offset + limit].aiterator()]
+
+
+async def acount_reservations(**filters) -> int:
+    return await list_reservations(**filters).order_by().acount()
@@ -0,0 +1,34 @@
+from typing import Optional
+
+from django.db.models import QuerySet
+
+from apps.core.models import FlightSchedule
+
+
+def list_flight_schedules(
+        *,
+        airplane_id: Optional[int] = None,
+        departure: Optional[str] = None,
+        destination: Optional[str] = None,
+        active_on=None,
+        deleted: Optional[bool] = False,
+) -> QuerySet[FlightSchedule]:
+
+    qs = FlightSchedule.objects.all()
+
+    if airplane_id is not None:
+        qs = qs.filter(airplane_id=airplane_id)
+
+    if departure:
+        qs = qs.filter(departure=departure)
+
+    if destination:
+        qs = qs.filter(destination=destination)
+
+    if active_on:
+        qs = qs.filter(valid_from__lte=active_on, valid_until__gte=active_on)
+
+    if deleted is not None:
+        qs = qs.filter(deleted=deleted)
+
+    return qs.order_by("id")
@@ -0,0 +1,36 @@
+from typing import Optional
+
+from django.db.models import QuerySet
+
+from apps.core.models import WaitlistEntry
+
+
+def list_waitlist_entries(
+    *,
+    flight_id: Optional[int] = None,
+    passenger_email: Optional[str] = None,
+    promoted: Optional[bool] = False,
+    deleted: Optional[bool] = False,
+) -> QuerySet[WaitlistEntry]:
+
+    qs = WaitlistEntry.objects.all()
+
+    if flight_id is not None:
+        qs = qs.filter(flight_id=flight_id)
+
+    if passenger_email:
+        qs = qs.filter(passenger_email=passenger_email)
+
+    if promoted is not None:
+        qs = qs.filter(promoted=promoted)
+
+    if deleted is not None:
+        qs = qs.filter(deleted=deleted)
+
+    return qs.order_by("id")
+
+
+def waitlist_position(entry: WaitlistEntry) -> Optional[int]:
+    if entry.promoted or entry.deleted:
+        return None
+    return list_waitlist_entries(flight_id=entry.flight_id).filter(id__lt=entry.id).count() + 1
@@ -5,8 +5,10 @@ from django.db import transaction
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
+from apps.common.drf.response_cache import bump_cache_version, AIRPLANE
 from apps.core.models import Airplane
 from apps.core.selectors.flight_selector import list_flights
+from apps.core.services.inventory_services import sync_inventory_capacity
 
 
 @dataclass(frozen=True)
@@ -31,6 +33,7 @@ def create_airplane(inp: AirplaneCreateInput):
 
     airplane.full_clean()
     airplane.save()
+    bump_cache_version(AIRPLANE)
 
     return airplane
 
@@ -58,7 +61,12 @@ def update_airplane(airplane: Airplane, inp: AirplaneUpdateInput):
 
     airplane.full_clean()
 
-    airplane.save(update_fields=list(changes.keys()))
+    airplane.save(update_fields=[*changes.keys(), "updated_at"])
+
+    if "capacity" in changes:
+        sync_inventory_capacity(capacity=airplane.capacity, airplane_id=airplane.id)
+
+    bump_cache_version(AIRPLANE)
     return airplane
 
 
@@ -81,6 +89,7 @@ def soft_delete_airplane(airplane: Airplane):
     airplane.deleted = False
 
     airplane.save()
+    bump_cache_version(AIRPLANE)
 
 
 
@@ -0,0 +1,103 @@
+import bisect
+import heapq
+import threading
+import time
+from contextlib import contextmanager
+
+# milisaniye cinsinden histogram üst sınırları, son bucket +inf.
+BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+# bellek sınırı: bundan fazla uçuş izlenirse en az bekleyen atılır.
+MAX_TRACKED_FLIGHTS = 5000
+
+PHASE_OPEN_CHECK = "open_check"
+PHASE_HOLDS = "holds"
+PHASE_INVENTORY = "inventory_update"
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": {
+                **{f"le_{b}": c for b, c in zip(BUCKETS_MS, self.counts)},
+                "le_inf": self.counts[-1],
+            },
+        }
+
+
+class ContentionMetrics:
+    """
+    Process içi, uçuş ve faz bazlı bekleme süresi histogramları.
+    Her worker kendi istatistiğini tutar; endpoint o isteği karşılayan process'i gösterir.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[int, dict[str, _Histogram]] = {}
+        self._totals: dict[int, float] = {}
+
+    def observe(self, flight_id: int, phase: str, ms: float) -> None:
+        with self._lock:
+            phases = self._flights.get(flight_id)
+            if phases is None:
+                if len(self._flights) >= MAX_TRACKED_FLIGHTS:
+                    self._evict()
+                phases = self._flights[flight_id] = {}
+            hist = phases.get(phase)
+            if hist is None:
+                hist = phases[phase] = _Histogram()
+            hist.observe(ms)
+            self._totals[flight_id] = self._totals.get(flight_id, 0.0) + ms
+
+    def _evict(self) -> None:
+        coldest = min(self._totals, key=self._totals.get)
+        del self._totals[coldest]
+        del self._flights[coldest]
+
+    def hottest(self, k: int = 10, phase: str = PHASE_INVENTORY) -> list[dict]:
+        with self._lock:
+            top = heapq.nlargest(
+                k,
+                ((h[phase].total_ms, fid) for fid, h in self._flights.items() if phase in h),
+            )
+            return [{"flight_id": fid, "phase": phase, **self._flights[fid][phase].to_dict()} for _, fid in top]
+
+    def flight(self, flight_id: int) -> dict:
+        with self._lock:
+            phases = self._flights.get(flight_id, {})
+            return {phase: hist.to_dict() for phase, hist in phases.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._flights.clear()
+            self._totals.clear()
+
+
+metrics = ContentionMetrics()
+
+
+@contextmanager
+def measure(flight_id: int, phase: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.observe(flight_id, phase, (time.perf_counter() - started) * 1000)
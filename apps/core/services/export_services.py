@@ -0,0 +1,87 @@
+import csv
+import json
+from typing import Iterable, Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+
+from apps.core.selectors.reservation_selector import list_reservations
+
+EXPORT_FORMATS = ("csv", "ndjson")
+EXPORT_CHUNK_SIZE = 2000
+
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+# çıktı kolonu -> values() yolu
+MANIFEST_COLUMNS = (
+    ("flight_id", "flight_id"),
+    ("flight_number", "flight__flight_number"),
+    ("departure", "flight__departure"),
+    ("destination", "flight__destination"),
+    ("departure_time", "flight__departure_time"),
+    ("reservation_id", "id"),
+    ("reservation_code", "reservation_code"),
+    ("passenger_name", "passenger_name"),
+    ("passenger_email", "passenger_email"),
+    ("status", "status"),
+    ("created_at", "created_at"),
+)
+HEADER = tuple(name for name, _ in MANIFEST_COLUMNS)
+
+
+class _Echo:
+    # csv.writer'ın yazdığı satırı buffer'a almadan geri döndürür.
+    def write(self, value):
+        return value
+
+
+def iter_manifest_rows(*, chunk_size: int = EXPORT_CHUNK_SIZE, **filters) -> Iterator[tuple]:
+    """
+    list_reservations filtreleriyle, uçuş kolonları JOIN'li tuple'lar.
+    iterator() Postgres'te server-side cursor kullanır: bellekte en fazla chunk_size satır olur.
+    Server-side cursor kapalıysa (pgbouncer transaction pooling) id üzerinden chunk chunk okunur;
+    her chunk ayrı, kısa bir sorgudur.
+    """
+    qs = list_reservations(**filters).values_list(*(path for _, path in MANIFEST_COLUMNS))
+    # Stream, view dönüp read_scope kapandıktan sonra tüketilir; alias'ı şimdi sabitle ki
+    # her chunk aynı replikadan okunsun.
+    qs = qs.using(qs.db)
+    if connections[qs.db].settings_dict.get("DISABLE_SERVER_SIDE_CURSORS"):
+        return _iter_by_id(qs, chunk_size)
+    return qs.iterator(chunk_size=chunk_size)
+
+
+def _iter_by_id(qs, chunk_size: int) -> Iterator[tuple]:
+    # list_reservations varsayılan sıralaması id; çıktı sırası iterator() ile aynı.
+    id_index = HEADER.index("reservation_id")
+    last_id = None
+    while True:
+        page = qs.order_by("id")
+        if last_id is not None:
+            page = page.filter(id__gt=last_id)
+        rows = list(page[:chunk_size])
+        yield from rows
+        if len(rows) < chunk_size:
+            return
+        last_id = rows[-1][id_index]
+
+
+def iter_csv(rows: Iterable[tuple]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(HEADER)
+    for row in rows:
+        yield writer.writerow([v.isoformat() if hasattr(v, "isoformat") else v for v in row])
+
+
+def iter_ndjson(rows: Iterable[tuple]) -> Iterator[str]:
+    encoder = DjangoJSONEncoder(separators=(",", ":"), ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(dict(zip(HEADER, row))) + "\n"
+
+
+def export_reservations(fmt: str, *, chunk_size: int = EXPORT_CHUNK_SIZE, **filters) -> Iterator[str]:
+    rows = iter_manifest_rows(chunk_size=chunk_size, **filters)
+    return iter_csv(rows) if fmt == "csv" else iter_ndjson(rows)
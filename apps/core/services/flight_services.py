@@ -1,17 +1,23 @@
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
-from datetime import timedelta
 from typing import Optional
 
-from django.db import transaction
+from django.db import transaction, IntegrityError
 from rest_framework.exceptions import ValidationError
 
+from apps.common.drf.response_cache import bump_cache_version, FLIGHT
 from apps.core.models import Flight
+from apps.core.models.flight import SCHEDULE_BUFFER, SCHEDULE_CONFLICT_CONSTRAINT, build_schedule_window
 from django.utils import timezone
 from apps.core.models import Airplane
 from apps.core.selectors.flight_selector import list_flights
+from apps.core.selectors.itinerary_selector import record_route_changes
 from apps.core.selectors.reservation_selector import list_reservations
+from apps.core.services.inventory_services import sync_inventory_capacity
+from apps.core.models import FlightInventory
 
-BUFFER = timedelta(hours=1)
+BUFFER = SCHEDULE_BUFFER
+SCHEDULE_CONFLICT_MESSAGE = "This airplane has another flight within ±1h window."
 
 
 @dataclass(frozen=True)
@@ -25,36 +31,47 @@ class FlightCreateInput:
 
 
 def check_conflict(airplane_id: int, departure_time, arrival_time) -> bool:
-    dep_minus = departure_time - BUFFER
-    arr_plus = arrival_time + BUFFER
-
+    # (airplane_id, schedule_window) GiST index'i üzerinde tek probe.
     return Flight.objects.filter(
         airplane_id=airplane_id,
-        departure_time__lt=arr_plus,
-        arrival_time__gt=dep_minus,
+        deleted=False,
+        schedule_window__overlap=build_schedule_window(departure_time, arrival_time),
     ).exists()
 
 def check_conflict_with_existing_flight(airplane_id: int, departure_time, arrival_time, flight_id) -> bool:
-    dep_minus = departure_time - BUFFER
-    arr_plus = arrival_time + BUFFER
-
     return (Flight.objects.filter(
             airplane_id=airplane_id,
-            departure_time__lt=arr_plus,
-            arrival_time__gt=dep_minus,)
+            deleted=False,
+            schedule_window__overlap=build_schedule_window(departure_time, arrival_time),)
         .exclude(id=flight_id)
         .exists())
 
 
+def is_schedule_conflict(exc: IntegrityError) -> bool:
+    diag = getattr(exc.__cause__, "diag", None)
+    constraint = getattr(diag, "constraint_name", None)
+    return constraint == SCHEDULE_CONFLICT_CONSTRAINT or SCHEDULE_CONFLICT_CONSTRAINT in str(exc)
+
+
+@contextmanager
+def schedule_conflict_as_validation_error():
+    # çakışma kontrolü exclusion constraint'te; eşzamanlı iki create'ten biri burada düşer.
+    try:
+        with transaction.atomic():
+            yield
+    except IntegrityError as exc:
+        if is_schedule_conflict(exc):
+            raise ValidationError({"airplane_id": SCHEDULE_CONFLICT_MESSAGE})
+        raise
+
+
+@transaction.atomic
 def create_flight(inp: FlightCreateInput) -> Flight:
     try:
         airplane = Airplane.objects.get(pk=inp.airplane_id, deleted=False, status=True)
     except Airplane.DoesNotExist:
         raise ValidationError(f"Airplane {inp.airplane_id} does not exist or active.")
 
-    if check_conflict(airplane.id, inp.departure_time, inp.arrival_time):
-        raise ValidationError({"airplane_id": "This airplane has another flight within ±1h window."})
-
     exists = Flight.objects.filter(flight_number=inp.flight_number).exists()
 
     if exists:
@@ -69,8 +86,16 @@ def create_flight(inp: FlightCreateInput) -> Flight:
         arrival_time=inp.arrival_time,
     )
 
-    flight.full_clean()
-    flight.save()
+    flight.refresh_schedule_window()
+    flight.full_clean(validate_constraints=False)
+
+    with schedule_conflict_as_validation_error():
+        flight.save()
+
+    FlightInventory.objects.create(flight=flight, capacity=airplane.capacity)
+
+    record_route_changes([flight.id])
+    bump_cache_version(FLIGHT)
 
     return flight
 
@@ -95,26 +120,26 @@ def update_flight(flight: Flight, inp: FlightUpdateInput) -> Flight:
     effective_airplane_id = flight.airplane_id
 
     try:
-        Airplane.objects.get(pk=effective_airplane_id, deleted=False)
+        airplane = Airplane.objects.get(pk=effective_airplane_id, deleted=False)
     except Airplane.DoesNotExist:
         raise ValidationError(f"Airplane {effective_airplane_id} does not exist")
 
-    has_conflict = check_conflict_with_existing_flight(
-        effective_airplane_id,
-        flight.departure_time,
-        flight.arrival_time,
-        flight.id,
-    )
-    if has_conflict:
-        raise ValidationError({"airplane_id": "This airplane has another flight within ±1h window."})
-
-    flight.full_clean()
+    flight.refresh_schedule_window()
+    flight.full_clean(validate_constraints=False)
 
     update_fields = list(changes.keys())
     if "airplane_id" in update_fields:
         update_fields[update_fields.index("airplane_id")] = "airplane"
 
-    flight.save(update_fields=update_fields)
+    with schedule_conflict_as_validation_error():
+        flight.save(update_fields=update_fields)
+
+    if "airplane_id" in changes:
+        sync_inventory_capacity(capacity=airplane.capacity, flight_id=flight.id)
+
+    record_route_changes([flight.id])
+    bump_cache_version(FLIGHT)
+
     return flight
 
 def check_if_flight_is_started(flight_id: int) -> bool:
@@ -141,6 +166,8 @@ def soft_delete_flight(flight: Flight):
     if not flight.deleted:
         flight.deleted = True
         flight.save()
+        record_route_changes([flight.id])
+        bump_cache_version(FLIGHT)
 
 
 
@@ -0,0 +1,164 @@
+import logging
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import wraps
+from typing import Optional
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError, APIException
+
+from apps.core.models import Flight
+from apps.core.services.flight_services import check_if_flight_is_started
+from apps.core.services.hold_store import get_hold_store, HoldStoreUnavailable, CLAIM_MISSING, CLAIM_OTHER_FLIGHT, \
+    CLAIM_TOO_FEW_SEATS
+from apps.core.services.inventory_services import get_or_init_inventory, booked_seats
+
+logger = logging.getLogger(__name__)
+
+# restore_claimed_holds içindeyken claim edilen hold'lar: (hold_id, flight_id, seats, ttl_ms)
+_claimed_holds: ContextVar[Optional[list]] = ContextVar("claimed_seat_holds", default=None)
+
+
+class SeatHoldUnavailable(APIException):
+    status_code = 503
+    default_detail = "Seat hold service is unavailable."
+    default_code = "seat_hold_unavailable"
+
+
+@dataclass(frozen=True)
+class HoldSeatsInput:
+    flight_id: int
+    seats: int = 1
+
+
+@dataclass(frozen=True)
+class SeatHold:
+    hold_id: str
+    flight_id: int
+    seats: int
+    expires_at: Optional[timezone.datetime] = None
+
+
+def hold_ttl_seconds() -> int:
+    return getattr(settings, "SEAT_HOLD_TTL_SECONDS", 600)
+
+
+def hold_store_fail_open() -> bool:
+    return getattr(settings, "SEAT_HOLD_FAIL_OPEN", True)
+
+
+def hold_seats(inp: HoldSeatsInput) -> SeatHold:
+    """
+    Ödeme sırasında koltuk tutar. Reservation satırı oluşturmaz, sadece Redis'teki
+    uçuş sayaçlarına TTL'li bir hold ekler. Limit: kapasite - onaylı koltuklar.
+    """
+    flight = Flight.objects.select_related("airplane").get(pk=inp.flight_id, deleted=False)
+
+    if check_if_flight_is_started(flight.id):
+        raise ValidationError({"flight": f"Flight {flight.id} already passed."})
+
+    inventory = get_or_init_inventory(flight)
+    limit = inventory.capacity - booked_seats(inventory)
+
+    hold_id = uuid.uuid4().hex
+    ttl = hold_ttl_seconds()
+
+    try:
+        acquired = get_hold_store().acquire(hold_id, flight.id, inp.seats, limit, ttl)
+    except HoldStoreUnavailable:
+        raise SeatHoldUnavailable()
+
+    if not acquired:
+        raise ValidationError({"flight": "Flight capacity is full."})
+
+    return SeatHold(hold_id=hold_id, flight_id=flight.id, seats=inp.seats,
+                    expires_at=timezone.now() + timedelta(seconds=ttl))
+
+
+def get_hold(hold_id: str) -> Optional[SeatHold]:
+    try:
+        hold = get_hold_store().get(hold_id)
+    except HoldStoreUnavailable:
+        raise SeatHoldUnavailable()
+    if hold is None:
+        return None
+    flight_id, seats = hold
+    return SeatHold(hold_id=hold_id, flight_id=flight_id, seats=seats)
+
+
+def live_held_seats(flight_id: int, *, exclude_hold_id: Optional[str] = None) -> int:
+    """
+    Store'a ulaşılamazsa (SEAT_HOLD_FAIL_OPEN) hold'lar yokmuş gibi 0 döner: hold'suz rezervasyonlar
+    Redis yüzünden durmaz, fiziksel kapasiteyi zaten FlightInventory UPDATE'i korur. Bedeli, o sırada
+    başkasının tuttuğu koltuğun satılabilmesidir. Fail closed modunda 503.
+    """
+    try:
+        return get_hold_store().live_seats(flight_id, exclude_hold_id=exclude_hold_id)
+    except HoldStoreUnavailable as exc:
+        if not hold_store_fail_open():
+            raise SeatHoldUnavailable()
+        logger.warning("seat hold store unavailable, ignoring holds for flight %s: %s", flight_id, exc)
+        return 0
+
+
+def release_hold(hold_id: str) -> None:
+    try:
+        get_hold_store().release(hold_id)
+    except HoldStoreUnavailable:
+        raise SeatHoldUnavailable()
+
+
+def claim_hold(hold_id: str, *, flight_id: int, seats: int) -> SeatHold:
+    """
+    Rezervasyona dönüştürülecek hold'u store'da tek adımda doğrulayıp siler; aynı hold ile gelen
+    eşzamanlı ikinci rezervasyon hold'u bulamaz. Çağıran restore_claimed_holds ile sarılıysa
+    transaction geri alındığında hold kalan süresiyle geri konur.
+    """
+    # hold ile gelen rezervasyon her durumda fail closed: hold doğrulanamadan koltuk verilmez.
+    try:
+        code, hold_seats, ttl_ms = get_hold_store().claim(hold_id, flight_id, seats)
+    except HoldStoreUnavailable:
+        raise SeatHoldUnavailable()
+
+    if code == CLAIM_MISSING:
+        raise ValidationError({"hold_id": "Seat hold does not exist or expired."})
+
+    if code == CLAIM_OTHER_FLIGHT:
+        raise ValidationError({"hold_id": "Seat hold belongs to another flight."})
+
+    if code == CLAIM_TOO_FEW_SEATS:
+        raise ValidationError({"hold_id": f"Seat hold covers only {hold_seats} seat(s)."})
+
+    claimed = _claimed_holds.get()
+    if claimed is not None:
+        claimed.append((hold_id, flight_id, hold_seats, ttl_ms))
+
+    return SeatHold(hold_id=hold_id, flight_id=flight_id, seats=hold_seats)
+
+
+def restore_claimed_holds(func):
+    """
+    @transaction.atomic servislerin dışına konur (commit dahil her şeyi sarar).
+    Servis exception ile çıkarsa içinde claim edilen hold'lar geri konur.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _claimed_holds.set([])
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            store = get_hold_store()
+            for hold_id, flight_id, seats, ttl_ms in _claimed_holds.get():
+                try:
+                    store.restore(hold_id, flight_id, seats, ttl_ms)
+                except HoldStoreUnavailable as exc:
+                    # hold kaybolur; koltuklar genel havuza döner, çift satış olmaz.
+                    logger.warning("could not restore seat hold %s: %s", hold_id, exc)
+            raise
+        finally:
+            _claimed_holds.reset(token)
+
+    return wrapper
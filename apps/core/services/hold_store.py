@@ -0,0 +1,265 @@
+import threading
+import time
+from functools import lru_cache
+from typing import Optional
+
+from django.conf import settings
+
+# KEYS: [flight zset, flight seats hash, hold key]
+# ARGV: [now_ms, ttl_ms, seats, limit, hold_id, flight_id]
+_ACQUIRE_LUA = """
+local now = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+local seats = tonumber(ARGV[3])
+local limit = tonumber(ARGV[4])
+
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now)
+if #expired > 0 then
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+    redis.call('HDEL', KEYS[2], unpack(expired))
+end
+
+local held = 0
+for _, v in ipairs(redis.call('HVALS', KEYS[2])) do
+    held = held + tonumber(v)
+end
+
+if held + seats > limit then
+    return -1
+end
+
+redis.call('ZADD', KEYS[1], now + ttl, ARGV[5])
+redis.call('HSET', KEYS[2], ARGV[5], seats)
+redis.call('PEXPIRE', KEYS[1], ttl)
+redis.call('PEXPIRE', KEYS[2], ttl)
+redis.call('SET', KEYS[3], ARGV[6] .. ':' .. seats, 'PX', ttl)
+return held + seats
+"""
+
+# KEYS: [flight zset, flight seats hash]
+# ARGV: [now_ms, exclude_hold_id]
+_LIVE_LUA = """
+local now = tonumber(ARGV[1])
+
+-- hold'u olmayan uçuş (çoğunluk): tek EXISTS ile çık.
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    return 0
+end
+
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now)
+if #expired > 0 then
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+    redis.call('HDEL', KEYS[2], unpack(expired))
+end
+
+local held = 0
+local values = redis.call('HGETALL', KEYS[2])
+for i = 1, #values, 2 do
+    if values[i] ~= ARGV[2] then
+        held = held + tonumber(values[i + 1])
+    end
+end
+return held
+"""
+
+# claim sonuç kodları
+CLAIMED = 1
+CLAIM_MISSING = -1
+CLAIM_OTHER_FLIGHT = -2
+CLAIM_TOO_FEW_SEATS = -3
+
+# KEYS: [flight zset, flight seats hash, hold key]
+# ARGV: [flight_id, seats, hold_id]
+# kontrol + silme tek adımda: aynı hold ile eşzamanlı iki rezervasyondan sadece biri alır.
+_CLAIM_LUA = """
+local raw = redis.call('GET', KEYS[3])
+if not raw then
+    return {-1, 0, 0}
+end
+
+local sep = string.find(raw, ':', 1, true)
+local hold_flight = string.sub(raw, 1, sep - 1)
+local hold_seats = tonumber(string.sub(raw, sep + 1))
+
+if hold_flight ~= ARGV[1] then
+    return {-2, hold_seats, 0}
+end
+if tonumber(ARGV[2]) > hold_seats then
+    return {-3, hold_seats, 0}
+end
+
+local ttl = redis.call('PTTL', KEYS[3])
+redis.call('DEL', KEYS[3])
+redis.call('ZREM', KEYS[1], ARGV[3])
+redis.call('HDEL', KEYS[2], ARGV[3])
+return {1, hold_seats, ttl}
+"""
+
+# KEYS: [flight zset, flight seats hash, hold key]
+# ARGV: [now_ms, ttl_ms, seats, hold_id, flight_id]
+# claim edilen hold'u kalan süresiyle geri koyar (rollback). Uçuş key'lerinin süresi sadece uzatılır.
+_RESTORE_LUA = """
+local now = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+
+if redis.call('EXISTS', KEYS[3]) == 1 then
+    return 0
+end
+
+redis.call('ZADD', KEYS[1], now + ttl, ARGV[4])
+redis.call('HSET', KEYS[2], ARGV[4], ARGV[3])
+for i = 1, 2 do
+    if redis.call('PTTL', KEYS[i]) < ttl then
+        redis.call('PEXPIRE', KEYS[i], ttl)
+    end
+end
+redis.call('SET', KEYS[3], ARGV[5] .. ':' .. ARGV[3], 'PX', ttl)
+return 1
+"""
+
+
+class HoldStoreUnavailable(Exception):
+    """Hold store'a ulaşılamıyor (bağlantı / timeout)."""
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class RedisHoldStore:
+    """
+    Uçuş başına iki key:
+      seat_holds:{flight_id}        ZSET  hold_id -> bitiş zamanı (ms)
+      seat_holds:{flight_id}:seats  HASH  hold_id -> koltuk sayısı
+    ve hold başına seat_hold:{hold_id} -> "flight_id:seats" (PX ttl).
+    Süresi dolan hold'lar her okumada/yazmada Lua içinde atomik olarak temizlenir.
+    """
+
+    def __init__(self, url: str, timeout: float = 0.5):
+        import redis
+
+        # Redis asılı kalırsa booking de asılı kalmasın.
+        self.client = redis.Redis.from_url(url, socket_connect_timeout=timeout, socket_timeout=timeout)
+        self._errors = redis.RedisError
+        self._acquire = self.client.register_script(_ACQUIRE_LUA)
+        self._live = self.client.register_script(_LIVE_LUA)
+        self._claim = self.client.register_script(_CLAIM_LUA)
+        self._restore = self.client.register_script(_RESTORE_LUA)
+
+    @staticmethod
+    def _keys(flight_id: int) -> list[str]:
+        return [f"seat_holds:{flight_id}", f"seat_holds:{flight_id}:seats"]
+
+    def _run(self, fn, *args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except self._errors as exc:
+            raise HoldStoreUnavailable(str(exc)) from exc
+
+    def acquire(self, hold_id: str, flight_id: int, seats: int, limit: int, ttl_seconds: int) -> bool:
+        keys = self._keys(flight_id) + [f"seat_hold:{hold_id}"]
+        held = self._run(self._acquire, keys=keys, args=[_now_ms(), ttl_seconds * 1000, seats, limit, hold_id, flight_id])
+        return int(held) >= 0
+
+    def live_seats(self, flight_id: int, exclude_hold_id: Optional[str] = None) -> int:
+        return int(self._run(self._live, keys=self._keys(flight_id), args=[_now_ms(), exclude_hold_id or ""]))
+
+    def get(self, hold_id: str) -> Optional[tuple[int, int]]:
+        raw = self._run(self.client.get, f"seat_hold:{hold_id}")
+        if raw is None:
+            return None
+        flight_id, seats = raw.decode().split(":")
+        return int(flight_id), int(seats)
+
+    def claim(self, hold_id: str, flight_id: int, seats: int) -> tuple[int, int, int]:
+        """
+        Hold'u kontrol edip siler. (kod, hold'un koltuk sayısı, kalan süre ms) döner.
+        """
+        keys = self._keys(flight_id) + [f"seat_hold:{hold_id}"]
+        code, hold_seats, ttl_ms = self._run(self._claim, keys=keys, args=[flight_id, seats, hold_id])
+        return int(code), int(hold_seats), int(ttl_ms)
+
+    def restore(self, hold_id: str, flight_id: int, seats: int, ttl_ms: int) -> None:
+        if ttl_ms <= 0:
+            return
+        keys = self._keys(flight_id) + [f"seat_hold:{hold_id}"]
+        self._run(self._restore, keys=keys, args=[_now_ms(), ttl_ms, seats, hold_id, flight_id])
+
+    def release(self, hold_id: str) -> None:
+        hold = self.get(hold_id)
+        if hold is None:
+            return
+        zset, seats_hash = self._keys(hold[0])
+        pipe = self.client.pipeline()
+        pipe.zrem(zset, hold_id)
+        pipe.hdel(seats_hash, hold_id)
+        pipe.delete(f"seat_hold:{hold_id}")
+        self._run(pipe.execute)
+
+
+class LocalHoldStore:
+    """
+    Tek process içinde çalışan, Redis'siz stand-in (testler ve lokal geliştirme için).
+    RedisHoldStore ile aynı arayüz ve aynı süre dolumu davranışı.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._holds: dict[str, tuple[int, int, int]] = {}  # hold_id -> (flight_id, seats, expires_ms)
+
+    def _purge(self, now: int) -> None:
+        for hold_id in [h for h, (_, _, exp) in self._holds.items() if exp <= now]:
+            del self._holds[hold_id]
+
+    def acquire(self, hold_id: str, flight_id: int, seats: int, limit: int, ttl_seconds: int) -> bool:
+        now = _now_ms()
+        with self._lock:
+            self._purge(now)
+            held = sum(s for f, s, _ in self._holds.values() if f == flight_id)
+            if held + seats > limit:
+                return False
+            self._holds[hold_id] = (flight_id, seats, now + ttl_seconds * 1000)
+            return True
+
+    def live_seats(self, flight_id: int, exclude_hold_id: Optional[str] = None) -> int:
+        with self._lock:
+            self._purge(_now_ms())
+            return sum(s for h, (f, s, _) in self._holds.items() if f == flight_id and h != exclude_hold_id)
+
+    def get(self, hold_id: str) -> Optional[tuple[int, int]]:
+        with self._lock:
+            self._purge(_now_ms())
+            hold = self._holds.get(hold_id)
+            return (hold[0], hold[1]) if hold else None
+
+    def claim(self, hold_id: str, flight_id: int, seats: int) -> tuple[int, int, int]:
+        now = _now_ms()
+        with self._lock:
+            self._purge(now)
+            hold = self._holds.get(hold_id)
+            if hold is None:
+                return CLAIM_MISSING, 0, 0
+            hold_flight, hold_seats, expires = hold
+            if hold_flight != flight_id:
+                return CLAIM_OTHER_FLIGHT, hold_seats, 0
+            if seats > hold_seats:
+                return CLAIM_TOO_FEW_SEATS, hold_seats, 0
+            del self._holds[hold_id]
+            return CLAIMED, hold_seats, expires - now
+
+    def restore(self, hold_id: str, flight_id: int, seats: int, ttl_ms: int) -> None:
+        if ttl_ms <= 0:
+            return
+        with self._lock:
+            self._holds.setdefault(hold_id, (flight_id, seats, _now_ms() + ttl_ms))
+
+    def release(self, hold_id: str) -> None:
+        with self._lock:
+            self._holds.pop(hold_id, None)
+
+
+@lru_cache(maxsize=1)
+def get_hold_store():
+    if getattr(settings, "SEAT_HOLD_BACKEND", "redis") == "local":
+        return LocalHoldStore()
+    return RedisHoldStore(settings.SEAT_HOLD_REDIS_URL, getattr(settings, "SEAT_HOLD_REDIS_TIMEOUT", 0.5))
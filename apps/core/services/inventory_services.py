@@ -0,0 +1,243 @@
+import random
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import F, Sum
+from rest_framework.exceptions import ValidationError
+
+from apps.core.models import Flight, FlightInventory, FlightInventoryShard, Reservation
+
+MAX_SHARDS = 64
+
+
+def count_active_reservations(flight_id: int) -> int:
+    return Reservation.objects.filter(flight_id=flight_id, status=True, deleted=False).count()
+
+
+def get_or_init_inventory(flight: Flight) -> FlightInventory:
+    # satır yoksa (eski uçuşlar vb.) Reservation tablosundan bir kereye mahsus hesapla.
+    # PK unique olduğu için eşzamanlı iki init'ten biri IntegrityError alır ve var olanı okur.
+    inventory, _ = FlightInventory.objects.get_or_create(
+        flight_id=flight.id,
+        defaults={
+            "capacity": flight.airplane.capacity,
+            "seats_booked": count_active_reservations(flight.id),
+        },
+    )
+    return inventory
+
+
+def booked_seats(inventory: FlightInventory) -> int:
+    if not inventory.shard_count:
+        return inventory.seats_booked
+
+    sharded = (FlightInventoryShard.objects
+               .filter(flight_id=inventory.flight_id)
+               .aggregate(total=Sum("seats_booked"))["total"])
+    return inventory.seats_booked + (sharded or 0)
+
+
+def _book_on_inventory(flight_id: int, seats: int, held: int) -> int:
+    # sadece normal moddaki uçuşlar; hot modda ana satır hiç kilitlenmez.
+    return (FlightInventory.objects
+            .filter(flight_id=flight_id, shard_count=0, seats_booked__lte=F("capacity") - seats - held)
+            .update(seats_booked=F("seats_booked") + seats))
+
+
+def _book_on_random_shard(flight_id: int, shard_count: int, seats: int) -> int:
+    return (FlightInventoryShard.objects
+            .filter(flight_id=flight_id, shard_no=random.randrange(shard_count),
+                    seats_booked__lte=F("capacity") - seats)
+            .update(seats_booked=F("seats_booked") + seats))
+
+
+def _distribute(inventory: FlightInventory, shards: list[FlightInventoryShard], *, target=None, seats: int = 0) -> None:
+    # boş kapasiteyi shard'lara eşit dağıt; target verildiyse önce ona `seats` kadar pay ayır.
+    free = inventory.capacity - inventory.seats_booked - sum(s.seats_booked for s in shards)
+    free = max(free - seats, 0)
+
+    share, extra = divmod(free, len(shards))
+    for i, shard in enumerate(shards):
+        shard.capacity = shard.seats_booked + share + (1 if i < extra else 0)
+        if shard is target:
+            shard.capacity += seats
+
+
+def _lock_inventory(flight_id: int) -> tuple[FlightInventory, list[FlightInventoryShard]]:
+    # kilit sırası her yerde aynı: önce ana satır, sonra shard_no sırasıyla shard'lar.
+    inventory = FlightInventory.objects.select_for_update().get(flight_id=flight_id)
+    shards = list(FlightInventoryShard.objects
+                  .select_for_update()
+                  .filter(flight_id=flight_id)
+                  .order_by("shard_no"))
+    return inventory, shards
+
+
+def _book_with_rebalance(flight_id: int, seats: int, held: int) -> bool:
+    inventory, shards = _lock_inventory(flight_id)
+
+    booked = inventory.seats_booked + sum(s.seats_booked for s in shards)
+    if booked + seats + held > inventory.capacity:
+        return False
+
+    if not shards:
+        inventory.seats_booked += seats
+        inventory.save(update_fields=["seats_booked"])
+        return True
+
+    target = random.choice(shards)
+    _distribute(inventory, shards, target=target, seats=seats)
+    target.seats_booked += seats
+    FlightInventoryShard.objects.bulk_update(shards, ["capacity", "seats_booked"])
+    return True
+
+
+def reserve_seats(flight: Flight, seats: int = 1, *, held: int = 0) -> bool:
+    """
+    Koşullu tek UPDATE: yer varsa seats_booked'ı artırır ve True döner, yoksa False.
+    Satır kilidi sadece UPDATE'ten commit'e kadar tutulur, rezervasyon satırları taranmaz.
+    held: başkalarının tuttuğu (henüz onaylanmamış) koltuklar, kapasiteden düşülür.
+
+    Hot modda rastgele bir shard denenir; shard doluysa (ya da held > 0 ise, çünkü hold'lar
+    shard bazında değil uçuş bazında) tüm shard'lar kilitlenip kapasite yeniden dağıtılır.
+    """
+    if _book_on_inventory(flight.id, seats, held):
+        return True
+
+    inventory = FlightInventory.objects.filter(flight_id=flight.id).only("shard_count").first()
+
+    if inventory is None:
+        get_or_init_inventory(flight)
+        return bool(_book_on_inventory(flight.id, seats, held))
+
+    if not inventory.shard_count:
+        return False
+
+    if not held and _book_on_random_shard(flight.id, inventory.shard_count, seats):
+        return True
+
+    return _book_with_rebalance(flight.id, seats, held)
+
+
+def release_seats(flight_id: int, seats: int = 1) -> None:
+    updated = (FlightInventory.objects
+               .filter(flight_id=flight_id, shard_count=0, seats_booked__gte=seats)
+               .update(seats_booked=F("seats_booked") - seats))
+    if updated:
+        return
+
+    inventory = FlightInventory.objects.filter(flight_id=flight_id).only("shard_count").first()
+    if inventory is None or not inventory.shard_count:
+        return
+
+    updated = (FlightInventoryShard.objects
+               .filter(flight_id=flight_id, shard_no=random.randrange(inventory.shard_count),
+                       seats_booked__gte=seats)
+               .update(seats_booked=F("seats_booked") - seats))
+    if updated:
+        return
+
+    inventory, shards = _lock_inventory(flight_id)
+    remaining = seats
+    for row in [inventory, *shards]:
+        take = min(row.seats_booked, remaining)
+        row.seats_booked -= take
+        remaining -= take
+
+    inventory.save(update_fields=["seats_booked"])
+    FlightInventoryShard.objects.bulk_update(shards, ["seats_booked"])
+
+
+def rebalance_shards(flight_id: int) -> None:
+    inventory, shards = _lock_inventory(flight_id)
+    if not shards:
+        return
+    _distribute(inventory, shards)
+    FlightInventoryShard.objects.bulk_update(shards, ["capacity"])
+
+
+def sync_inventory_capacity(*, capacity: int, airplane_id: Optional[int] = None, flight_id: Optional[int] = None,
+                            flight_ids: Optional[list[int]] = None) -> int:
+    qs = FlightInventory.objects.all()
+
+    if airplane_id is not None:
+        qs = qs.filter(flight__airplane_id=airplane_id)
+
+    if flight_id is not None:
+        qs = qs.filter(flight_id=flight_id)
+
+    if flight_ids is not None:
+        qs = qs.filter(flight_id__in=flight_ids)
+
+    updated = qs.update(capacity=capacity)
+
+    for hot_flight_id in qs.filter(shard_count__gt=0).values_list("flight_id", flat=True):
+        rebalance_shards(hot_flight_id)
+
+    return updated
+
+
+@transaction.atomic
+def enable_hot_mode(flight: Flight, shards: int) -> FlightInventory:
+    if shards < 1 or shards > MAX_SHARDS:
+        raise ValidationError({"shards": f"Must be between 1 and {MAX_SHARDS}."})
+
+    get_or_init_inventory(flight)
+    inventory, existing = _lock_inventory(flight.id)
+
+    # varsa eski shard'ları ana satıra topla, yeniden böl.
+    inventory.seats_booked += sum(s.seats_booked for s in existing)
+    FlightInventoryShard.objects.filter(flight_id=flight.id).delete()
+
+    new_shards = [FlightInventoryShard(flight_id=flight.id, shard_no=i) for i in range(shards)]
+    _distribute(inventory, new_shards)
+    FlightInventoryShard.objects.bulk_create(new_shards)
+
+    inventory.shard_count = shards
+    inventory.save(update_fields=["seats_booked", "shard_count"])
+    return inventory
+
+
+@transaction.atomic
+def disable_hot_mode(flight: Flight) -> FlightInventory:
+    get_or_init_inventory(flight)
+    inventory, shards = _lock_inventory(flight.id)
+
+    inventory.seats_booked += sum(s.seats_booked for s in shards)
+    inventory.shard_count = 0
+    FlightInventoryShard.objects.filter(flight_id=flight.id).delete()
+
+    inventory.save(update_fields=["seats_booked", "shard_count"])
+    return inventory
+
+
+@transaction.atomic
+def reconcile_inventory(flight: Flight) -> tuple[FlightInventory, Optional[int]]:
+    # önce sayaç satırlarını kilitle: açık rezervasyon transaction'ları commit olana kadar bekleriz,
+    # sonrasında gelenler de bizim commit'imizi bekler. Böylece sayım tutarlı olur.
+    inventory = FlightInventory.objects.select_for_update().filter(flight_id=flight.id).first()
+
+    capacity = flight.airplane.capacity
+
+    if inventory is None:
+        booked = count_active_reservations(flight.id)
+        return FlightInventory.objects.create(flight_id=flight.id, capacity=capacity, seats_booked=booked), None
+
+    shards = list(FlightInventoryShard.objects
+                  .select_for_update()
+                  .filter(flight_id=flight.id)
+                  .order_by("shard_no"))
+    booked = count_active_reservations(flight.id)
+
+    previous = inventory.seats_booked + sum(s.seats_booked for s in shards)
+    inventory.capacity = capacity
+    inventory.seats_booked = booked
+    inventory.save(update_fields=["capacity", "seats_booked"])
+
+    if shards:
+        for shard in shards:
+            shard.seats_booked = 0
+        _distribute(inventory, shards)
+        FlightInventoryShard.objects.bulk_update(shards, ["capacity", "seats_booked"])
+
+    return inventory, previous
@@ -1,15 +1,19 @@
-from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from datetime import timedelta
 from typing import Optional
 
-from django.db import transaction, connection
+from django.db import transaction
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
+from apps.common.drf.response_cache import bump_cache_version, RESERVATION
 from apps.core.models import Flight, Reservation
 from apps.core.selectors.flight_selector import get_flight
 from apps.core.services.flight_services import check_if_flight_is_passed, check_if_flight_is_started
+from apps.core.services.contention_metrics import measure, PHASE_OPEN_CHECK, PHASE_HOLDS, PHASE_INVENTORY
+from apps.core.services.hold_services import live_held_seats, claim_hold, restore_claimed_holds
+from apps.core.services.inventory_services import reserve_seats, release_seats
+from apps.core.services.waitlist_services import schedule_waitlist_promotion
 from apps.notifications.dispatcher import publish_event
 
 THRESHOLD = 60
@@ -21,6 +25,18 @@ class MakeReservationInput:
     passenger_email: str
     flight_id: int
     status: bool = True
+    hold_id: Optional[str] = None
+
+@dataclass(frozen=True)
+class PassengerInput:
+    passenger_name: str
+    passenger_email: str
+
+@dataclass(frozen=True)
+class MakeGroupReservationInput:
+    flight_id: int
+    passengers: tuple[PassengerInput, ...]
+    hold_id: Optional[str] = None
 
 @dataclass(frozen=True)
 class UpdateReservationInput:
@@ -28,37 +44,42 @@ class UpdateReservationInput:
     passenger_email: Optional[str]
     status: bool = True
 
-@contextmanager
-def lock_flight_tx(flight_id: int):
-    with connection.cursor() as cursor:
-        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [flight_id])
-    yield
-
-
-def ensure_flight_open_and_has_capacity(flight, *, exclude_reservation_id: int | None = None) -> None:
+def ensure_flight_open(flight) -> None:
     # uçuş başladı mı?
     if check_if_flight_is_started(flight.id):
         raise ValidationError({"flight": f"Flight {flight.id} already passed."})
 
-    # kapasite kontrolü + lock
-    with lock_flight_tx(flight.id):
-        qs = (Reservation.objects
-              .select_for_update(of=("self",))
-              .filter(flight=flight, status=True, deleted=False))
-        if exclude_reservation_id:
-            qs = qs.exclude(id=exclude_reservation_id)
 
-        active_count = qs.count()
-        if active_count >= flight.airplane.capacity:
-            raise ValidationError({"flight": "Flight capacity is full."})
+def ensure_flight_open_and_has_capacity(flight, *, seats: int = 1, hold_id: Optional[str] = None) -> None:
+    with measure(flight.id, PHASE_OPEN_CHECK):
+        ensure_flight_open(flight)
 
+    # hold ile geliyorsa kendi hold'u hariç diğer canlı hold'lar kapasiteden düşülür.
+    with measure(flight.id, PHASE_HOLDS):
+        if hold_id:
+            claim_hold(hold_id, flight_id=flight.id, seats=seats)
+        held = live_held_seats(flight.id, exclude_hold_id=hold_id)
 
+    # kapasite kontrolü: FlightInventory üzerinde tek koşullu UPDATE, yer ayrılır.
+    # satır kilidi beklemesi bu fazda ölçülür.
+    # transaction rollback olursa ayrılan koltuk da geri alınır.
+    with measure(flight.id, PHASE_INVENTORY):
+        reserved = reserve_seats(flight, seats, held=held)
+
+    if not reserved:
+        raise ValidationError({"flight": "Flight capacity is full."})
+
+
+@restore_claimed_holds
 @transaction.atomic
 def make_reservation(inp: MakeReservationInput) -> Reservation:
 
     flight = Flight.objects.select_related("airplane").get(pk=inp.flight_id, deleted=False)
 
-    ensure_flight_open_and_has_capacity(flight)
+    if inp.status:
+        ensure_flight_open_and_has_capacity(flight, hold_id=inp.hold_id)
+    else:
+        ensure_flight_open(flight)
 
     res = Reservation(
         flight=flight,
@@ -67,7 +88,8 @@ def make_reservation(inp: MakeReservationInput) -> Reservation:
         status=inp.status,
     )
 
-    res.full_clean()
+    # reservation_code sequence'ten geldiği için unique kontrolü DB index'ine bırakılır.
+    res.full_clean(validate_unique=False)
     res.save()
 
     payload = {
@@ -79,20 +101,78 @@ def make_reservation(inp: MakeReservationInput) -> Reservation:
     }
 
     publish_event("reservation.booked", payload)
+    bump_cache_version(RESERVATION)
 
     return res
 
+@restore_claimed_holds
+@transaction.atomic
+def make_group_reservation(inp: MakeGroupReservationInput) -> list[Reservation]:
+    """
+    Tek uçuş için N yolcuyu tek transaction'da rezerve eder: ya hepsi ya hiçbiri.
+    Kapasite bir kez (N koltuk) ayrılır, satırlar bulk_create ile eklenir ve tek bir event atılır.
+    """
+    if not inp.passengers:
+        raise ValidationError({"passengers": "At least one passenger is required."})
+
+    flight = Flight.objects.select_related("airplane").get(pk=inp.flight_id, deleted=False)
+
+    ensure_flight_open_and_has_capacity(flight, seats=len(inp.passengers), hold_id=inp.hold_id)
+
+    reservations = []
+    for p in inp.passengers:
+        res = Reservation(
+            flight=flight,
+            passenger_name=p.passenger_name,
+            passenger_email=p.passenger_email,
+            status=True,
+        )
+        # unique kontrolü satır başına sorgu atar, onu DB constraint'ine bırakıyoruz.
+        res.full_clean(validate_unique=False)
+        reservations.append(res)
+
+    Reservation.objects.bulk_create(reservations)
+
+    payload = {
+        "flight_id": flight.id,
+        "departure": flight.departure,
+        "departure_time": flight.departure_time.isoformat(),
+        "passengers": [
+            {"passenger_email": r.passenger_email, "passenger_name": r.passenger_name}
+            for r in reservations
+        ],
+    }
+
+    publish_event("reservation.group_booked", payload)
+    bump_cache_version(RESERVATION)
+
+    return reservations
+
 @transaction.atomic
 def update_reservation(reservation: Reservation, inp: UpdateReservationInput) -> Reservation:
     changes = {k: v for k, v in asdict(inp).items() if v is not None}
 
     if not changes:
         return reservation
+
+    # eski status'ü kilitli satırdan oku; eşzamanlı iki update aynı koltuğu iki kez bırakmasın.
+    current = Reservation.objects.select_for_update().only("status", "deleted").get(pk=reservation.pk)
+    new_status = changes.get("status", current.status)
+
+    if not current.deleted and current.status != new_status:
+        if new_status:
+            flight = Flight.objects.select_related("airplane").get(pk=reservation.flight_id)
+            ensure_flight_open_and_has_capacity(flight)
+        else:
+            release_seats(reservation.flight_id)
+            schedule_waitlist_promotion(reservation.flight_id)
+
     for field, value in changes.items():
         setattr(reservation, field, value)
 
     reservation.full_clean()
-    reservation.save(update_fields=changes.keys())
+    reservation.save(update_fields=[*changes.keys(), "updated_at"])
+    bump_cache_version(RESERVATION)
 
     # if target_status:
     #     payload = {
@@ -116,11 +196,16 @@ def is_flight_soon(flight_id, threshold_minutes: int = THRESHOLD) -> bool:
     return timedelta(minutes=0) <= time_to_departure <= timedelta(minutes=threshold_minutes)
 
 
+@transaction.atomic
 def soft_delete_reservation(reservation: Reservation):
 
     if reservation.deleted:
         return
 
+    current = Reservation.objects.select_for_update().only("status", "deleted").get(pk=reservation.pk)
+    if current.deleted:
+        return
+
     passed = check_if_flight_is_passed(reservation.flight_id)
 
     if not passed and is_flight_soon(flight_id=reservation.flight_id):
@@ -128,5 +213,10 @@ def soft_delete_reservation(reservation: Reservation):
 
     reservation.deleted = True
     reservation.save()
+    bump_cache_version(RESERVATION)
+
+    if current.status:
+        release_seats(reservation.flight_id)
+        schedule_waitlist_promotion(reservation.flight_id)
 
 
@@ -0,0 +1,252 @@
+import bisect
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+from django.db import transaction, IntegrityError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.common.drf.response_cache import bump_cache_version, FLIGHT
+from apps.core.models import Airplane, Flight, FlightInventory
+from apps.core.selectors.itinerary_selector import record_route_changes
+
+IMPORT_CHUNK_SIZE = 1000
+FORMATS = ("csv", "jsonl")
+REQUIRED_FIELDS = ("flight_number", "departure", "destination", "departure_time", "arrival_time")
+
+
+class RowError(Exception):
+    pass
+
+
+@dataclass
+class ImportReport:
+    total: int = 0
+    created: int = 0
+    rejected: list[dict] = field(default_factory=list)
+
+    def reject(self, line: int, reason: str, flight_number: Optional[str] = None) -> None:
+        self.rejected.append({"line": line, "flight_number": flight_number, "reason": reason})
+
+    def to_dict(self) -> dict:
+        return {"total": self.total, "created": self.created, "rejected": self.rejected}
+
+
+class AirplaneSchedule:
+    """
+    Uçak başına, birbiriyle çakışmayan [start, end) pencerelerinin sıralı listesi.
+    Yeni pencere için sadece sol ve sağ komşuya bakmak yeterli: O(log n) arama.
+    """
+
+    def __init__(self, windows: Iterable[tuple]):
+        pairs = sorted(windows)
+        self.starts = [s for s, _ in pairs]
+        self.ends = [e for _, e in pairs]
+
+    def conflicts(self, start, end) -> bool:
+        i = bisect.bisect_left(self.starts, start)
+        if i > 0 and self.ends[i - 1] > start:
+            return True
+        return i < len(self.starts) and self.starts[i] < end
+
+    def add(self, start, end) -> None:
+        i = bisect.bisect_left(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+
+    def remove(self, start, end) -> None:
+        i = bisect.bisect_left(self.starts, start)
+        while i < len(self.starts) and self.starts[i] == start:
+            if self.ends[i] == end:
+                del self.starts[i]
+                del self.ends[i]
+                return
+            i += 1
+
+
+def iter_rows(stream, fmt: str) -> Iterator[tuple[int, dict]]:
+    # stream: text ya da binary dosya nesnesi. Satır satır okunur, dosya belleğe alınmaz.
+    if isinstance(stream.read(0), bytes):
+        stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield line_no, None
+            continue
+        yield line_no, row if isinstance(row, dict) else None
+
+
+def _parse_time(value, name: str):
+    dt = value if hasattr(value, "tzinfo") else parse_datetime(str(value or "").strip())
+    if dt is None:
+        raise RowError(f"{name}: invalid datetime.")
+    if timezone.is_naive(dt):
+        raise RowError(f"{name}: datetime values must be timezone-aware.")
+    return dt
+
+
+class ScheduleImporter:
+
+    def __init__(self, *, chunk_size: int = IMPORT_CHUNK_SIZE, dry_run: bool = False):
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self.report = ImportReport()
+
+        self._airplanes: dict[int, Airplane] = {
+            a.id: a for a in Airplane.objects.filter(deleted=False, status=True).only("id", "tail_number", "capacity")
+        }
+        self._by_tail = {a.tail_number: a for a in self._airplanes.values()}
+        self._schedules: dict[int, AirplaneSchedule] = {}
+        self._seen_numbers: set[str] = set()
+
+    def _schedule(self, airplane_id: int) -> AirplaneSchedule:
+        schedule = self._schedules.get(airplane_id)
+        if schedule is None:
+            windows = (Flight.objects
+                       .filter(airplane_id=airplane_id, deleted=False)
+                       .values_list("schedule_window", flat=True))
+            schedule = self._schedules[airplane_id] = AirplaneSchedule((w.lower, w.upper) for w in windows)
+        return schedule
+
+    def _build(self, row: dict) -> Flight:
+        missing = [f for f in REQUIRED_FIELDS if not str(row.get(f) or "").strip()]
+        if missing:
+            raise RowError(f"Missing fields: {', '.join(missing)}.")
+
+        flight_number = str(row["flight_number"]).strip()
+        departure = str(row["departure"]).strip()
+        destination = str(row["destination"]).strip()
+
+        if len(flight_number) > 20 or len(departure) > 20 or len(destination) > 20:
+            raise RowError("flight_number, departure and destination must be at most 20 characters.")
+
+        if departure.upper() == destination.upper():
+            raise RowError("Destination must differ from departure.")
+
+        dep = _parse_time(row["departure_time"], "departure_time")
+        arr = _parse_time(row["arrival_time"], "arrival_time")
+        if arr <= dep:
+            raise RowError("Arrival must be after departure.")
+
+        airplane = None
+        if str(row.get("airplane_id") or "").strip():
+            try:
+                airplane = self._airplanes.get(int(row["airplane_id"]))
+            except (TypeError, ValueError):
+                raise RowError("airplane_id must be an integer.")
+        elif str(row.get("tail_number") or "").strip():
+            airplane = self._by_tail.get(str(row["tail_number"]).strip().upper())
+        else:
+            raise RowError("airplane_id or tail_number is required.")
+
+        if airplane is None:
+            raise RowError("Airplane does not exist or active.")
+
+        if flight_number in self._seen_numbers:
+            raise RowError(f"Flight with number {flight_number} already exists.")
+
+        flight = Flight(
+            airplane=airplane,
+            flight_number=flight_number,
+            departure=departure,
+            destination=destination,
+            departure_time=dep,
+            arrival_time=arr,
+        )
+        flight.refresh_schedule_window()
+        return flight
+
+    def run(self, rows: Iterable[tuple[int, Optional[dict]]]) -> ImportReport:
+        chunk: list[tuple[int, Flight]] = []
+
+        for line, row in rows:
+            self.report.total += 1
+            if row is None:
+                self.report.reject(line, "Malformed row.")
+                continue
+
+            try:
+                flight = self._build(row)
+            except RowError as exc:
+                self.report.reject(line, str(exc), row.get("flight_number"))
+                continue
+
+            chunk.append((line, flight))
+            self._seen_numbers.add(flight.flight_number)
+
+            if len(chunk) >= self.chunk_size:
+                self._flush(chunk)
+                chunk = []
+
+        if chunk:
+            self._flush(chunk)
+
+        return self.report
+
+    def _flush(self, chunk: list[tuple[int, Flight]]) -> None:
+        # DB'de zaten olan flight_number'lar: chunk başına tek sorgu.
+        numbers = [f.flight_number for _, f in chunk]
+        taken = set(Flight.objects.filter(flight_number__in=numbers).values_list("flight_number", flat=True))
+
+        accepted: list[tuple[int, Flight]] = []
+        for line, flight in chunk:
+            if flight.flight_number in taken:
+                self.report.reject(line, f"Flight with number {flight.flight_number} already exists.", flight.flight_number)
+                continue
+
+            schedule = self._schedule(flight.airplane_id)
+            window = flight.schedule_window
+            if schedule.conflicts(window.lower, window.upper):
+                self.report.reject(line, "This airplane has another flight within ±1h window.", flight.flight_number)
+                continue
+
+            schedule.add(window.lower, window.upper)
+            accepted.append((line, flight))
+
+        if not accepted or self.dry_run:
+            self.report.created += len(accepted)
+            return
+
+        try:
+            with transaction.atomic():
+                self._insert([f for _, f in accepted])
+            self.report.created += len(accepted)
+        except IntegrityError:
+            # eşzamanlı bir create ile yarıştık: bu chunk'ı satır satır dene, hatalıyı raporla.
+            for line, flight in accepted:
+                flight.pk = None
+                try:
+                    with transaction.atomic():
+                        self._insert([flight])
+                    self.report.created += 1
+                except IntegrityError as exc:
+                    window = flight.schedule_window
+                    self._schedule(flight.airplane_id).remove(window.lower, window.upper)
+                    self.report.reject(line, f"Rejected by database: {exc.__cause__ or exc}", flight.flight_number)
+
+    def _insert(self, flights: list[Flight]) -> None:
+        Flight.objects.bulk_create(flights)
+        FlightInventory.objects.bulk_create(
+            [FlightInventory(flight_id=f.id, capacity=f.airplane.capacity) for f in flights]
+        )
+        record_route_changes(f.id for f in flights)
+        bump_cache_version(FLIGHT)
+
+
+def import_schedule(stream, fmt: str, *, chunk_size: int = IMPORT_CHUNK_SIZE, dry_run: bool = False) -> ImportReport:
+    importer = ScheduleImporter(chunk_size=chunk_size, dry_run=dry_run)
+    return importer.run(iter_rows(stream, fmt))
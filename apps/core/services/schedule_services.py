@@ -0,0 +1,397 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.db import transaction, connection, IntegrityError
+from django.db.transaction import TransactionManagementError
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.common.drf.response_cache import bump_cache_version, FLIGHT
+from apps.core.models import Airplane, Flight, FlightInventory, FlightSchedule, Reservation
+from apps.core.models.flight import SCHEDULE_CONFLICT_CONSTRAINT, build_schedule_window
+from apps.core.selectors.itinerary_selector import record_route_changes
+from apps.core.services.flight_services import schedule_conflict_as_validation_error, SCHEDULE_CONFLICT_MESSAGE
+from apps.core.services.inventory_services import sync_inventory_capacity
+from apps.core.services.schedule_import_services import AirplaneSchedule
+
+# hata mesajında listelenecek en fazla tarih sayısı
+MAX_REPORTED_DATES = 20
+
+
+@dataclass(frozen=True)
+class FlightScheduleInput:
+    flight_number: str
+    departure: str
+    destination: str
+    departure_local_time: time
+    duration: timedelta
+    weekdays: tuple[int, ...]
+    valid_from: date
+    valid_until: date
+    airplane_id: int
+    timezone: Optional[str] = None
+
+
+# PostgreSQL unique_violation SQLSTATE
+UNIQUE_VIOLATION = "23505"
+
+
+@dataclass
+class ScheduleSyncResult:
+    created: int = 0
+    updated: int = 0
+    removed: int = 0
+    kept: list[date] = field(default_factory=list)
+    # rezervasyonu olduğu için yeni saate / uçağa taşınmayan günler
+    pinned: list[date] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Occurrence:
+    date: date
+    departure_time: datetime
+    arrival_time: datetime
+
+
+def instance_number(schedule: FlightSchedule, day: date) -> str:
+    return f"{schedule.flight_number}-{day:%y%m%d}"
+
+
+def expand_schedule(schedule: FlightSchedule, *, start: Optional[date] = None) -> dict[date, Occurrence]:
+    """
+    Programın start (dahil) ile valid_until arasındaki tüm günlerini üretir.
+    Saatler programın yerel saat diliminde yorumlanır, DST geçişleri zoneinfo ile doğru hesaplanır.
+    """
+    zone = ZoneInfo(schedule.timezone)
+    weekdays = set(schedule.weekdays)
+
+    day = max(schedule.valid_from, start) if start else schedule.valid_from
+    occurrences = {}
+    while day <= schedule.valid_until:
+        if day.weekday() in weekdays:
+            dep = datetime.combine(day, schedule.departure_local_time, tzinfo=zone)
+            occurrences[day] = Occurrence(day, dep, dep + schedule.duration)
+        day += timedelta(days=1)
+    return occurrences
+
+
+def _get_airplane(airplane_id: int) -> Airplane:
+    try:
+        return Airplane.objects.get(pk=airplane_id, deleted=False, status=True)
+    except Airplane.DoesNotExist:
+        raise ValidationError(f"Airplane {airplane_id} does not exist or active.")
+
+
+def _conflict_index(airplane_id: int, occurrences: dict[date, Occurrence], exclude_ids=()) -> AirplaneSchedule:
+    # programın kapsadığı aralıktaki mevcut uçuşlar tek sorguda belleğe alınır.
+    if not occurrences:
+        return AirplaneSchedule([])
+
+    first = min(o.departure_time for o in occurrences.values())
+    last = max(o.arrival_time for o in occurrences.values())
+
+    qs = Flight.objects.filter(
+        airplane_id=airplane_id,
+        deleted=False,
+        schedule_window__overlap=build_schedule_window(first, last),
+    )
+    if exclude_ids:
+        # yeniden üretilecek / silinecek kendi uçuşlarımız engel sayılmaz.
+        qs = qs.exclude(id__in=list(exclude_ids))
+
+    return AirplaneSchedule((w.lower, w.upper) for w in qs.values_list("schedule_window", flat=True))
+
+
+def _check_conflicts(airplane_id: int, occurrences: dict[date, Occurrence], exclude_ids=()) -> None:
+    index = _conflict_index(airplane_id, occurrences, exclude_ids)
+
+    conflicts = []
+    for day in sorted(occurrences):
+        o = occurrences[day]
+        window = build_schedule_window(o.departure_time, o.arrival_time)
+        if index.conflicts(window.lower, window.upper):
+            conflicts.append(day)
+        else:
+            index.add(window.lower, window.upper)
+
+    if conflicts:
+        dates = ", ".join(d.isoformat() for d in conflicts[:MAX_REPORTED_DATES])
+        more = f" (+{len(conflicts) - MAX_REPORTED_DATES} more)" if len(conflicts) > MAX_REPORTED_DATES else ""
+        raise ValidationError({"airplane_id": f"{SCHEDULE_CONFLICT_MESSAGE} Conflicting dates: {dates}{more}"})
+
+
+def _check_numbers(schedule: FlightSchedule, days) -> None:
+    numbers = [instance_number(schedule, d) for d in days]
+    taken = list(Flight.objects
+                 .filter(flight_number__in=numbers)
+                 .exclude(schedule_id=schedule.id)
+                 .values_list("flight_number", flat=True)[:MAX_REPORTED_DATES])
+    if taken:
+        raise ValidationError({"flight_number": f"Flights already exist: {', '.join(taken)}"})
+
+
+def _new_flight(schedule: FlightSchedule, airplane: Airplane, o: Occurrence) -> Flight:
+    flight = Flight(
+        airplane=airplane,
+        flight_number=instance_number(schedule, o.date),
+        departure=schedule.departure,
+        destination=schedule.destination,
+        departure_time=o.departure_time,
+        arrival_time=o.arrival_time,
+        schedule=schedule,
+        schedule_date=o.date,
+    )
+    flight.refresh_schedule_window()
+    return flight
+
+
+@contextmanager
+def deferred_schedule_constraint():
+    # kardeş uçuşlar aynı anda kayarken ara durumlar geçici olarak çakışabilir;
+    # kontrol blok sonunda IMMEDIATE'e dönerken bir kez yapılır.
+    # SET CONSTRAINTS sadece içinde bulunduğu transaction'ı etkiler (pgbouncer ile de güvenli).
+    if not connection.in_atomic_block:
+        raise TransactionManagementError("deferred_schedule_constraint must be used inside transaction.atomic.")
+    with connection.cursor() as cursor:
+        cursor.execute(f"SET CONSTRAINTS {SCHEDULE_CONFLICT_CONSTRAINT} DEFERRED")
+    yield
+    with schedule_conflict_as_validation_error(), connection.cursor() as cursor:
+        cursor.execute(f"SET CONSTRAINTS {SCHEDULE_CONFLICT_CONSTRAINT} IMMEDIATE")
+
+
+def _validate_timezone(name: str) -> str:
+    try:
+        ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValidationError({"timezone": f"Unknown timezone {name}."})
+    return name
+
+
+def _check_schedule(schedule: FlightSchedule) -> None:
+    # partial update'te alanlar kilitli satırla birleştikten sonra kontrol edilir;
+    # model clean()'in Django ValidationError'ı DRF'te 500 olurdu.
+    if schedule.valid_until < schedule.valid_from:
+        raise ValidationError({"valid_until": "Must be on or after valid_from."})
+
+    if schedule.duration.total_seconds() <= 0:
+        raise ValidationError({"duration": "Duration must be positive."})
+
+    if schedule.destination.strip().upper() == schedule.departure.strip().upper():
+        raise ValidationError({"destination": "Destination must differ from departure."})
+
+
+def _differs(flight: Flight, o: Occurrence, schedule: FlightSchedule, airplane: Airplane) -> bool:
+    return (
+        flight.departure_time != o.departure_time
+        or flight.arrival_time != o.arrival_time
+        or flight.airplane_id != airplane.id
+        or flight.departure != schedule.departure
+        or flight.destination != schedule.destination
+    )
+
+
+def _sync_instances(schedule: FlightSchedule, airplane: Airplane) -> ScheduleSyncResult:
+    """
+    Programı artımlı olarak uygular: sadece bugünden sonraki ve henüz kalkmamış uçuşlara dokunur.
+    - desende olmayan günler: rezervasyonu yoksa soft-delete, varsa korunur (kept)
+    - iki tarafta da olan günler: değişen alanlar güncellenir; rezervasyonu varsa yolcu habersiz
+      taşınmaz, olduğu gibi kalır (pinned)
+    - yeni günler: bulk_create (daha önce silinmiş aynı gün varsa geri açılır)
+    """
+    now = timezone.now()
+    result = ScheduleSyncResult()
+
+    existing = {
+        f.schedule_date: f
+        for f in (Flight.objects
+                  .select_for_update(of=("self",))
+                  .filter(schedule=schedule, schedule_date__gte=now.date())
+                  .annotate(has_reservations=Exists(
+                      Reservation.objects.filter(flight_id=OuterRef("pk"), status=True, deleted=False))))
+    }
+
+    frozen = {d for d, f in existing.items() if f.departure_time <= now}
+    desired = {
+        d: o for d, o in expand_schedule(schedule, start=now.date()).items()
+        if o.departure_time > now and d not in frozen
+    }
+
+    to_remove = [f for d, f in existing.items() if d not in desired and d not in frozen and not f.deleted]
+    kept = [f for f in to_remove if f.has_reservations]
+    to_remove = [f for f in to_remove if not f.has_reservations]
+    result.kept = sorted(f.schedule_date for f in kept)
+
+    pinned = [f for d, f in existing.items()
+              if d in desired and not f.deleted and f.has_reservations
+              and _differs(f, desired[d], schedule, airplane)]
+    for f in pinned:
+        # eski slotunda kalır; çakışma kontrolünde sabit uçuş olarak sayılır.
+        del desired[f.schedule_date]
+    result.pinned = sorted(f.schedule_date for f in pinned)
+
+    movable_ids = {f.id for d, f in existing.items() if d in desired or f in to_remove}
+    _check_conflicts(airplane.id, desired, exclude_ids=movable_ids)
+
+    new_days = [d for d in desired if d not in existing]
+    _check_numbers(schedule, new_days)
+
+    to_update = []
+    for d, o in desired.items():
+        flight = existing.get(d)
+        if flight is None:
+            continue
+        if not flight.deleted and not _differs(flight, o, schedule, airplane):
+            continue
+        flight.deleted = False
+        flight.departure_time = o.departure_time
+        flight.arrival_time = o.arrival_time
+        flight.airplane = airplane
+        flight.departure = schedule.departure
+        flight.destination = schedule.destination
+        flight.refresh_schedule_window()
+        flight.updated_at = now
+        to_update.append(flight)
+
+    to_create = [_new_flight(schedule, airplane, desired[d]) for d in new_days]
+
+    with deferred_schedule_constraint():
+        if to_remove:
+            Flight.objects.filter(id__in=[f.id for f in to_remove]).update(deleted=True, updated_at=now)
+
+        if to_update:
+            Flight.objects.bulk_update(
+                to_update,
+                ["deleted", "departure_time", "arrival_time", "schedule_window", "airplane", "departure", "destination",
+                 "updated_at"],
+                batch_size=1000,
+            )
+
+        if to_create:
+            Flight.objects.bulk_create(to_create, batch_size=1000)
+            FlightInventory.objects.bulk_create(
+                [FlightInventory(flight_id=f.id, capacity=airplane.capacity) for f in to_create],
+                batch_size=1000,
+            )
+
+    if to_update:
+        sync_inventory_capacity(capacity=airplane.capacity, flight_ids=[f.id for f in to_update])
+
+    result.created = len(to_create)
+    result.updated = len(to_update)
+    result.removed = len(to_remove)
+
+    record_route_changes([f.id for f in [*to_remove, *to_update, *to_create]])
+    if to_remove or to_update or to_create:
+        bump_cache_version(FLIGHT)
+
+    return result
+
+
+@transaction.atomic
+def create_schedule(inp: FlightScheduleInput) -> tuple[FlightSchedule, ScheduleSyncResult]:
+    airplane = _get_airplane(inp.airplane_id)
+
+    schedule = FlightSchedule(
+        flight_number=inp.flight_number.strip().upper(),
+        departure=inp.departure,
+        destination=inp.destination,
+        departure_local_time=inp.departure_local_time,
+        duration=inp.duration,
+        timezone=_validate_timezone(inp.timezone or timezone.get_default_timezone_name()),
+        weekdays=sorted(set(inp.weekdays)),
+        valid_from=inp.valid_from,
+        valid_until=inp.valid_until,
+        airplane=airplane,
+    )
+
+    # flight_number unique (silinmiş programlar dahil); full_clean'in Django ValidationError'ı 500 olurdu.
+    if FlightSchedule.objects.filter(flight_number=schedule.flight_number).exists():
+        raise ValidationError({"flight_number": _duplicate_number_message(schedule.flight_number)})
+
+    schedule.full_clean(validate_unique=False)
+    try:
+        with transaction.atomic():
+            schedule.save()
+    except IntegrityError as exc:
+        # exists() ile save arasında aynı numarayla eşzamanlı bir create.
+        if getattr(exc.__cause__, "sqlstate", None) == UNIQUE_VIOLATION:
+            raise ValidationError({"flight_number": _duplicate_number_message(schedule.flight_number)})
+        raise
+
+    return schedule, _sync_instances(schedule, airplane)
+
+
+def _duplicate_number_message(flight_number: str) -> str:
+    return "Schedule with number " + flight_number + " already exists."
+
+
+@dataclass(frozen=True)
+class FlightScheduleUpdateInput:
+    departure: Optional[str] = None
+    destination: Optional[str] = None
+    departure_local_time: Optional[time] = None
+    duration: Optional[timedelta] = None
+    weekdays: Optional[tuple[int, ...]] = None
+    valid_from: Optional[date] = None
+    valid_until: Optional[date] = None
+    airplane_id: Optional[int] = None
+    timezone: Optional[str] = None
+
+
+@transaction.atomic
+def update_schedule(schedule: FlightSchedule, inp: FlightScheduleUpdateInput) -> tuple[FlightSchedule, ScheduleSyncResult]:
+    changes = {k: v for k, v in asdict(inp).items() if v is not None}
+
+    schedule = FlightSchedule.objects.select_for_update().get(pk=schedule.pk, deleted=False)
+
+    if "timezone" in changes:
+        _validate_timezone(changes["timezone"])
+    if "weekdays" in changes:
+        changes["weekdays"] = sorted(set(changes["weekdays"]))
+
+    for k, v in changes.items():
+        setattr(schedule, k, v)
+
+    airplane = _get_airplane(schedule.airplane_id)
+
+    _check_schedule(schedule)
+    schedule.full_clean()
+    schedule.save()
+
+    return schedule, _sync_instances(schedule, airplane)
+
+
+@transaction.atomic
+def soft_delete_schedule(schedule: FlightSchedule) -> ScheduleSyncResult:
+    """
+    Program silinir; gelecekteki uçuşlardan rezervasyonu olmayanlar da silinir, olanlar korunur.
+    """
+    now = timezone.now()
+    result = ScheduleSyncResult()
+
+    future = (Flight.objects
+              .select_for_update(of=("self",))
+              .filter(schedule=schedule, deleted=False, departure_time__gt=now)
+              .annotate(has_reservations=Exists(
+                  Reservation.objects.filter(flight_id=OuterRef("pk"), status=True, deleted=False))))
+
+    removable = []
+    for flight in future:
+        if flight.has_reservations:
+            result.kept.append(flight.schedule_date)
+        else:
+            removable.append(flight.id)
+
+    Flight.objects.filter(id__in=removable).update(deleted=True, updated_at=now)
+    result.removed = len(removable)
+    record_route_changes(removable)
+    if removable:
+        bump_cache_version(FLIGHT)
+
+    schedule.deleted = True
+    schedule.save(update_fields=["deleted"])
+    return result
@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.common.drf.response_cache import bump_cache_version, RESERVATION
+from apps.core.models import Flight, Reservation, WaitlistEntry
+from apps.core.services.flight_services import check_if_flight_is_started
+from apps.core.services.hold_services import live_held_seats
+from apps.core.services.inventory_services import reserve_seats
+from apps.notifications.dispatcher import publish_event
+
+PROMOTION_BATCH_SIZE = 50
+
+
+@dataclass(frozen=True)
+class JoinWaitlistInput:
+    passenger_name: str
+    passenger_email: str
+    flight_id: int
+
+
+def schedule_waitlist_promotion(flight_id: int) -> None:
+    # koltuk bırakan transaction commit olduktan sonra çalışsın.
+    from apps.core.tasks import promote_waitlist_task
+
+    # bekleyen yoksa celery'ye hiç mesaj atma (partial index ile tek probe).
+    if not WaitlistEntry.objects.filter(flight_id=flight_id, promoted=False, deleted=False).exists():
+        return
+
+    transaction.on_commit(lambda: promote_waitlist_task.delay(flight_id))
+
+
+@transaction.atomic
+def join_waitlist(inp: JoinWaitlistInput) -> WaitlistEntry:
+    flight = Flight.objects.get(pk=inp.flight_id, deleted=False)
+
+    if check_if_flight_is_started(flight.id):
+        raise ValidationError({"flight": f"Flight {flight.id} already passed."})
+
+    already = WaitlistEntry.objects.filter(
+        flight_id=flight.id, passenger_email=inp.passenger_email, promoted=False, deleted=False,
+    ).exists()
+    if already:
+        raise ValidationError({"passenger_email": "Passenger is already on the waitlist for this flight."})
+
+    entry = WaitlistEntry(
+        flight=flight,
+        passenger_name=inp.passenger_name,
+        passenger_email=inp.passenger_email,
+    )
+    entry.full_clean()
+    entry.save()
+
+    # liste katılırken yer açılmış olabilir.
+    schedule_waitlist_promotion(flight.id)
+
+    return entry
+
+
+def leave_waitlist(entry: WaitlistEntry) -> None:
+    if entry.promoted:
+        raise ValidationError("Waitlist entry is already promoted to a reservation.")
+
+    if not entry.deleted:
+        entry.deleted = True
+        entry.save(update_fields=["deleted"])
+
+
+@transaction.atomic
+def promote_waitlist_batch(flight_id: int, batch_size: int = PROMOTION_BATCH_SIZE) -> int:
+    """
+    Sıradaki en fazla batch_size yolcuyu, boş koltuk oldukça rezervasyona çevirir.
+    SKIP LOCKED: aynı uçuş için eşzamanlı iki promoter aynı kayıtları almaz.
+    """
+    flight = Flight.objects.select_related("airplane").filter(pk=flight_id, deleted=False).first()
+    if flight is None or check_if_flight_is_started(flight.id):
+        return 0
+
+    entries = list(WaitlistEntry.objects
+                   .select_for_update(skip_locked=True)
+                   .filter(flight_id=flight_id, promoted=False, deleted=False)
+                   .order_by("id")[:batch_size])
+    if not entries:
+        return 0
+
+    held = live_held_seats(flight_id)
+    promoted = []
+    for entry in entries:
+        if not reserve_seats(flight, 1, held=held):
+            break
+        promoted.append(entry)
+
+    if not promoted:
+        return 0
+
+    reservations = [
+        Reservation(flight=flight, passenger_name=e.passenger_name, passenger_email=e.passenger_email, status=True)
+        for e in promoted
+    ]
+    Reservation.objects.bulk_create(reservations)
+
+    now = timezone.now()
+    for entry, res in zip(promoted, reservations):
+        entry.promoted = True
+        entry.promoted_at = now
+        entry.reservation = res
+    WaitlistEntry.objects.bulk_update(promoted, ["promoted", "promoted_at", "reservation"])
+
+    payload = {
+        "flight_id": flight.id,
+        "departure": flight.departure,
+        "departure_time": flight.departure_time.isoformat(),
+        "passengers": [
+            {"passenger_email": r.passenger_email, "passenger_name": r.passenger_name,
+             "reservation_code": r.reservation_code}
+            for r in reservations
+        ],
+    }
+    publish_event("waitlist.promoted", payload)
+    bump_cache_version(RESERVATION)
+
+    return len(promoted)
+
+
+def promote_waitlist(flight_id: int, batch_size: int = PROMOTION_BATCH_SIZE) -> int:
+    total = 0
+    while True:
+        count = promote_waitlist_batch(flight_id, batch_size)
+        total += count
+        if count < batch_size:
+            return total
@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from apps.core.services.waitlist_services import promote_waitlist
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
+def promote_waitlist_task(self, flight_id: int):
+    return promote_waitlist(flight_id)
@@ -0,0 +1,25 @@
+from django.test import TestCase
+
+from apps.core.query_plans import analyze, explain_cases, seed_plan_data
+
+# planner'ın index'i seçmesi için tablo yeterince büyük olmalı.
+SEED_FLIGHTS = 5000
+
+
+class QueryPlanTests(TestCase):
+    """
+    Selector sorguları sıcak tablolarda (flight, reservation, waitlist) Seq Scan'e düşerse başarısız olur.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_plan_data(SEED_FLIGHTS)
+        analyze()
+
+    def test_selector_queries_use_indexes(self):
+        results = explain_cases()
+        self.assertIsNotNone(results)
+
+        for name, plan, scans in results:
+            with self.subTest(query=name):
+                self.assertEqual(scans, [], f"{name} falls back to Seq Scan on {', '.join(sorted(set(scans)))}")
@@ -1,11 +1,18 @@
 from django.db import transaction
-from apps.notifications.tasks import send_reservation_email_task
+from apps.notifications.tasks import send_reservation_email_task, send_group_reservation_email_task, \
+    send_waitlist_promotion_email_task
 
 ROUTES = {
     "reservation.booked": [
         lambda payload: send_reservation_email_task.delay(**payload),
         ## ileride sms vs. de atarız.
     ],
+    "reservation.group_booked": [
+        lambda payload: send_group_reservation_email_task.delay(**payload),
+    ],
+    "waitlist.promoted": [
+        lambda payload: send_waitlist_promotion_email_task.delay(**payload),
+    ],
 }
 
 def publish_event(event_type: str, payload: dict) -> None:
@@ -1,5 +1,5 @@
 from celery import shared_task
-from django.core.mail import send_mail
+from django.core.mail import send_mail, send_mass_mail
 from django.utils import timezone
 
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
@@ -16,3 +16,39 @@ def send_reservation_email_task(self, *, passenger_email: str, passenger_name: s
     return "sent"
 
 
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
+def send_group_reservation_email_task(self, *, flight_id: int, departure: str, departure_time: str,
+                                      passengers: list[dict]):
+    subject = f"Reservation Confirmed (#{flight_id})"
+    messages = []
+    for p in passengers:
+        body = (
+            f"Hello {p['passenger_name']},\n\n"
+            f"Your reservation for flight #{flight_id} is confirmed.\n"
+            f"Departure: {departure} at {departure_time}\n\n"
+            f"Have a nice trip!"
+        )
+        messages.append((subject, body, None, [p["passenger_email"]]))
+
+    # tek SMTP bağlantısı üzerinden hepsini gönder.
+    send_mass_mail(messages, fail_silently=False)
+    return f"sent {len(messages)}"
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
+def send_waitlist_promotion_email_task(self, *, flight_id: int, departure: str, departure_time: str,
+                                       passengers: list[dict]):
+    subject = f"A seat opened up on flight #{flight_id}"
+    messages = []
+    for p in passengers:
+        body = (
+            f"Hello {p['passenger_name']},\n\n"
+            f"A seat became available and your waitlist request for flight #{flight_id} is now confirmed.\n"
+            f"Reservation code: {p['reservation_code']}\n"
+            f"Departure: {departure} at {departure_time}\n\n"
+            f"Have a nice trip!"
+        )
+        messages.append((subject, body, None, [p["passenger_email"]]))
+
+    send_mass_mail(messages, fail_silently=False)
+    return f"sent {len(messages)}"